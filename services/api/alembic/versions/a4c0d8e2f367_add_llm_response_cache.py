@@ -0,0 +1,33 @@
+"""add_llm_response_cache
+
+Revision ID: a4c0d8e2f367
+Revises: f3b9c7d1e256
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "a4c0d8e2f367"
+down_revision: Union[str, Sequence[str], None] = "f3b9c7d1e256"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_response_cache",
+        sa.Column("key", sa.Text(), primary_key=True),
+        sa.Column("model", sa.Text(), nullable=False),
+        sa.Column("response", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("used_at", sa.DateTime(), nullable=False),
+    )
+    # Eviction walks entries from most to least recently used.
+    op.create_index("idx_llm_response_cache_used_at", "llm_response_cache", ["used_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_llm_response_cache_used_at", table_name="llm_response_cache")
+    op.drop_table("llm_response_cache")
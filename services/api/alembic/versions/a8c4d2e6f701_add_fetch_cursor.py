@@ -0,0 +1,31 @@
+"""add_fetch_cursor
+
+Revision ID: a8c4d2e6f701
+Revises: f7a3b8d1e456
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "a8c4d2e6f701"
+down_revision: Union[str, Sequence[str], None] = "f7a3b8d1e456"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fetch_cursor",
+        sa.Column("source", sa.Text(), nullable=False),
+        sa.Column("key", sa.Text(), nullable=False),
+        sa.Column("external_id", sa.Text(), nullable=False),
+        sa.Column("external_created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("source", "key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fetch_cursor")
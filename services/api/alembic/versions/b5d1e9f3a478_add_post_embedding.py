@@ -0,0 +1,36 @@
+"""add_post_embedding
+
+Revision ID: b5d1e9f3a478
+Revises: a4c0d8e2f367
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "b5d1e9f3a478"
+down_revision: Union[str, Sequence[str], None] = "a4c0d8e2f367"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "post_embedding",
+        sa.Column(
+            "post_id",
+            sa.BigInteger(),
+            sa.ForeignKey("post.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("model", sa.Text(), primary_key=True),
+        sa.Column("text_hash", sa.Text(), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column("dims", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("post_embedding")
@@ -0,0 +1,30 @@
+"""add_feed_validator
+
+Revision ID: b9d5e3f7a812
+Revises: a8c4d2e6f701
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "b9d5e3f7a812"
+down_revision: Union[str, Sequence[str], None] = "a8c4d2e6f701"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "feed_validator",
+        sa.Column("url", sa.Text(), primary_key=True),
+        sa.Column("etag", sa.Text(), nullable=True),
+        sa.Column("last_modified", sa.Text(), nullable=True),
+        sa.Column("content_hash", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("feed_validator")
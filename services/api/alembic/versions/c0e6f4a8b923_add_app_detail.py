@@ -0,0 +1,29 @@
+"""add_app_detail
+
+Revision ID: c0e6f4a8b923
+Revises: b9d5e3f7a812
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "c0e6f4a8b923"
+down_revision: Union[str, Sequence[str], None] = "b9d5e3f7a812"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "app_detail",
+        sa.Column("source", sa.Text(), primary_key=True),
+        sa.Column("app_id", sa.Text(), primary_key=True),
+        sa.Column("released_at", sa.DateTime(), nullable=True),
+        sa.Column("fetched_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("app_detail")
@@ -0,0 +1,29 @@
+"""add_trends_cache
+
+Revision ID: d1f7a5b9c034
+Revises: c0e6f4a8b923
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "d1f7a5b9c034"
+down_revision: Union[str, Sequence[str], None] = "c0e6f4a8b923"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "trends_cache",
+        sa.Column("keywords", sa.Text(), primary_key=True),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("trends_cache")
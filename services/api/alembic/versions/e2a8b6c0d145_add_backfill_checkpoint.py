@@ -0,0 +1,31 @@
+"""add_backfill_checkpoint
+
+Revision ID: e2a8b6c0d145
+Revises: d1f7a5b9c034
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "e2a8b6c0d145"
+down_revision: Union[str, Sequence[str], None] = "d1f7a5b9c034"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "backfill_checkpoint",
+        sa.Column("job", sa.Text(), primary_key=True),
+        sa.Column("partition", sa.Text(), primary_key=True),
+        sa.Column("cursor", sa.Text(), nullable=True),
+        sa.Column("fetched", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("done", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("backfill_checkpoint")
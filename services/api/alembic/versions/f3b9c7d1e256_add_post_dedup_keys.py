@@ -0,0 +1,59 @@
+"""add_post_dedup_keys
+
+Revision ID: f3b9c7d1e256
+Revises: e2a8b6c0d145
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "f3b9c7d1e256"
+down_revision: Union[str, Sequence[str], None] = "e2a8b6c0d145"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("post", sa.Column("canonical_url", sa.Text(), nullable=True))
+    op.add_column("post", sa.Column("content_fingerprint", sa.Text(), nullable=True))
+    op.add_column(
+        "post",
+        sa.Column(
+            "duplicate_of_id",
+            sa.BigInteger(),
+            sa.ForeignKey("post.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+    )
+    op.drop_constraint("chk_post_tagging_status", "post", type_="check")
+    op.create_check_constraint(
+        "chk_post_tagging_status",
+        "post",
+        "tagging_status IN ('pending', 'tagged', 'failed', 'duplicate')",
+    )
+    # Only canonical posts are match targets, so duplicates stay out of the indexes.
+    op.execute("""
+        CREATE INDEX idx_post_canonical_url ON post (canonical_url)
+            WHERE duplicate_of_id IS NULL AND deleted_at IS NULL
+    """)
+    op.execute("""
+        CREATE INDEX idx_post_content_fingerprint ON post (content_fingerprint)
+            WHERE duplicate_of_id IS NULL AND deleted_at IS NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_post_content_fingerprint", table_name="post")
+    op.drop_index("idx_post_canonical_url", table_name="post")
+    op.execute("UPDATE post SET tagging_status = 'pending' WHERE tagging_status = 'duplicate'")
+    op.drop_constraint("chk_post_tagging_status", "post", type_="check")
+    op.create_check_constraint(
+        "chk_post_tagging_status",
+        "post",
+        "tagging_status IN ('pending', 'tagged', 'failed')",
+    )
+    op.drop_column("post", "duplicate_of_id")
+    op.drop_column("post", "content_fingerprint")
+    op.drop_column("post", "canonical_url")
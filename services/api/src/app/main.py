@@ -22,6 +22,10 @@ from inbound.http.product.router import router as product_router
 from inbound.http.rating.router import router as rating_router
 from inbound.http.tag.router import router as tag_router
 from outbound.appstore.client import AppStoreClient
+from outbound.archive.store import JsonlArchive
+from outbound.http.client import HttpClient
+from outbound.http.scheduler import parse_host_limits
+from outbound.llm.cache import create_llm_cache
 from outbound.llm.client import GeminiLlmClient
 from outbound.playstore.client import PlayStoreClient
 from outbound.postgres.brief_repository import PostgresBriefRepository
@@ -80,23 +84,83 @@ def _parse_csv(value: str) -> list[str]:
     return [s.strip() for s in value.split(",") if s.strip()]
 
 
-def _create_pipeline_service(settings: Settings, repos: dict) -> PipelineService:
-    reddit_client = RedditApiClient(user_agent=settings.REDDIT_USER_AGENT)
+def _create_http_client(settings: Settings) -> HttpClient:
+    return HttpClient(
+        timeout=settings.HTTP_TIMEOUT_SECS,
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        max_connections_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+        max_in_flight=settings.HTTP_MAX_IN_FLIGHT,
+        host_limits=parse_host_limits(settings.HTTP_HOST_LIMITS),
+        http2=settings.HTTP_HTTP2,
+    )
+
+
+def _create_pipeline_service(
+    settings: Settings, repos: dict, http: HttpClient
+) -> PipelineService:
+    archive = (
+        JsonlArchive(settings.PIPELINE_ARCHIVE_DIR) if settings.PIPELINE_ARCHIVE_DIR else None
+    )
+    reddit_client = RedditApiClient(
+        user_agent=settings.REDDIT_USER_AGENT,
+        requests_per_minute=settings.REDDIT_REQUESTS_PER_MINUTE,
+        concurrency=settings.REDDIT_FETCH_CONCURRENCY,
+        max_pages=settings.PIPELINE_FETCH_MAX_PAGES,
+        http=http.for_source("reddit"),
+        archive=archive,
+    )
     llm_client = GeminiLlmClient(
         api_key=settings.GOOGLE_API_KEY,
         model=settings.LLM_MODEL,
         lite_model=settings.LLM_LITE_MODEL,
         brief_temperature=settings.LLM_BRIEF_TEMPERATURE,
+        cache=create_llm_cache(
+            settings.LLM_CACHE_BACKEND, settings.LLM_CACHE_DIR, repos["pipeline"]
+        ),
+        cache_ttl_hours=settings.LLM_CACHE_TTL_HOURS,
+        cache_max_bytes=settings.LLM_CACHE_MAX_MB * 1024 * 1024,
+        embedding_store=repos["pipeline"],
+    )
+    rss_client = RssFeedClient(
+        http=http.for_source("rss"),
+        concurrency=settings.PIPELINE_RSS_CONCURRENCY,
+        feed_timeout=settings.PIPELINE_RSS_FEED_TIMEOUT_SECS,
+        archive=archive,
+    )
+    trends_client = GoogleTrendsClient(
+        cache=repos["pipeline"],
+        cache_ttl_hours=settings.PIPELINE_TRENDS_CACHE_TTL_HOURS,
+    )
+    producthunt_client = ProductHuntApiClient(
+        api_token=settings.PRODUCTHUNT_API_TOKEN,
+        http=http.for_source("producthunt"),
+        max_pages=settings.PIPELINE_FETCH_MAX_PAGES,
     )
-    rss_client = RssFeedClient()
-    trends_client = GoogleTrendsClient()
-    producthunt_client = ProductHuntApiClient(api_token=settings.PRODUCTHUNT_API_TOKEN)
 
     subreddits = _parse_csv(settings.PIPELINE_SUBREDDITS)
     rss_feeds = _parse_csv(settings.PIPELINE_RSS_FEEDS)
     appstore_keywords = _parse_csv(settings.PIPELINE_APPSTORE_KEYWORDS)
-    appstore_client = AppStoreClient() if appstore_keywords else None
-    playstore_client = PlayStoreClient() if appstore_keywords else None
+    appstore_client = (
+        AppStoreClient(
+            http=http.for_source("app_store"),
+            requests_per_minute=settings.PIPELINE_APPSTORE_REQUESTS_PER_MINUTE,
+            concurrency=settings.PIPELINE_APPSTORE_CONCURRENCY,
+            archive=archive,
+        )
+        if appstore_keywords
+        else None
+    )
+    playstore_client = (
+        PlayStoreClient(
+            detail_cache=repos["pipeline"],
+            detail_ttl_days=settings.PIPELINE_PLAYSTORE_DETAIL_TTL_DAYS,
+            detail_concurrency=settings.PIPELINE_PLAYSTORE_DETAIL_CONCURRENCY,
+            scheduler=http.scheduler,
+        )
+        if appstore_keywords
+        else None
+    )
 
     return PipelineService(
         repo=repos["pipeline"],
@@ -114,6 +178,12 @@ def _create_pipeline_service(settings: Settings, repos: dict) -> PipelineService
         appstore_review_pages=settings.PIPELINE_APPSTORE_REVIEW_PAGES,
         playstore_review_count=settings.PIPELINE_PLAYSTORE_REVIEW_COUNT,
         appstore_max_age_days=settings.PIPELINE_APPSTORE_MAX_AGE_DAYS,
+        engagement_max_age_days=settings.PIPELINE_ENGAGEMENT_MAX_AGE_DAYS,
+        dedup_window_hours=settings.PIPELINE_DEDUP_WINDOW_HOURS,
+        tag_concurrency=settings.PIPELINE_TAG_CONCURRENCY,
+        tag_token_budget=settings.PIPELINE_TAG_TOKEN_BUDGET,
+        tag_vocabulary_size=settings.PIPELINE_TAG_VOCABULARY_SIZE,
+        archive=archive,
     )
 
 
@@ -124,11 +194,13 @@ def create_app() -> FastAPI:
     db = Database(settings.API_DATABASE_URL)
     repos = _create_repositories(db)
     services = _create_services(repos)
-    services["pipeline_service"] = _create_pipeline_service(settings, repos)
+    http = _create_http_client(settings)
+    services["pipeline_service"] = _create_pipeline_service(settings, repos, http)
 
     @asynccontextmanager
     async def lifespan(_app: FastAPI) -> AsyncIterator[dict]:
         yield services
+        await http.aclose()
         await db.dispose()
 
     app = FastAPI(
@@ -1,17 +1,28 @@
+import argparse
 import asyncio
 import hmac
 import logging
 import sys
+import time
+from datetime import UTC, datetime, timedelta
 
 from domain.pipeline.service import PipelineService
 from outbound.appstore.client import AppStoreClient
+from outbound.appstore.client import parse_archived as parse_archived_appstore
+from outbound.archive.store import ArchiveParser, JsonlArchive
+from outbound.http.client import HttpClient, TransportWrapper
+from outbound.http.fixtures import http_fixtures
+from outbound.http.scheduler import parse_host_limits
+from outbound.llm.cache import create_llm_cache
 from outbound.llm.client import GeminiLlmClient
 from outbound.playstore.client import PlayStoreClient
 from outbound.postgres.database import Database
 from outbound.postgres.pipeline_repository import PostgresPipelineRepository
 from outbound.producthunt.client import ProductHuntApiClient
 from outbound.reddit.client import RedditApiClient
+from outbound.reddit.client import parse_archived as parse_archived_reddit
 from outbound.rss.client import RssFeedClient
+from outbound.rss.client import parse_archived as parse_archived_rss
 from outbound.trends.client import GoogleTrendsClient
 from shared.config import get_settings
 
@@ -21,6 +32,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Archive source name -> the adapter parser that maps its payloads to posts.
+_ARCHIVE_PARSERS: dict[str, ArchiveParser] = {
+    "reddit": parse_archived_reddit,
+    "app_store": parse_archived_appstore,
+    "rss": parse_archived_rss,
+}
+
 
 def _validate_credentials(settings) -> None:
     missing = []
@@ -61,25 +79,133 @@ async def reset_data() -> int:
         await db.dispose()
 
 
-async def main() -> int:
+def _parse_date(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=UTC)
+
+
+_RANGE_COMMANDS = {
+    "backfill": "Fetch posts created in a date range into the posts table.",
+    "reprocess": "Re-parse archived raw payloads from a date range into the posts table.",
+}
+
+
+def _parse_range_args(command: str, args: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog=f"pipeline_cli {command}", description=_RANGE_COMMANDS[command]
+    )
+    start = parser.add_mutually_exclusive_group(required=True)
+    start.add_argument("--since", type=_parse_date, help="first day, YYYY-MM-DD")
+    if command == "backfill":
+        start.add_argument(
+            "--days", type=int, help="start this many days before --until, or before today"
+        )
+    else:
+        start.add_argument("--days", type=int, help="start this many days before today")
+    parser.add_argument("--until", type=_parse_date, help="day after the last, YYYY-MM-DD")
+    if command == "backfill":
+        parser.add_argument("--subreddits", help="comma-separated, default PIPELINE_SUBREDDITS")
+        parser.add_argument("--feeds", help="comma-separated, default PIPELINE_RSS_FEEDS")
+    else:
+        parser.add_argument(
+            "--sources", help=f"comma-separated, default {','.join(_ARCHIVE_PARSERS)}"
+        )
+    opts = parser.parse_args(args)
+    # Backfill resolves --days itself, so an open-ended range keeps one job
+    # key across re-runs on later days.
+    if opts.days is not None and command != "backfill":
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        opts.since = today - timedelta(days=opts.days)
+    return opts
+
+
+def _split(value: str | None) -> list[str] | None:
+    if value is None:
+        return None
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+async def main(command: str = "run", args: list[str] | None = None) -> int:
+    """Run the pipeline; ``command`` "fetch", "refresh", "backfill" or "reprocess"
+    runs just that job.
+
+    ``args`` are the command's own arguments (only "backfill" and "reprocess"
+    take any).
+    """
+    opts = _parse_range_args(command, args or []) if command in _RANGE_COMMANDS else None
     settings = get_settings()
     _validate_credentials(settings)
+    if command == "reprocess" and not settings.PIPELINE_ARCHIVE_DIR:
+        logger.error("PIPELINE_ARCHIVE_DIR must be set to reprocess")
+        return 1
+
+    with http_fixtures(
+        settings.HTTP_FIXTURES_MODE,
+        settings.HTTP_FIXTURES_DIR,
+        latency=settings.HTTP_FIXTURES_LATENCY_MS / 1000,
+        error_rate=settings.HTTP_FIXTURES_ERROR_RATE,
+    ) as wrap_transport:
+        return await _run(settings, wrap_transport, command, opts)
+
 
+async def _run(
+    settings,
+    wrap_transport: TransportWrapper | None,
+    command: str,
+    opts: argparse.Namespace | None = None,
+) -> int:
     db = Database(settings.API_DATABASE_URL)
+    http = HttpClient(
+        timeout=settings.HTTP_TIMEOUT_SECS,
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        max_connections_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+        max_in_flight=settings.HTTP_MAX_IN_FLIGHT,
+        host_limits=parse_host_limits(settings.HTTP_HOST_LIMITS),
+        http2=settings.HTTP_HTTP2,
+        wrap_transport=wrap_transport,
+    )
 
     try:
         repo = PostgresPipelineRepository(db)
-        reddit = RedditApiClient(user_agent=settings.REDDIT_USER_AGENT)
+        archive = (
+            JsonlArchive(settings.PIPELINE_ARCHIVE_DIR)
+            if settings.PIPELINE_ARCHIVE_DIR
+            else None
+        )
+        reddit = RedditApiClient(
+            user_agent=settings.REDDIT_USER_AGENT,
+            requests_per_minute=settings.REDDIT_REQUESTS_PER_MINUTE,
+            concurrency=settings.REDDIT_FETCH_CONCURRENCY,
+            max_pages=settings.PIPELINE_FETCH_MAX_PAGES,
+            http=http.for_source("reddit"),
+            archive=archive,
+        )
         llm = GeminiLlmClient(
             api_key=settings.GOOGLE_API_KEY,
             model=settings.LLM_MODEL,
             lite_model=settings.LLM_LITE_MODEL,
             brief_temperature=settings.LLM_BRIEF_TEMPERATURE,
+            cache=create_llm_cache(
+                settings.LLM_CACHE_BACKEND, settings.LLM_CACHE_DIR, repo
+            ),
+            cache_ttl_hours=settings.LLM_CACHE_TTL_HOURS,
+            cache_max_bytes=settings.LLM_CACHE_MAX_MB * 1024 * 1024,
+            embedding_store=repo,
+        )
+        rss = RssFeedClient(
+            http=http.for_source("rss"),
+            concurrency=settings.PIPELINE_RSS_CONCURRENCY,
+            feed_timeout=settings.PIPELINE_RSS_FEED_TIMEOUT_SECS,
+            archive=archive,
+        )
+        trends = GoogleTrendsClient(
+            cache=repo,
+            cache_ttl_hours=settings.PIPELINE_TRENDS_CACHE_TTL_HOURS,
         )
-        rss = RssFeedClient()
-        trends = GoogleTrendsClient()
         producthunt = ProductHuntApiClient(
             api_token=settings.PRODUCTHUNT_API_TOKEN,
+            http=http.for_source("producthunt"),
+            max_pages=settings.PIPELINE_FETCH_MAX_PAGES,
         )
 
         subreddits = [s.strip() for s in settings.PIPELINE_SUBREDDITS.split(",")]
@@ -90,8 +216,26 @@ async def main() -> int:
             if k.strip()
         ]
 
-        appstore = AppStoreClient() if appstore_keywords else None
-        playstore = PlayStoreClient() if appstore_keywords else None
+        appstore = (
+            AppStoreClient(
+                http=http.for_source("app_store"),
+                requests_per_minute=settings.PIPELINE_APPSTORE_REQUESTS_PER_MINUTE,
+                concurrency=settings.PIPELINE_APPSTORE_CONCURRENCY,
+                archive=archive,
+            )
+            if appstore_keywords
+            else None
+        )
+        playstore = (
+            PlayStoreClient(
+                detail_cache=repo,
+                detail_ttl_days=settings.PIPELINE_PLAYSTORE_DETAIL_TTL_DAYS,
+                detail_concurrency=settings.PIPELINE_PLAYSTORE_DETAIL_CONCURRENCY,
+                scheduler=http.scheduler,
+            )
+            if appstore_keywords
+            else None
+        )
 
         service = PipelineService(
             repo=repo,
@@ -109,20 +253,108 @@ async def main() -> int:
             appstore_review_pages=settings.PIPELINE_APPSTORE_REVIEW_PAGES,
             playstore_review_count=settings.PIPELINE_PLAYSTORE_REVIEW_COUNT,
             appstore_max_age_days=settings.PIPELINE_APPSTORE_MAX_AGE_DAYS,
+            engagement_max_age_days=settings.PIPELINE_ENGAGEMENT_MAX_AGE_DAYS,
+            dedup_window_hours=settings.PIPELINE_DEDUP_WINDOW_HOURS,
+            tag_concurrency=settings.PIPELINE_TAG_CONCURRENCY,
+            tag_token_budget=settings.PIPELINE_TAG_TOKEN_BUDGET,
+            tag_vocabulary_size=settings.PIPELINE_TAG_VOCABULARY_SIZE,
+            archive=archive,
         )
 
-        result = await service.run()
-
-        logger.info(
-            "Pipeline complete: fetched=%d upserted=%d products=%d tagged=%d clusters=%d briefs=%d errors=%d",
-            result.posts_fetched,
-            result.posts_upserted,
-            result.products_upserted,
-            result.posts_tagged,
-            result.clusters_created,
-            result.briefs_generated,
-            len(result.errors),
-        )
+        if command == "refresh":
+            refreshed = await service.refresh_engagement()
+            logger.info(
+                "Engagement refresh complete: checked=%d updated=%d",
+                refreshed.posts_checked,
+                refreshed.posts_updated,
+            )
+            return 0
+
+        if command == "reprocess" and archive is not None:
+            started = time.monotonic()
+            until = opts.until or datetime.now(UTC) + timedelta(days=1)
+            parsers = {
+                source: _ARCHIVE_PARSERS[source]
+                for source in _split(opts.sources) or _ARCHIVE_PARSERS
+            }
+            result = await service.reprocess(
+                archive.replay(parsers, opts.since.date(), until.date()),
+                batch_size=settings.PIPELINE_BACKFILL_BATCH_SIZE,
+            )
+            logger.info(
+                "Reprocess complete in %.2fs: parsed=%d upserted=%d "
+                "(new=%d updated=%d unchanged=%d duplicate=%d) errors=%d",
+                time.monotonic() - started,
+                result.posts_fetched,
+                result.posts_upserted,
+                result.posts_inserted,
+                result.posts_updated,
+                result.posts_unchanged,
+                result.posts_duplicate,
+                len(result.errors),
+            )
+        elif command == "backfill":
+            started = time.monotonic()
+            result = await service.backfill(
+                opts.since,
+                opts.until,
+                days=opts.days,
+                subreddits=_split(opts.subreddits),
+                feeds=_split(opts.feeds),
+                concurrency=settings.PIPELINE_BACKFILL_CONCURRENCY,
+                batch_size=settings.PIPELINE_BACKFILL_BATCH_SIZE,
+                max_pages=settings.PIPELINE_BACKFILL_MAX_PAGES,
+            )
+            logger.info(
+                "Backfill complete in %.2fs: fetched=%d upserted=%d "
+                "(new=%d updated=%d unchanged=%d duplicate=%d) errors=%d",
+                time.monotonic() - started,
+                result.posts_fetched,
+                result.posts_upserted,
+                result.posts_inserted,
+                result.posts_updated,
+                result.posts_unchanged,
+                result.posts_duplicate,
+                len(result.errors),
+            )
+        elif command == "fetch":
+            started = time.monotonic()
+            result = await service.run(fetch_only=True)
+            elapsed = time.monotonic() - started
+            logger.info(
+                "Fetch complete in %.2fs: fetched=%d (%.1f posts/s) upserted=%d "
+                "(new=%d updated=%d unchanged=%d duplicate=%d) products=%d errors=%d",
+                elapsed,
+                result.posts_fetched,
+                result.posts_fetched / elapsed if elapsed else 0.0,
+                result.posts_upserted,
+                result.posts_inserted,
+                result.posts_updated,
+                result.posts_unchanged,
+                result.posts_duplicate,
+                result.products_upserted,
+                len(result.errors),
+            )
+        else:
+            result = await service.run()
+            logger.info(
+                "Pipeline complete: fetched=%d upserted=%d "
+                "(new=%d updated=%d unchanged=%d duplicate=%d) products=%d tagged=%d "
+                "clusters=%d briefs=%d llm_cache=%d/%d errors=%d",
+                result.posts_fetched,
+                result.posts_upserted,
+                result.posts_inserted,
+                result.posts_updated,
+                result.posts_unchanged,
+                result.posts_duplicate,
+                result.products_upserted,
+                result.posts_tagged,
+                result.clusters_created,
+                result.briefs_generated,
+                result.llm_cache_hits,
+                result.llm_cache_hits + result.llm_cache_misses,
+                len(result.errors),
+            )
 
         if result.errors:
             for error in result.errors:
@@ -131,6 +363,7 @@ async def main() -> int:
 
         return 0
     finally:
+        await http.aclose()
         await db.dispose()
 
 
@@ -138,5 +371,7 @@ if __name__ == "__main__":  # pragma: no cover
     command = sys.argv[1] if len(sys.argv) > 1 else "run"
     if command == "reset":
         sys.exit(asyncio.run(reset_data()))
+    elif command in ("fetch", "refresh", "backfill", "reprocess"):
+        sys.exit(asyncio.run(main(command, sys.argv[2:])))
     else:
         sys.exit(asyncio.run(main()))
@@ -0,0 +1,77 @@
+"""Keys that identify the same story arriving through different sources.
+
+``canonical_url`` normalizes a linked article's URL; ``content_fingerprint``
+hashes the normalized wording. Posts sharing either key within the
+dedup window are linked to the earliest one and skip the LLM stages.
+Store reviews get no fingerprint: the same short wording about two
+different apps is two signals, not one story.
+"""
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+_TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "ref",
+    "ref_src",
+    "si",
+}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Shorter titles ("Need advice", "Great app") are too generic to identify
+# a story on their own, so the body is hashed with them.
+_MIN_TITLE_WORDS = 6
+_MAX_BODY_WORDS = 64
+# Fewer words than this ("Nice app!", "Great app / Love it") recur across
+# unrelated posts, so they are not fingerprinted at all.
+_MIN_FINGERPRINT_WORDS = 8
+_REVIEW_SOURCES = frozenset({"app_store", "play_store"})
+
+
+def canonical_url(url: str | None) -> str | None:
+    """``url`` without scheme, ``www.``, default port, fragment or tracking params."""
+    if not url:
+        return None
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+    if parts.scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return None
+
+    host = parts.hostname.removeprefix("www.")
+    if port is not None and port != _DEFAULT_PORTS[parts.scheme]:
+        host = f"{host}:{port}"
+    path = parts.path.rstrip("/")
+    query = urlencode(
+        sorted(
+            (k, v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+        )
+    )
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def content_fingerprint(
+    title: str, body: str | None, *, source: str | None = None
+) -> str | None:
+    """Hash of the lowercased words of the title, plus the body's if the title is short.
+
+    ``None`` for store reviews and for text too short to identify a story.
+    """
+    if source in _REVIEW_SOURCES:
+        return None
+    words = _WORD_RE.findall(title.lower())
+    if len(words) < _MIN_TITLE_WORDS:
+        body_words = _WORD_RE.findall((body or "").lower())[:_MAX_BODY_WORDS]
+        if len(words) + len(body_words) < _MIN_FINGERPRINT_WORDS:
+            return None
+        words = [*words, "\n", *body_words]
+    return hashlib.sha256(" ".join(words).encode()).hexdigest()
@@ -15,6 +15,81 @@ class RawPost:
     score: int
     num_comments: int
     subreddit: str | None = None
+    # The article a link post points at (Reddit link posts, RSS entries); used
+    # to spot the same story arriving through several sources.
+    link_url: str | None = None
+
+
+@dataclass(frozen=True)
+class FetchCursor:
+    """High-water mark: the newest item already ingested from one source partition."""
+
+    external_id: str
+    created_at: datetime
+
+    def covers(self, post: RawPost) -> bool:
+        """True if ``post`` is the mark itself or older, i.e. already ingested."""
+        return post.external_id == self.external_id or post.external_created_at < self.created_at
+
+
+@dataclass(frozen=True)
+class BackfillCheckpoint:
+    """Progress of one backfill partition (a subreddit or a feed).
+
+    ``cursor`` is the page token to resume from; ``done`` partitions are
+    skipped when the same backfill is run again.
+    """
+
+    partition: str
+    cursor: str | None = None
+    fetched: int = 0
+    done: bool = False
+
+
+@dataclass(frozen=True)
+class FeedValidators:
+    """HTTP cache validators remembered per feed for conditional GETs."""
+
+    url: str
+    etag: str | None
+    last_modified: str | None
+    content_hash: str
+
+
+@dataclass(frozen=True)
+class FeedFetch:
+    url: str
+    posts: list[RawPost]
+    validators: FeedValidators | None
+    not_modified: bool = False
+
+
+@dataclass(frozen=True)
+class UpsertCounts:
+    """Outcome of a post upsert; ``unchanged`` rows were matched but not rewritten."""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def written(self) -> int:
+        return self.inserted + self.updated
+
+
+@dataclass(frozen=True)
+class PostEngagement:
+    """Current score and comment count of an already-stored post."""
+
+    external_id: str
+    score: int
+    num_comments: int
+
+
+@dataclass(frozen=True)
+class EngagementRefreshResult:
+    posts_checked: int = 0
+    posts_updated: int = 0
 
 
 @dataclass(frozen=True)
@@ -60,14 +135,35 @@ class BriefDraft:
     source_post_ids: list[int]
 
 
+@dataclass(frozen=True)
+class PostEmbedding:
+    post_id: int
+    # Hash of the text that was embedded; a changed post no longer matches.
+    text_hash: str
+    vector: list[float]
+
+
+@dataclass(frozen=True)
+class LlmCacheStats:
+    # Cumulative over the client's lifetime; a run reports the difference.
+    hits: int = 0
+    misses: int = 0
+
+
 @dataclass
 class PipelineRunResult:
     posts_fetched: int = 0
     posts_upserted: int = 0
+    posts_inserted: int = 0
+    posts_updated: int = 0
+    posts_unchanged: int = 0
+    posts_duplicate: int = 0
     posts_tagged: int = 0
     clusters_created: int = 0
     products_upserted: int = 0
     briefs_generated: int = 0
+    llm_cache_hits: int = 0
+    llm_cache_misses: int = 0
     errors: list[str] = field(default_factory=list)
 
     @property
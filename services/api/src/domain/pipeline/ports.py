@@ -1,13 +1,23 @@
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
 from typing import Protocol
 
 from typing import Any
 
 from domain.pipeline.models import (
+    BackfillCheckpoint,
     BriefDraft,
     ClusteringResult,
+    FeedFetch,
+    FeedValidators,
+    FetchCursor,
+    LlmCacheStats,
+    PostEmbedding,
+    PostEngagement,
     RawPost,
     RawProduct,
     TaggingResult,
+    UpsertCounts,
 )
 from domain.post.models import Post
 
@@ -16,26 +26,83 @@ class SafetyFilteredError(Exception):
     """Raised when LLM refuses to generate content due to safety filters."""
 
 
+class LlmRateLimitedError(Exception):
+    """Raised when the LLM provider rejects a request for exceeding its rate limit."""
+
+
 class RedditClient(Protocol):
+    # ``since`` maps lower-cased subreddit name -> newest post already stored.
     async def fetch_posts(
         self,
         subreddits: list[str],
         limit: int,
         time_filter: str = "week",
+        *,
+        since: dict[str, FetchCursor] | None = None,
     ) -> list[RawPost]: ...
 
+    # Yields one chunk per subreddit, in completion order.
+    def stream_posts(
+        self,
+        subreddits: list[str],
+        limit: int,
+        time_filter: str = "week",
+        *,
+        since: dict[str, FetchCursor] | None = None,
+    ) -> AsyncIterator[list[RawPost]]: ...
+
+    # One /new.json page, newest first, and the token for the next (older) one.
+    async def fetch_page(
+        self, subreddit: str, *, after: str | None = None, limit: int = 100
+    ) -> tuple[list[RawPost], str | None]: ...
+
+    # Current engagement for stored posts; deleted or unknown ids are omitted.
+    async def fetch_engagement(self, external_ids: list[str]) -> list[PostEngagement]: ...
+
 
 class RssClient(Protocol):
     async def fetch_posts(self, feed_urls: list[str]) -> list[RawPost]: ...
 
+    async def fetch_feeds(
+        self,
+        feed_urls: list[str],
+        validators: dict[str, FeedValidators] | None = None,
+    ) -> list[FeedFetch]: ...
+
+    # Yields each feed as it completes; failed feeds are omitted.
+    def stream_feeds(
+        self,
+        feed_urls: list[str],
+        validators: dict[str, FeedValidators] | None = None,
+    ) -> AsyncIterator[FeedFetch]: ...
+
 
 class TrendsClient(Protocol):
     async def get_interest(self, keywords: list[str]) -> dict[str, Any]: ...
 
 
+class TrendsCache(Protocol):
+    # ``key`` is the normalized keyword set; entries older than ``max_age`` miss.
+    async def get_trends(self, key: str, max_age: timedelta) -> dict[str, Any] | None: ...
+
+    async def save_trends(self, key: str, payload: dict[str, Any]) -> None: ...
+
+
+class RawArchive(Protocol):
+    # Raw source payloads, kept so parsing can be re-run without refetching.
+    async def append(self, source: str, context: dict[str, Any], payload: Any) -> None: ...
+
+    async def flush(self) -> None: ...
+
+
 class ProductHuntClient(Protocol):
     async def fetch_recent_products(self, limit: int = 30) -> list[RawProduct]: ...
 
+    # Yields pages newest first, back to the product ``since`` covers.
+    def stream_products(
+        self, *, since: FetchCursor | None = None, page_size: int = 30
+    ) -> AsyncIterator[list[RawProduct]]: ...
+
 
 class AppStoreClient(Protocol):
     async def search_apps(
@@ -43,7 +110,12 @@ class AppStoreClient(Protocol):
     ) -> list[RawProduct]: ...
 
     async def fetch_reviews(
-        self, app_id: str, country: str = "us", pages: int = 3
+        self,
+        app_id: str,
+        country: str = "us",
+        pages: int = 3,
+        *,
+        since: FetchCursor | None = None,
     ) -> list[RawPost]: ...
 
 
@@ -53,11 +125,52 @@ class PlayStoreClient(Protocol):
     ) -> list[RawProduct]: ...
 
     async def fetch_reviews(
-        self, app_id: str, count: int = 100
+        self,
+        app_id: str,
+        count: int = 100,
+        *,
+        since: FetchCursor | None = None,
     ) -> list[RawPost]: ...
 
 
+class AppDetailCache(Protocol):
+    # Released date per app id; ``None`` means the store reports no date.
+    async def get_app_release_dates(
+        self, source: str, app_ids: list[str], max_age: timedelta
+    ) -> dict[str, datetime | None]: ...
+
+    async def save_app_release_dates(
+        self, source: str, released: dict[str, datetime | None]
+    ) -> None: ...
+
+
+class LlmResponseCache(Protocol):
+    # ``key`` hashes the model, prompt and generation config; entries
+    # written more than ``max_age`` ago miss.
+    async def get_llm_response(self, key: str, max_age: timedelta) -> str | None: ...
+
+    async def save_llm_response(self, key: str, model: str, response: str) -> None: ...
+
+    # Drops expired entries, then least recently used ones until the cache
+    # fits in ``max_bytes``. Returns how many were removed.
+    async def evict_llm_responses(self, max_age: timedelta, max_bytes: int) -> int: ...
+
+
+class EmbeddingStore(Protocol):
+    # Stored vectors by post id, for posts whose ``text_hashes`` entry
+    # matches what was embedded with ``model``.
+    async def get_post_embeddings(
+        self, model: str, text_hashes: dict[int, str]
+    ) -> dict[int, list[float]]: ...
+
+    async def save_post_embeddings(
+        self, model: str, embeddings: list[PostEmbedding]
+    ) -> None: ...
+
+
 class LlmClient(Protocol):
+    def cache_stats(self) -> LlmCacheStats: ...
+
     async def tag_posts(
         self, posts: list[Post], *, existing_tags: list[str] | None = None,
     ) -> list[TaggingResult]: ...
@@ -80,10 +193,39 @@ class PipelineRepository(Protocol):
 
     async def release_advisory_lock(self) -> None: ...
 
-    async def upsert_posts(self, posts: list[RawPost]) -> int: ...
+    # ``refresh_content`` also rewrites the parsed fields of existing posts.
+    async def upsert_posts(
+        self, posts: list[RawPost], *, refresh_content: bool = False
+    ) -> UpsertCounts: ...
 
     async def upsert_products(self, products: list[RawProduct]) -> int: ...
 
+    # Links pending reposts to the earliest post with the same URL or wording.
+    async def link_duplicates(self, window: timedelta) -> int: ...
+
+    async def get_recent_external_ids(self, source: str, max_age: timedelta) -> list[str]: ...
+
+    async def update_engagement(
+        self, source: str, engagement: list[PostEngagement]
+    ) -> int: ...
+
+    async def get_fetch_cursors(self, source: str) -> dict[str, FetchCursor]: ...
+
+    async def save_fetch_cursors(
+        self, source: str, cursors: dict[str, FetchCursor]
+    ) -> None: ...
+
+    async def get_feed_validators(self, urls: list[str]) -> dict[str, FeedValidators]: ...
+
+    # ``job`` identifies one backfill (its date range); keyed by partition.
+    async def get_backfill_checkpoints(self, job: str) -> dict[str, BackfillCheckpoint]: ...
+
+    async def save_backfill_checkpoint(
+        self, job: str, checkpoint: BackfillCheckpoint
+    ) -> None: ...
+
+    async def save_feed_validators(self, validators: list[FeedValidators]) -> None: ...
+
     async def get_pending_posts(self, limit: int = 1000) -> list[Post]: ...
 
     async def get_tagged_posts_without_cluster(self) -> list[Post]: ...
@@ -98,7 +240,8 @@ class PipelineRepository(Protocol):
         self,
     ) -> list[tuple[int, str, str, list[str], list[Post]]]: ...
 
-    async def get_existing_tag_slugs(self) -> list[str]: ...
+    # Every tag slug with the number of posts carrying it.
+    async def get_tag_post_counts(self) -> dict[str, int]: ...
 
     async def save_brief(self, cluster_id: int, draft: BriefDraft) -> None: ...
 
@@ -1,25 +1,73 @@
 import asyncio
+import heapq
 import logging
+import re
+from collections.abc import AsyncIterable, Awaitable, Callable
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import partial
 
-from domain.pipeline.models import PipelineRunResult, RawPost
+from domain.pipeline.models import (
+    BackfillCheckpoint,
+    EngagementRefreshResult,
+    FetchCursor,
+    PipelineRunResult,
+    RawPost,
+    RawProduct,
+    TaggingResult,
+    UpsertCounts,
+)
 from domain.pipeline.ports import (
     AppStoreClient,
     LlmClient,
+    LlmRateLimitedError,
     PipelineRepository,
     PlayStoreClient,
     ProductHuntClient,
+    RawArchive,
     RedditClient,
     RssClient,
     SafetyFilteredError,
     TrendsClient,
 )
+from domain.post.models import Post
+from shared.concurrency import AdaptiveLimit
 
 logger = logging.getLogger(__name__)
 
-TAGGING_BATCH_SIZE = 20
+# Tagging batches are cut at whichever of these is reached first.
+TAGGING_BATCH_SIZE = 40
+TAGGING_TOKEN_BUDGET = 4000
+TAG_CONCURRENCY = 4
+# Existing tags offered to the LLM per batch, so prompts don't grow with the tag table.
+TAG_VOCABULARY_SIZE = 150
+# Rate-limited batches are requeued this many times before being marked failed.
+TAG_RATE_LIMIT_RETRIES = 5
+TAG_BACKOFF_SECONDS = 2.0
+# Per-post prompt framing ([ID:..] header, score line, separators), in tokens.
+_TAG_POST_OVERHEAD_TOKENS = 30
+# The tagging prompt only includes the first 500 characters of a body.
+_TAG_BODY_CHARS = 500
 CLUSTERING_BATCH_SIZE = 200
 REVIEW_CONCURRENCY = 3
 BRIEF_CONCURRENCY = 3
+# Product Hunt has a single feed, so its mark lives under one fetch_cursor key.
+PRODUCTHUNT_CURSOR_KEY = "posts"
+# Chunks buffered between the fetchers and the single upsert writer.
+FETCH_QUEUE_SIZE = 8
+# Google Trends compares at most five keywords per request.
+TRENDS_PAYLOAD_SIZE = 5
+# Checkpoint holding the resolved bounds of an open-ended backfill request.
+_BACKFILL_RANGE_PARTITION = "range"
+
+
+@dataclass(frozen=True)
+class _PostChunk:
+    posts: list[RawPost]
+    label: str
+    on_stored: Callable[[], Awaitable[None]] | None = None
+    on_failed: Callable[[], None] | None = None
 
 
 class PipelineService:
@@ -40,6 +88,12 @@ class PipelineService:
         appstore_review_pages: int = 3,
         playstore_review_count: int = 100,
         appstore_max_age_days: int = 365,
+        engagement_max_age_days: int = 7,
+        dedup_window_hours: int = 72,
+        archive: RawArchive | None = None,
+        tag_concurrency: int = TAG_CONCURRENCY,
+        tag_token_budget: int = TAGGING_TOKEN_BUDGET,
+        tag_vocabulary_size: int = TAG_VOCABULARY_SIZE,
     ) -> None:
         self._repo = repo
         self._reddit = reddit
@@ -56,6 +110,12 @@ class PipelineService:
         self._appstore_review_pages = appstore_review_pages
         self._playstore_review_count = playstore_review_count
         self._max_age_days = appstore_max_age_days
+        self._engagement_max_age = timedelta(days=engagement_max_age_days)
+        self._dedup_window = timedelta(hours=dedup_window_hours)
+        self._archive = archive
+        self._tag_concurrency = tag_concurrency
+        self._tag_token_budget = tag_token_budget
+        self._tag_vocabulary_size = tag_vocabulary_size
 
     async def is_running(self) -> bool:
         return await self._repo.is_advisory_lock_held()
@@ -63,7 +123,9 @@ class PipelineService:
     async def get_pending_counts(self) -> dict[str, int]:
         return await self._repo.get_pending_counts()
 
-    async def run(self, *, skip_fetch: bool = False) -> PipelineRunResult:
+    async def run(
+        self, *, skip_fetch: bool = False, fetch_only: bool = False
+    ) -> PipelineRunResult:
         result = PipelineRunResult()
 
         locked = await self._repo.acquire_advisory_lock()
@@ -74,104 +136,524 @@ class PipelineService:
             result.errors.append("Could not acquire advisory lock")
             return result
 
+        cache_before = self._llm.cache_stats()
         try:
             if not skip_fetch:
                 await self._stage_fetch(result)
-            await self._stage_tag(result)
-            await self._stage_score_products(result)
-            await self._stage_cluster(result)
-            await self._stage_brief(result)
+            if not fetch_only:
+                await self._stage_tag(result)
+                await self._stage_score_products(result)
+                await self._stage_cluster(result)
+                await self._stage_brief(result)
         finally:
             await self._repo.release_advisory_lock()
+            cache_after = self._llm.cache_stats()
+            result.llm_cache_hits = cache_after.hits - cache_before.hits
+            result.llm_cache_misses = cache_after.misses - cache_before.misses
 
         return result
 
+    async def refresh_engagement(self) -> EngagementRefreshResult:
+        """Refresh score and comment counts of recent Reddit posts.
+
+        A post's numbers are otherwise only updated when it reappears in a
+        fetch, which stops at the high-water mark. This job looks up every
+        Reddit post younger than ``engagement_max_age_days`` and writes
+        back what changed. It only touches engagement columns, so it does
+        not take the pipeline lock.
+        """
+        ids = await self._repo.get_recent_external_ids("reddit", self._engagement_max_age)
+        if not ids:
+            logger.info("No recent Reddit posts to refresh")
+            return EngagementRefreshResult()
+
+        engagement = await self._reddit.fetch_engagement(ids)
+        updated = await self._repo.update_engagement("reddit", engagement)
+        logger.info(
+            "Refreshed engagement: checked=%d returned=%d updated=%d",
+            len(ids), len(engagement), updated,
+        )
+        return EngagementRefreshResult(posts_checked=len(ids), posts_updated=updated)
+
+    # ------------------------------------------------------------------
+    # Backfill — historical fetch over a date range
+    # ------------------------------------------------------------------
+
+    async def backfill(
+        self,
+        since: datetime | None,
+        until: datetime | None = None,
+        *,
+        days: int | None = None,
+        subreddits: list[str] | None = None,
+        feeds: list[str] | None = None,
+        concurrency: int = 4,
+        batch_size: int = 500,
+        max_pages: int = 10,
+    ) -> PipelineRunResult:
+        """Fetch posts created in ``[since, until)`` for each subreddit and feed.
+
+        ``days`` stands in for ``since``, counted back from ``until`` or
+        today. Every subreddit and feed is its own partition, and
+        ``concurrency`` of them run at once. Their pages feed the normal
+        upsert writer in batches of about ``batch_size`` posts. Each page's
+        checkpoint is saved once its posts are stored, so re-running the
+        same command resumes where an interrupted backfill stopped. Only
+        fetch and upsert run: no pipeline lock is taken, so live runs are
+        not blocked, and they tag the new posts on their next run.
+        """
+        since, until, request = await self._backfill_range(since, until, days)
+        job = f"{since:%Y-%m-%d}..{until:%Y-%m-%d}"
+        subreddits = self._subreddits if subreddits is None else subreddits
+        feeds = self._rss_feeds if feeds is None else feeds
+        result = PipelineRunResult()
+        checkpoints = await self._repo.get_backfill_checkpoints(job)
+
+        partitions = [
+            (
+                f"reddit:{name.lower()}",
+                partial(self._backfill_subreddit, name, since, until, max_pages),
+            )
+            for name in subreddits
+        ] + [
+            (f"rss:{url}", partial(self._backfill_feed, url, since, until))
+            for url in feeds
+        ]
+        pending = [
+            (partition, backfill_one)
+            for partition, backfill_one in partitions
+            if not checkpoints.get(partition, BackfillCheckpoint(partition)).done
+        ]
+        logger.info(
+            "Backfill %s: %d partitions, %d already done",
+            job, len(partitions), len(partitions) - len(pending),
+        )
+
+        queue: asyncio.Queue[_PostChunk | None] = asyncio.Queue(maxsize=FETCH_QUEUE_SIZE)
+        writer = asyncio.create_task(
+            self._write_chunks(queue, result, batch_size=batch_size)
+        )
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def _run_partition(partition, backfill_one) -> None:
+            checkpoint = checkpoints.get(partition, BackfillCheckpoint(partition))
+            async with sem:
+                try:
+                    await backfill_one(
+                        partial(self._repo.save_backfill_checkpoint, job),
+                        queue,
+                        result,
+                        checkpoint,
+                    )
+                except Exception:
+                    logger.exception("Backfill failed for %s", partition)
+                    result.errors.append(f"Backfill failed for {partition}")
+
+        try:
+            await asyncio.gather(*[_run_partition(p, b) for p, b in pending])
+        finally:
+            await queue.put(None)
+            await writer
+            await self._flush_archive()
+        if request is not None and pending:
+            saved = await self._repo.get_backfill_checkpoints(job)
+            if all(saved.get(p, BackfillCheckpoint(p)).done for p, _ in partitions):
+                await self._repo.save_backfill_checkpoint(
+                    request, _range_checkpoint(since, until, done=True)
+                )
+        await self._link_duplicates(result)
+        return result
+
+    async def _backfill_range(
+        self, since: datetime | None, until: datetime | None, days: int | None
+    ) -> tuple[datetime, datetime, str | None]:
+        """Resolve the backfill bounds, plus the request key of an open-ended one.
+
+        Explicit bounds are used as given. An open end (no ``until``) is
+        resolved against today, which moves, so the first resolution is
+        saved under a key naming the request ("2026-09-01..", "last-30d")
+        and reused by every re-run until the backfill finishes; otherwise
+        a backfill resumed on another day would get a new job key and
+        start over.
+        """
+        if since is None and days is None:
+            raise ValueError("Backfill needs a start: since or days")
+        if until is not None:
+            return since or until - timedelta(days=days or 0), until, None
+
+        request = f"{since:%Y-%m-%d}.." if since is not None else f"last-{days}d"
+        saved = (await self._repo.get_backfill_checkpoints(request)).get(
+            _BACKFILL_RANGE_PARTITION
+        )
+        if saved is not None and saved.cursor and not saved.done:
+            start, _, end = saved.cursor.partition("..")
+            return datetime.fromisoformat(start), datetime.fromisoformat(end), request
+
+        now = datetime.now(UTC)
+        if since is None:
+            today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            since = today - timedelta(days=days or 0)
+        await self._repo.save_backfill_checkpoint(request, _range_checkpoint(since, now))
+        return since, now, request
+
+    async def _backfill_subreddit(
+        self,
+        subreddit: str,
+        since: datetime,
+        until: datetime,
+        max_pages: int,
+        save: Callable[[BackfillCheckpoint], Awaitable[None]],
+        queue: asyncio.Queue[_PostChunk | None],
+        result: PipelineRunResult,
+        checkpoint: BackfillCheckpoint,
+    ) -> None:
+        # Pages run newest first; the walk is done at the first post older
+        # than ``since`` or when the listing runs out. Checkpoints are
+        # cumulative, so once a page fails to store, no later page's
+        # checkpoint may be saved: it would resume past the lost page.
+        write_failed = asyncio.Event()
+
+        async def _save(checkpoint: BackfillCheckpoint) -> None:
+            if not write_failed.is_set():
+                await save(checkpoint)
+
+        for _ in range(max_pages):
+            if write_failed.is_set():
+                logger.warning(
+                    "Backfill r/%s stopped after a failed write; re-run to resume", subreddit
+                )
+                return
+            page, after = await self._reddit.fetch_page(subreddit, after=checkpoint.cursor)
+            posts = [p for p in page if _in_window(p, since, until)]
+            result.posts_fetched += len(posts)
+            checkpoint = BackfillCheckpoint(
+                partition=checkpoint.partition,
+                cursor=after,
+                fetched=checkpoint.fetched + len(posts),
+                done=not after or any(_utc(p.external_created_at) < since for p in page),
+            )
+            await queue.put(_PostChunk(
+                posts=posts,
+                label=f"r/{subreddit}",
+                on_stored=partial(_save, checkpoint),
+                on_failed=write_failed.set,
+            ))
+            if checkpoint.done:
+                return
+        logger.info(
+            "Backfill r/%s paused after %d pages; re-run to continue", subreddit, max_pages
+        )
+
+    async def _backfill_feed(
+        self,
+        url: str,
+        since: datetime,
+        until: datetime,
+        save: Callable[[BackfillCheckpoint], Awaitable[None]],
+        queue: asyncio.Queue[_PostChunk | None],
+        result: PipelineRunResult,
+        checkpoint: BackfillCheckpoint,
+    ) -> None:
+        # Feeds only carry their latest entries, so one unconditional fetch
+        # is all the history there is.
+        fetched = await self._rss.fetch_feeds([url])
+        if not fetched:
+            raise RuntimeError(f"RSS feed {url} could not be fetched")
+        posts = [p for p in fetched[0].posts if _in_window(p, since, until)]
+        result.posts_fetched += len(posts)
+        done = BackfillCheckpoint(
+            partition=checkpoint.partition, fetched=len(posts), done=True
+        )
+        await queue.put(_PostChunk(posts=posts, label=url, on_stored=partial(save, done)))
+
+    # ------------------------------------------------------------------
+    # Reprocess — archived payloads back through the upsert path
+    # ------------------------------------------------------------------
+
+    async def reprocess(
+        self, chunks: AsyncIterable[list[RawPost]], *, batch_size: int = 500
+    ) -> PipelineRunResult:
+        """Upsert re-parsed posts, rewriting the parsed fields of stored ones.
+
+        ``chunks`` comes from replaying the raw archive through the current
+        parsers, so no source is contacted. Like backfills, this takes no
+        pipeline lock; new posts are tagged by the next run. A replayed
+        segment can hold a whole day of posts, so it is queued in slices of
+        at most ``batch_size`` to keep each upsert under the bind-parameter limit.
+        """
+        result = PipelineRunResult()
+        queue: asyncio.Queue[_PostChunk | None] = asyncio.Queue(maxsize=FETCH_QUEUE_SIZE)
+        writer = asyncio.create_task(
+            self._write_chunks(
+                queue,
+                result,
+                batch_size=batch_size,
+                upsert=partial(self._repo.upsert_posts, refresh_content=True),
+            )
+        )
+        try:
+            async for posts in chunks:
+                result.posts_fetched += len(posts)
+                for i in range(0, len(posts), batch_size):
+                    await queue.put(_PostChunk(posts=posts[i : i + batch_size], label="archive"))
+        finally:
+            await queue.put(None)
+            await writer
+        await self._link_duplicates(result)
+        return result
+
     # ------------------------------------------------------------------
     # Stage: Fetch — parallel data sources
     # ------------------------------------------------------------------
 
     async def _stage_fetch(self, result: PipelineRunResult) -> None:
+        """Fetch every source concurrently, upserting chunks as they arrive.
+
+        Fetchers put post chunks on a bounded queue drained by one writer,
+        so database writes overlap network waits and a fast source blocks,
+        instead of buffering, once the writer falls behind.
+        """
+        queue: asyncio.Queue[_PostChunk | None] = asyncio.Queue(maxsize=FETCH_QUEUE_SIZE)
+        writer = asyncio.create_task(self._write_chunks(queue, result))
+
+        tasks = [
+            self._fetch_reddit(queue, result),
+            self._fetch_rss(queue, result),
+            self._fetch_producthunt(result),
+        ]
+        if self._appstore and self._appstore_keywords:
+            tasks.append(self._fetch_appstore(queue, result))
+        if self._playstore and self._appstore_keywords:
+            tasks.append(self._fetch_playstore(queue, result))
+
         try:
-            tasks = [
-                self._fetch_reddit_rss(result),
-                self._fetch_producthunt(result),
-            ]
-            if self._appstore and self._appstore_keywords:
-                tasks.append(self._fetch_appstore(result))
-            if self._playstore and self._appstore_keywords:
-                tasks.append(self._fetch_playstore(result))
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await queue.put(None)
+            await writer
+            await self._flush_archive()
+
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error("Fetch stage failed", exc_info=outcome)
+                result.errors.append("Fetch stage failed")
+        await self._link_duplicates(result)
 
-            await asyncio.gather(*tasks)
+    async def _link_duplicates(self, result: PipelineRunResult) -> None:
+        # Runs before tagging picks up pending posts, so reposts of a story
+        # already stored (from any source) never reach the LLM.
+        try:
+            linked = await self._repo.link_duplicates(self._dedup_window)
         except Exception:
-            logger.exception("Fetch stage failed")
-            result.errors.append("Fetch stage failed")
+            logger.exception("Duplicate linking failed")
+            result.errors.append("Duplicate linking failed")
+            return
+        result.posts_duplicate += linked
+        if linked:
+            logger.info("Linked %d duplicate posts to their canonical posts", linked)
 
-    async def _fetch_reddit_rss(self, result: PipelineRunResult) -> None:
-        raw_posts: list[RawPost] = await self._reddit.fetch_posts(
-            subreddits=self._subreddits,
-            limit=self._fetch_limit,
-        )
-        logger.info("Fetched %d posts from Reddit", len(raw_posts))
+    async def _write_chunks(
+        self,
+        queue: asyncio.Queue[_PostChunk | None],
+        result: PipelineRunResult,
+        *,
+        batch_size: int = 0,
+        upsert: Callable[[list[RawPost]], Awaitable[UpsertCounts]] | None = None,
+    ) -> None:
+        """Drain ``queue``, upserting chunks once ``batch_size`` posts are buffered.
+
+        The default stores every chunk as it arrives; backfills pass a large
+        ``batch_size`` so many small pages become one upsert.
+        """
+        upsert = upsert or self._repo.upsert_posts
+        pending: list[_PostChunk] = []
+        buffered = 0
+        while (chunk := await queue.get()) is not None:
+            pending.append(chunk)
+            buffered += len(chunk.posts)
+            if buffered >= batch_size:
+                await self._store_chunks(pending, result, upsert)
+                pending, buffered = [], 0
+        if pending:
+            await self._store_chunks(pending, result, upsert)
 
-        if self._rss_feeds:
-            rss_posts = await self._rss.fetch_posts(self._rss_feeds)
-            logger.info("Fetched %d posts from RSS", len(rss_posts))
-            raw_posts = raw_posts + rss_posts
+    async def _store_chunks(
+        self,
+        chunks: list[_PostChunk],
+        result: PipelineRunResult,
+        upsert: Callable[[list[RawPost]], Awaitable[UpsertCounts]],
+    ) -> None:
+        # Marks/validators/checkpoints advance only once their posts are
+        # stored, and producers hear of a failed write through on_failed,
+        # so it is refetched next run instead of being skipped over.
+        if len(chunks) == 1:
+            posts, label = chunks[0].posts, chunks[0].label
+        else:
+            posts = [post for chunk in chunks for post in chunk.posts]
+            label = f"{len(chunks)} chunks"
+        try:
+            if posts:
+                counts = await upsert(posts)
+                result.posts_upserted += counts.written
+                result.posts_inserted += counts.inserted
+                result.posts_updated += counts.updated
+                result.posts_unchanged += counts.unchanged
+                logger.info(
+                    "Upserted posts from %s: %d new, %d updated, %d unchanged",
+                    label, counts.inserted, counts.updated, counts.unchanged,
+                )
+            for chunk in chunks:
+                if chunk.on_stored is not None:
+                    await chunk.on_stored()
+        except Exception:
+            logger.exception("Upsert failed for %s", label)
+            result.errors.append(f"Fetch upsert failed for {label}")
+            for chunk in chunks:
+                if chunk.on_failed is not None:
+                    chunk.on_failed()
 
-        result.posts_fetched += len(raw_posts)
+    async def _flush_archive(self) -> None:
+        # The archive is a convenience for reprocessing; losing a flush must
+        # not fail the fetch that produced it.
+        if self._archive is None:
+            return
+        try:
+            await self._archive.flush()
+        except Exception:
+            logger.exception("Raw archive flush failed")
+
+    async def _fetch_reddit(
+        self, queue: asyncio.Queue[_PostChunk | None], result: PipelineRunResult
+    ) -> None:
+        marks = await self._repo.get_fetch_cursors("reddit")
+        fetched = 0
+        async with aclosing(
+            self._reddit.stream_posts(
+                subreddits=self._subreddits,
+                limit=self._fetch_limit,
+                since=marks,
+            )
+        ) as chunks:
+            async for posts in chunks:
+                if not posts:
+                    continue
+                fetched += len(posts)
+                result.posts_fetched += len(posts)
+                await queue.put(_PostChunk(
+                    posts=posts,
+                    label="Reddit",
+                    on_stored=partial(
+                        self._repo.save_fetch_cursors,
+                        "reddit",
+                        _newest_by_subreddit(posts),
+                    ),
+                ))
+        logger.info("Fetched %d new posts from Reddit", fetched)
 
-        if raw_posts:
-            upserted = await self._repo.upsert_posts(raw_posts)
-            result.posts_upserted += upserted
-            logger.info("Upserted %d posts", upserted)
+    async def _fetch_rss(
+        self, queue: asyncio.Queue[_PostChunk | None], result: PipelineRunResult
+    ) -> None:
+        if not self._rss_feeds:
+            return
+        known = await self._repo.get_feed_validators(self._rss_feeds)
+        fetched = unchanged = total = 0
+        async with aclosing(
+            self._rss.stream_feeds(self._rss_feeds, validators=known)
+        ) as feeds:
+            async for feed in feeds:
+                total += 1
+                unchanged += feed.not_modified
+                fetched += len(feed.posts)
+                result.posts_fetched += len(feed.posts)
+                if not feed.posts and feed.validators is None:
+                    continue
+                await queue.put(_PostChunk(
+                    posts=feed.posts,
+                    label=feed.url,
+                    on_stored=(
+                        partial(self._repo.save_feed_validators, [feed.validators])
+                        if feed.validators
+                        else None
+                    ),
+                ))
+        logger.info(
+            "Fetched %d posts from RSS (%d of %d feeds unchanged)",
+            fetched, unchanged, total,
+        )
 
     async def _fetch_producthunt(self, result: PipelineRunResult) -> None:
         try:
-            products = await self._producthunt.fetch_recent_products()
-            if products:
-                count = await self._repo.upsert_products(products)
-                result.products_upserted += count
-                logger.info("Upserted %d products from Product Hunt", count)
+            marks = await self._repo.get_fetch_cursors("producthunt")
+            newest: FetchCursor | None = None
+            async with aclosing(
+                self._producthunt.stream_products(since=marks.get(PRODUCTHUNT_CURSOR_KEY))
+            ) as pages:
+                async for products in pages:
+                    count = await self._repo.upsert_products(products)
+                    result.products_upserted += count
+                    logger.info("Upserted %d products from Product Hunt", count)
+                    newest = _newest_product(products, newest)
+            # Pages arrive newest first, so the mark only moves once the walk
+            # back is complete; an interrupted run resumes from the old mark.
+            if newest is not None:
+                await self._repo.save_fetch_cursors(
+                    "producthunt", {PRODUCTHUNT_CURSOR_KEY: newest}
+                )
         except Exception:
             logger.exception("Product Hunt fetch failed")
             result.errors.append("Product Hunt fetch failed")
 
-    async def _fetch_appstore(self, result: PipelineRunResult) -> None:
-        async def _get_reviews(product):
+    async def _fetch_appstore(
+        self, queue: asyncio.Queue[_PostChunk | None], result: PipelineRunResult
+    ) -> None:
+        async def _get_reviews(product, since):
             return await self._appstore.fetch_reviews(
-                product.external_id, pages=self._appstore_review_pages
+                product.external_id, pages=self._appstore_review_pages, since=since
             )
 
         await self._fetch_store(
+            queue,
             result,
             client=self._appstore,
+            source="app_store",
             store_name="App Store",
             fetch_reviews=_get_reviews,
         )
 
-    async def _fetch_playstore(self, result: PipelineRunResult) -> None:
-        async def _get_reviews(product):
+    async def _fetch_playstore(
+        self, queue: asyncio.Queue[_PostChunk | None], result: PipelineRunResult
+    ) -> None:
+        async def _get_reviews(product, since):
             return await self._playstore.fetch_reviews(
-                product.external_id, count=self._playstore_review_count
+                product.external_id, count=self._playstore_review_count, since=since
             )
 
         await self._fetch_store(
+            queue,
             result,
             client=self._playstore,
+            source="play_store",
             store_name="Play Store",
             fetch_reviews=_get_reviews,
         )
 
     async def _fetch_store(
         self,
+        queue: asyncio.Queue[_PostChunk | None],
         result: PipelineRunResult,
         *,
         client,
+        source: str,
         store_name: str,
         fetch_reviews,
     ) -> None:
-        """Shared logic for App Store / Play Store: search apps → upsert → fetch reviews."""
+        """Shared logic for App Store / Play Store: search apps → upsert → fetch reviews.
+
+        Reviews are fetched incrementally from a per-app high-water mark
+        (``fetch_cursor`` keyed by app id), advanced once they are stored.
+        """
         try:
+            marks = await self._repo.get_fetch_cursors(source)
             products = await client.search_apps(
                 self._appstore_keywords, max_age_days=self._max_age_days
             )
@@ -185,15 +667,20 @@ class PipelineService:
             async def _review_task(product):
                 async with sem:
                     try:
-                        reviews = await fetch_reviews(product)
+                        reviews = await fetch_reviews(
+                            product, marks.get(product.external_id)
+                        )
                         if reviews:
-                            upserted = await self._repo.upsert_posts(reviews)
                             result.posts_fetched += len(reviews)
-                            result.posts_upserted += upserted
-                            logger.info(
-                                "Upserted %d %s reviews for %s",
-                                upserted, store_name, product.name,
-                            )
+                            await queue.put(_PostChunk(
+                                posts=reviews,
+                                label=f"{store_name} reviews for {product.name}",
+                                on_stored=partial(
+                                    self._repo.save_fetch_cursors,
+                                    source,
+                                    {product.external_id: _newest(reviews)},
+                                ),
+                            ))
                     except Exception:
                         logger.exception(
                             "%s review fetch failed for %s",
@@ -218,33 +705,106 @@ class PipelineService:
 
             logger.info("Tagging %d pending posts", len(pending))
 
-            existing_slugs = await self._repo.get_existing_tag_slugs()
-
-            for i in range(0, len(pending), TAGGING_BATCH_SIZE):
-                batch = pending[i : i + TAGGING_BATCH_SIZE]
-                batch_ids = [p.id for p in batch]
-                try:
-                    tagging_results = await self._llm.tag_posts(
-                        batch, existing_tags=existing_slugs,
-                    )
-                    await self._repo.save_tagging_results(tagging_results)
-                    result.posts_tagged += len(tagging_results)
-                    logger.info(
-                        "Tagged batch of %d posts", len(tagging_results)
-                    )
-                except Exception as exc:
-                    logger.exception(
-                        "Tagging batch failed (posts %s)", batch_ids
-                    )
-                    await self._repo.mark_tagging_failed(batch_ids)
-                    result.errors.append(
-                        f"Tag batch failed ({len(batch)} posts): {type(exc).__name__}: {exc}"
-                    )
-                await asyncio.sleep(0.3)
+            tag_counts = await self._repo.get_tag_post_counts()
+            batches = _tagging_batches(
+                pending, self._tag_token_budget, TAGGING_BATCH_SIZE
+            )
+            limit = AdaptiveLimit(self._tag_concurrency)
+            await asyncio.gather(*[
+                self._tag_batch(batch, tag_counts, limit, result)
+                for batch in batches
+            ])
         except Exception:
             logger.exception("Tag stage failed")
             result.errors.append("Tag stage failed")
 
+    async def _tag_batch(
+        self,
+        batch: list[Post],
+        tag_counts: dict[str, int],
+        limit: AdaptiveLimit,
+        result: PipelineRunResult,
+    ) -> None:
+        # Halves of a bisected batch keep the parent's vocabulary.
+        vocabulary = _select_tag_vocabulary(batch, tag_counts, self._tag_vocabulary_size)
+        failed_ids, error = await self._tag_bisecting(batch, vocabulary, limit, result)
+        if not failed_ids:
+            return
+        logger.error(
+            "Tagging failed for posts %s (batch of %d)", failed_ids, len(batch),
+            exc_info=error,
+        )
+        await self._repo.mark_tagging_failed(failed_ids)
+        result.errors.append(
+            f"Tag batch failed ({len(failed_ids)} posts): {type(error).__name__}: {error}"
+        )
+
+    async def _tag_bisecting(
+        self,
+        batch: list[Post],
+        vocabulary: list[str],
+        limit: AdaptiveLimit,
+        result: PipelineRunResult,
+    ) -> tuple[list[int], Exception | None]:
+        """Tag and save ``batch``; return the ids that could not be tagged.
+
+        A batch whose reply was unparseable or refused is split in half and
+        each half re-sent, so one bad post only takes down itself. Other
+        failures (rate limits, outages, auth, saving) are not about any
+        particular post, so those fail the whole batch.
+        """
+        try:
+            tagging_results = await self._request_tags(batch, vocabulary, limit)
+        except Exception as exc:
+            if len(batch) == 1 or not _is_content_error(exc):
+                return [p.id for p in batch], exc
+            logger.warning(
+                "Tagging batch of %d posts failed (%s: %s), bisecting",
+                len(batch), type(exc).__name__, exc,
+            )
+            mid = len(batch) // 2
+            halves = await asyncio.gather(
+                self._tag_bisecting(batch[:mid], vocabulary, limit, result),
+                self._tag_bisecting(batch[mid:], vocabulary, limit, result),
+            )
+            failed_ids = [post_id for ids, _ in halves for post_id in ids]
+            error = next((err for _, err in halves if err is not None), None)
+            return failed_ids, error
+
+        try:
+            await self._repo.save_tagging_results(tagging_results)
+        except Exception as exc:
+            return [p.id for p in batch], exc
+        result.posts_tagged += len(tagging_results)
+        logger.info("Tagged batch of %d posts", len(tagging_results))
+        return [], None
+
+    async def _request_tags(
+        self, batch: list[Post], vocabulary: list[str], limit: AdaptiveLimit
+    ) -> list[TaggingResult]:
+        attempt = 0
+        while True:
+            try:
+                async with limit:
+                    tagging_results = await self._llm.tag_posts(
+                        batch, existing_tags=vocabulary,
+                    )
+            except LlmRateLimitedError:
+                limit.decrease()
+                if attempt == TAG_RATE_LIMIT_RETRIES:
+                    raise
+                delay = TAG_BACKOFF_SECONDS * 2**attempt
+                attempt += 1
+                logger.warning(
+                    "Tagging rate-limited; concurrency now %d, retrying %d posts in %.0fs",
+                    limit.limit, len(batch), delay,
+                )
+                # Back off outside the slot so other batches see the lower limit.
+                await asyncio.sleep(delay)
+                continue
+            limit.increase()
+            return tagging_results
+
     # ------------------------------------------------------------------
     # Stage: Score products
     # ------------------------------------------------------------------
@@ -284,6 +844,7 @@ class PipelineService:
     # ------------------------------------------------------------------
 
     async def _stage_brief(self, result: PipelineRunResult) -> None:
+        planned: list[tuple[list[str], asyncio.Future[dict | None]]] = []
         try:
             clusters = await self._repo.get_clusters_without_briefs()
             if not clusters:
@@ -294,13 +855,27 @@ class PipelineService:
                 "Generating briefs for %d clusters", len(clusters)
             )
 
+            # Plan every cluster's Trends keywords up front: clusters often
+            # share keywords, and each payload waits on the Trends rate limit.
+            cluster_keywords = [
+                trend_kw[:TRENDS_PAYLOAD_SIZE] if trend_kw else [label[:80]]
+                for _, label, _, trend_kw, _ in clusters
+            ]
+            payloads = _pack_keywords(cluster_keywords)
+            logger.info(
+                "Trends: %d keywords across %d clusters packed into %d payloads",
+                sum(len(p) for p in payloads), len(clusters), len(payloads),
+            )
+            planned = [
+                (payload, asyncio.ensure_future(self._safe_get_trends(payload)))
+                for payload in payloads
+            ]
+
             sem = asyncio.Semaphore(BRIEF_CONCURRENCY)
 
-            async def _gen_brief(cluster_id, label, summary, trend_keywords, posts):
+            async def _gen_brief(cluster_id, label, summary, keywords, posts):
                 async with sem:
                     try:
-                        keywords = trend_keywords[:5] if trend_keywords else [label[:80]]
-
                         logger.info(
                             "Trends keywords for cluster %d: %s",
                             cluster_id,
@@ -309,7 +884,7 @@ class PipelineService:
 
                         # Fetch trends + related products in parallel
                         trends_result, products_result = await asyncio.gather(
-                            self._safe_get_trends(cluster_id, keywords),
+                            _cluster_trends(planned, keywords),
                             self._safe_find_related(cluster_id, label),
                         )
 
@@ -344,21 +919,24 @@ class PipelineService:
 
             await asyncio.gather(
                 *[
-                    _gen_brief(cid, label, summary, trend_kw, posts)
-                    for cid, label, summary, trend_kw, posts in clusters
+                    _gen_brief(cid, label, summary, keywords, posts)
+                    for (cid, label, summary, _, posts), keywords in zip(
+                        clusters, cluster_keywords, strict=True
+                    )
                 ]
             )
         except Exception:
             logger.exception("Brief stage failed")
             result.errors.append("Brief stage failed")
+        finally:
+            for _, fetch in planned:
+                fetch.cancel()
 
-    async def _safe_get_trends(
-        self, cluster_id: int, keywords: list[str]
-    ) -> dict | None:
+    async def _safe_get_trends(self, keywords: list[str]) -> dict | None:
         try:
             return await self._trends.get_interest(keywords)
         except Exception:
-            logger.warning("Trends fetch failed for cluster %d", cluster_id)
+            logger.warning("Trends fetch failed for %s", keywords)
             return None
 
     async def _safe_find_related(
@@ -371,3 +949,157 @@ class PipelineService:
                 "Related products lookup failed for cluster %d", cluster_id
             )
             return None
+
+
+def _fold(keyword: str) -> str:
+    return keyword.strip().lower()
+
+
+def _pack_keywords(keyword_sets: list[list[str]]) -> list[list[str]]:
+    """Dedupe keywords across clusters and pack them into full Trends payloads.
+
+    Keywords match case-insensitively and keep their first-seen spelling.
+    Packing in first-seen order keeps each cluster's keywords together where
+    the payload boundaries allow, and needs only ``ceil(unique / 5)`` calls.
+    """
+    unique: dict[str, str] = {}
+    for keywords in keyword_sets:
+        for keyword in keywords:
+            unique.setdefault(_fold(keyword), keyword)
+    spelled = list(unique.values())
+    return [
+        spelled[i : i + TRENDS_PAYLOAD_SIZE]
+        for i in range(0, len(spelled), TRENDS_PAYLOAD_SIZE)
+    ]
+
+
+async def _cluster_trends(
+    planned: list[tuple[list[str], asyncio.Future[dict | None]]],
+    keywords: list[str],
+) -> dict | None:
+    """A cluster's slice of the shared Trends payloads, or None if all failed."""
+    wanted = {_fold(k): k for k in keywords}
+    # shield: the fetches are shared, so one cluster must not cancel them.
+    fetches = [
+        asyncio.shield(fetch)
+        for payload, fetch in planned
+        if any(_fold(k) in wanted for k in payload)
+    ]
+    results = [r for r in await asyncio.gather(*fetches) if r is not None]
+    if not results:
+        return None
+
+    sliced: dict = {}
+    for data in results:
+        for section, values in data.items():
+            if not isinstance(values, dict):
+                continue
+            bucket = sliced.setdefault(section, {})
+            for keyword, value in values.items():
+                if _fold(keyword) in wanted:
+                    bucket[wanted[_fold(keyword)]] = value
+    return sliced
+
+
+def _range_checkpoint(
+    since: datetime, until: datetime, *, done: bool = False
+) -> BackfillCheckpoint:
+    return BackfillCheckpoint(
+        _BACKFILL_RANGE_PARTITION, cursor=f"{since.isoformat()}..{until.isoformat()}", done=done
+    )
+
+
+def _utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _in_window(post: RawPost, since: datetime, until: datetime) -> bool:
+    return since <= _utc(post.external_created_at) < until
+
+
+def _newest(posts: list[RawPost]) -> FetchCursor:
+    post = max(posts, key=lambda p: p.external_created_at)
+    return FetchCursor(external_id=post.external_id, created_at=post.external_created_at)
+
+
+def _newest_product(
+    products: list[RawProduct], current: FetchCursor | None
+) -> FetchCursor | None:
+    for product in products:
+        if product.launched_at is None:
+            continue
+        if current is None or product.launched_at > current.created_at:
+            current = FetchCursor(external_id=product.external_id, created_at=product.launched_at)
+    return current
+
+
+def _newest_by_subreddit(posts: list[RawPost]) -> dict[str, FetchCursor]:
+    by_subreddit: dict[str, list[RawPost]] = {}
+    for post in posts:
+        if post.subreddit:
+            by_subreddit.setdefault(post.subreddit.lower(), []).append(post)
+    return {key: _newest(sub_posts) for key, sub_posts in by_subreddit.items()}
+
+
+def _estimate_tag_tokens(post: Post) -> int:
+    # ~4 characters per token is close enough to size batches.
+    chars = len(post.title) + min(len(post.body or ""), _TAG_BODY_CHARS)
+    return _TAG_POST_OVERHEAD_TOKENS + chars // 4
+
+
+def _is_content_error(exc: BaseException) -> bool:
+    """True if ``exc`` can come from the posts sent: an unparseable or refused reply.
+
+    Client retries may wrap the last attempt's error, so its cause is checked too.
+    """
+    return any(
+        isinstance(err, (ValueError, SafetyFilteredError))
+        for err in (exc, exc.__cause__)
+    )
+
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _select_tag_vocabulary(
+    batch: list[Post], tag_counts: dict[str, int], size: int
+) -> list[str]:
+    """Pick at most ``size`` existing tag slugs worth offering for ``batch``.
+
+    Tags are ranked by how many of their slug words appear in the batch
+    text, then by how many posts carry them, so slots not claimed by a
+    textual match go to the most-used tags. Returned sorted, so equal
+    batches build equal prompts.
+    """
+    if len(tag_counts) <= size:
+        return sorted(tag_counts)
+    words: set[str] = set()
+    for post in batch:
+        text = f"{post.title} {(post.body or '')[:_TAG_BODY_CHARS]}".lower()
+        words.update(_WORD_RE.findall(text))
+
+    def _rank(slug: str) -> tuple[int, int, str]:
+        matched = sum(1 for part in slug.split("-") if part in words)
+        return (-matched, -tag_counts[slug], slug)
+
+    return sorted(heapq.nsmallest(size, tag_counts, key=_rank))
+
+
+def _tagging_batches(posts: list[Post], budget: int, max_posts: int) -> list[list[Post]]:
+    """Split ``posts`` into batches of at most ``budget`` estimated prompt tokens.
+
+    A single post over the budget still gets a batch of its own.
+    """
+    batches: list[list[Post]] = []
+    batch: list[Post] = []
+    tokens = 0
+    for post in posts:
+        cost = _estimate_tag_tokens(post)
+        if batch and (tokens + cost > budget or len(batch) >= max_posts):
+            batches.append(batch)
+            batch, tokens = [], 0
+        batch.append(post)
+        tokens += cost
+    if batch:
+        batches.append(batch)
+    return batches
@@ -217,9 +217,15 @@ button:disabled{opacity:.5;cursor:not-allowed}
         }),
         makeStat('Posts fetched', d.posts_fetched),
         makeStat('Posts upserted', d.posts_upserted),
+        makeStat('Posts unchanged', d.posts_unchanged),
+        makeStat('Duplicates linked', d.posts_duplicate),
         makeStat('Posts tagged', d.posts_tagged),
         makeStat('Clusters created', d.clusters_created),
-        makeStat('Briefs generated', d.briefs_generated)
+        makeStat('Briefs generated', d.briefs_generated),
+        makeStat(
+          'LLM cache hits',
+          d.llm_cache_hits + ' / ' + (d.llm_cache_hits + d.llm_cache_misses)
+        )
       ];
 
       if (hasErr) {
@@ -29,12 +29,7 @@ async def pipeline_pending(request: Request):
     return JSONResponse(content={"data": counts})
 
 
-@router.post("/run")
-async def run_pipeline(
-    request: Request,
-    x_internal_secret: str | None = Header(None),
-    skip_fetch: bool = False,
-):
+def _forbidden(x_internal_secret: str | None) -> JSONResponse | None:
     settings = get_settings()
 
     if not settings.API_INTERNAL_SECRET or not hmac.compare_digest(
@@ -50,19 +45,51 @@ async def run_pipeline(
             },
             media_type="application/problem+json",
         )
+    return None
+
+
+@router.post("/run")
+async def run_pipeline(
+    request: Request,
+    x_internal_secret: str | None = Header(None),
+    skip_fetch: bool = False,
+):
+    if (denied := _forbidden(x_internal_secret)) is not None:
+        return denied
 
     svc = _get_service(request)
     result = await svc.run(skip_fetch=skip_fetch)
 
     status_code = 200 if not result.has_errors else 207
     logger.info(
-        "Pipeline run complete: fetched=%d upserted=%d tagged=%d clusters=%d briefs=%d errors=%d",
+        "Pipeline run complete: fetched=%d upserted=%d "
+        "(new=%d updated=%d unchanged=%d duplicate=%d) "
+        "tagged=%d clusters=%d briefs=%d llm_cache=%d/%d errors=%d",
         result.posts_fetched,
         result.posts_upserted,
+        result.posts_inserted,
+        result.posts_updated,
+        result.posts_unchanged,
+        result.posts_duplicate,
         result.posts_tagged,
         result.clusters_created,
         result.briefs_generated,
+        result.llm_cache_hits,
+        result.llm_cache_hits + result.llm_cache_misses,
         len(result.errors),
     )
 
     return JSONResponse(status_code=status_code, content={"data": asdict(result)})
+
+
+@router.post("/refresh-engagement")
+async def refresh_engagement(
+    request: Request,
+    x_internal_secret: str | None = Header(None),
+):
+    if (denied := _forbidden(x_internal_secret)) is not None:
+        return denied
+
+    svc = _get_service(request)
+    result = await svc.refresh_engagement()
+    return JSONResponse(content={"data": asdict(result)})
@@ -1,19 +1,25 @@
 import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
-import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from domain.pipeline.models import RawPost, RawProduct
+from domain.pipeline.models import FetchCursor, RawPost, RawProduct
+from domain.pipeline.ports import RawArchive
+from outbound.http.client import HttpClient, HttpSession, borrow
+from outbound.http.ratelimit import HostRateLimiter
 from shared.slugify import slugify
 
 logger = logging.getLogger(__name__)
 
 _ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
 _ITUNES_REVIEWS_URL = (
-    "https://itunes.apple.com/{country}/rss/customerreviews/page={page}/id={app_id}/json"
+    "https://itunes.apple.com/{country}/rss/customerreviews"
+    "/page={page}/id={app_id}/sortby=mostrecent/json"
 )
+# The customer-reviews RSS feed serves at most 10 pages per app.
+_MAX_REVIEW_PAGES = 10
 
 
 def _parse_release_date(raw: str | None) -> datetime | None:
@@ -27,6 +33,20 @@ def _parse_release_date(raw: str | None) -> datetime | None:
 
 
 class AppStoreClient:
+    def __init__(
+        self,
+        http: HttpClient | None = None,
+        *,
+        requests_per_minute: int = 60,
+        concurrency: int = 1,
+        archive: RawArchive | None = None,
+    ) -> None:
+        self._http = http
+        self._archive = archive
+        self._concurrency = max(1, concurrency)
+        # Search and review feeds share itunes.apple.com, so they share a budget.
+        self._limiter = HostRateLimiter(requests_per_minute, burst=self._concurrency)
+
     async def search_apps(
         self, keywords: list[str], limit: int = 20, max_age_days: int = 365
     ) -> list[RawProduct]:
@@ -34,78 +54,123 @@ class AppStoreClient:
         seen: set[str] = set()
         cutoff = datetime.now(UTC) - timedelta(days=max_age_days)
         fetch_limit = limit * 3
+        sem = asyncio.Semaphore(self._concurrency)
 
-        async with httpx.AsyncClient(timeout=30) as http:
-            for keyword in keywords:
-                try:
-                    items = await self._search(http, keyword, fetch_limit)
-                    for item in items:
-                        ext_id = str(item.get("trackId", ""))
-                        if ext_id in seen:
-                            continue
-                        seen.add(ext_id)
-
-                        released = _parse_release_date(
-                            item.get("releaseDate")
-                        )
-                        if released is not None and released < cutoff:
-                            continue
-
-                        products.append(
-                            RawProduct(
-                                external_id=ext_id,
-                                name=item.get("trackName", ""),
-                                slug=f"{slugify(item.get('trackName', ''))}-{ext_id}",
-                                tagline=None,
-                                description=item.get("description"),
-                                url=item.get("trackViewUrl"),
-                                category=item.get("primaryGenreName"),
-                                launched_at=released,
-                                image_url=item.get("artworkUrl512")
-                                or item.get("artworkUrl100"),
-                                source="app_store",
-                            )
-                        )
+        async with borrow(self._http, timeout=30) as http:
+
+            async def _search_one(keyword: str) -> list[dict]:
+                async with sem:
+                    try:
+                        return await self._search(http, keyword, fetch_limit)
+                    except Exception:
+                        logger.exception("App Store search failed for %r", keyword)
+                        return []
+
+            # Results are merged in keyword order, so earlier keywords still
+            # win the ``limit`` slots however the searches interleave.
+            results = await asyncio.gather(*[_search_one(k) for k in keywords])
+
+        for items in results:
+            for item in items:
+                ext_id = str(item.get("trackId", ""))
+                if ext_id in seen:
+                    continue
+                seen.add(ext_id)
+
+                released = _parse_release_date(item.get("releaseDate"))
+                if released is not None and released < cutoff:
+                    continue
 
-                        if len(products) >= limit:
-                            break
-                except Exception:
-                    logger.exception("App Store search failed for %r", keyword)
-                await asyncio.sleep(0.5)
+                products.append(
+                    RawProduct(
+                        external_id=ext_id,
+                        name=item.get("trackName", ""),
+                        slug=f"{slugify(item.get('trackName', ''))}-{ext_id}",
+                        tagline=None,
+                        description=item.get("description"),
+                        url=item.get("trackViewUrl"),
+                        category=item.get("primaryGenreName"),
+                        launched_at=released,
+                        image_url=item.get("artworkUrl512")
+                        or item.get("artworkUrl100"),
+                        source="app_store",
+                    )
+                )
 
                 if len(products) >= limit:
                     break
 
+            if len(products) >= limit:
+                break
+
         products = products[:limit]
         logger.info("Found %d apps from App Store", len(products))
         return products
 
     async def fetch_reviews(
-        self, app_id: str, country: str = "us", pages: int = 3
+        self,
+        app_id: str,
+        country: str = "us",
+        pages: int = 3,
+        *,
+        since: FetchCursor | None = None,
     ) -> list[RawPost]:
+        """Fetch review pages newest first: page 1, then ``concurrency`` at a time.
+
+        Without a mark, ``pages`` pages are read. With one, paging continues
+        (up to the feed's own page limit) until it reaches a review the mark
+        covers, so only the delta since the last run is returned; most runs
+        stop after page 1. Pagination also stops at the first empty page and
+        at the first page that fails after retries. With a mark, that
+        failure is raised instead: the pages read so far don't reach the
+        mark, and storing them would advance it over the missing page.
+        """
+        max_pages = pages if since is None else _MAX_REVIEW_PAGES
+        windows = [range(1, min(2, max_pages + 1))] + [
+            range(first, min(first + self._concurrency, max_pages + 1))
+            for first in range(2, max_pages + 1, self._concurrency)
+        ]
         posts: list[RawPost] = []
-        async with httpx.AsyncClient(timeout=30) as http:
-            for page in range(1, pages + 1):
-                try:
-                    page_posts = await self._fetch_review_page(
-                        http, app_id, country, page
-                    )
+        async with borrow(self._http, timeout=30) as http:
+            for window in windows:
+                results = await asyncio.gather(
+                    *[self._fetch_review_page(http, app_id, country, page) for page in window],
+                    return_exceptions=True,
+                )
+                done = False
+                for page, page_posts in zip(window, results, strict=True):
+                    if isinstance(page_posts, BaseException):
+                        logger.error(
+                            "App Store review fetch failed for app %s page %d",
+                            app_id,
+                            page,
+                            exc_info=page_posts,
+                        )
+                        if since is not None:
+                            raise page_posts
+                        done = True
+                        break
+                    if not page_posts:
+                        done = True
+                        break
+                    if since is not None:
+                        fresh = [p for p in page_posts if not since.covers(p)]
+                        done = len(fresh) < len(page_posts)
+                        page_posts = fresh
                     posts.extend(page_posts)
-                except Exception:
-                    logger.exception(
-                        "App Store review fetch failed for app %s page %d",
-                        app_id,
-                        page,
-                    )
-                await asyncio.sleep(0.5)
+                    if done:
+                        break
+                if done:
+                    break
 
         logger.info("Fetched %d reviews for app %s", len(posts), app_id)
         return posts
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def _search(
-        self, http: httpx.AsyncClient, keyword: str, limit: int
+        self, http: HttpSession, keyword: str, limit: int
     ) -> list[dict]:
+        await self._limiter.acquire(_ITUNES_SEARCH_URL)
         resp = await http.get(
             _ITUNES_SEARCH_URL,
             params={
@@ -120,7 +185,7 @@ class AppStoreClient:
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def _fetch_review_page(
         self,
-        http: httpx.AsyncClient,
+        http: HttpSession,
         app_id: str,
         country: str,
         page: int,
@@ -128,64 +193,76 @@ class AppStoreClient:
         url = _ITUNES_REVIEWS_URL.format(
             country=country, page=page, app_id=app_id
         )
+        await self._limiter.acquire(url)
         resp = await http.get(url)
         resp.raise_for_status()
 
         data = resp.json()
-        entries = data.get("feed", {}).get("entry", [])
+        if self._archive is not None:
+            await self._archive.append("app_store", {"app_id": app_id}, data)
+        return _parse_review_page(data, app_id)
 
-        posts: list[RawPost] = []
-        for entry in entries:
-            # Skip the first entry if it's the app metadata
-            if "im:rating" not in entry:
-                continue
-
-            title = ""
-            if isinstance(entry.get("title"), dict):
-                title = entry["title"].get("label", "")
-            elif isinstance(entry.get("title"), str):
-                title = entry["title"]
-
-            body = ""
-            if isinstance(entry.get("content"), dict):
-                body = entry["content"].get("label", "")
-            elif isinstance(entry.get("content"), str):
-                body = entry["content"]
-
-            rating = 0
-            if isinstance(entry.get("im:rating"), dict):
-                rating = int(entry["im:rating"].get("label", "0"))
-            elif isinstance(entry.get("im:rating"), str):
-                rating = int(entry["im:rating"])
-
-            ext_id = ""
-            if isinstance(entry.get("id"), dict):
-                ext_id = entry["id"].get("label", "")
-            elif isinstance(entry.get("id"), str):
-                ext_id = entry["id"]
-
-            updated = datetime.now(UTC)
-            if isinstance(entry.get("updated"), dict):
-                date_str = entry["updated"].get("label", "")
-                if date_str:
-                    try:
-                        updated = datetime.fromisoformat(
-                            date_str.replace("Z", "+00:00")
-                        )
-                    except (ValueError, TypeError):
-                        pass
-
-            posts.append(
-                RawPost(
-                    source="app_store",
-                    external_id=f"appstore-{app_id}-{ext_id}",
-                    title=title,
-                    body=body or None,
-                    external_url=f"https://apps.apple.com/app/id{app_id}",
-                    external_created_at=updated,
-                    score=rating,
-                    num_comments=0,
-                )
+
+def _parse_review_page(data: dict, app_id: str) -> list[RawPost]:
+    entries = data.get("feed", {}).get("entry", [])
+
+    posts: list[RawPost] = []
+    for entry in entries:
+        # Skip the first entry if it's the app metadata
+        if "im:rating" not in entry:
+            continue
+
+        title = ""
+        if isinstance(entry.get("title"), dict):
+            title = entry["title"].get("label", "")
+        elif isinstance(entry.get("title"), str):
+            title = entry["title"]
+
+        body = ""
+        if isinstance(entry.get("content"), dict):
+            body = entry["content"].get("label", "")
+        elif isinstance(entry.get("content"), str):
+            body = entry["content"]
+
+        rating = 0
+        if isinstance(entry.get("im:rating"), dict):
+            rating = int(entry["im:rating"].get("label", "0"))
+        elif isinstance(entry.get("im:rating"), str):
+            rating = int(entry["im:rating"])
+
+        ext_id = ""
+        if isinstance(entry.get("id"), dict):
+            ext_id = entry["id"].get("label", "")
+        elif isinstance(entry.get("id"), str):
+            ext_id = entry["id"]
+
+        updated = datetime.now(UTC)
+        if isinstance(entry.get("updated"), dict):
+            date_str = entry["updated"].get("label", "")
+            if date_str:
+                try:
+                    updated = datetime.fromisoformat(
+                        date_str.replace("Z", "+00:00")
+                    )
+                except (ValueError, TypeError):
+                    pass
+
+        posts.append(
+            RawPost(
+                source="app_store",
+                external_id=f"appstore-{app_id}-{ext_id}",
+                title=title,
+                body=body or None,
+                external_url=f"https://apps.apple.com/app/id{app_id}",
+                external_created_at=updated,
+                score=rating,
+                num_comments=0,
             )
+        )
 
-        return posts
+    return posts
+
+
+def parse_archived(context: dict[str, Any], payload: Any) -> list[RawPost]:
+    """Reviews from an archived customer-reviews page (see ``outbound.archive``)."""
+    return _parse_review_page(payload, context["app_id"])
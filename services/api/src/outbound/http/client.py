@@ -0,0 +1,101 @@
+import copy
+import importlib.util
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+
+from outbound.http.scheduler import FetchScheduler, HostLimit
+
+logger = logging.getLogger(__name__)
+
+TransportWrapper = Callable[[httpx.AsyncBaseTransport], httpx.AsyncBaseTransport]
+
+
+class HttpClient:
+    """Process-wide pooled HTTP client shared by the outbound adapters.
+
+    Wraps a single ``httpx.AsyncClient`` so keep-alive connections (and
+    HTTP/2 streams, when enabled) are reused across adapters and runs.
+    Every request goes through the ``FetchScheduler`` (per-host limits and a
+    global in-flight cap); ``for_source()`` tags requests with the adapter
+    that issues them so the scheduler can queue sources fairly.
+    The owner (app lifespan or pipeline CLI) must call ``aclose()``.
+
+    ``wrap_transport`` lets record/replay fixtures sit between the client
+    and its pooled transport (see ``outbound.http.fixtures``).
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_connections_per_host: int = 10,
+        max_in_flight: int = 32,
+        host_limits: dict[str, HostLimit] | None = None,
+        http2: bool = False,
+        wrap_transport: TransportWrapper | None = None,
+    ) -> None:
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the 'h2' package is missing; using HTTP/1.1")
+            http2 = False
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        transport = None
+        if wrap_transport is not None:
+            transport = wrap_transport(httpx.AsyncHTTPTransport(http2=http2, limits=limits))
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            http2=http2,
+            limits=limits,
+            transport=transport,
+        )
+        self._scheduler = FetchScheduler(
+            max_in_flight=max_in_flight,
+            default_concurrency=max_connections_per_host,
+            host_limits=host_limits,
+        )
+        self._source: str | None = None
+
+    @property
+    def scheduler(self) -> FetchScheduler:
+        return self._scheduler
+
+    def for_source(self, source: str) -> "HttpClient":
+        """View of this client (same pool and scheduler) tagged with ``source``."""
+        view = copy.copy(self)
+        view._source = source
+        return view
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        host = httpx.URL(url).host
+        async with self._scheduler.slot(host, source=self._source or host):
+            return await self._client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+HttpSession = HttpClient | httpx.AsyncClient
+
+
+@asynccontextmanager
+async def borrow(shared: HttpClient | None, **client_kwargs: Any) -> AsyncIterator[HttpSession]:
+    """Yield the injected shared client, or a short-lived one for standalone use."""
+    if shared is not None:
+        yield shared
+        return
+    async with httpx.AsyncClient(**client_kwargs) as http:
+        yield http
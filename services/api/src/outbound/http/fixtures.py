@@ -0,0 +1,352 @@
+"""Record/replay of outbound HTTP for reproducible, offline fetch benchmarks.
+
+``record`` saves every response the fetch adapters receive into a cassette
+directory. ``replay`` serves those responses from a local stand-in server
+(with optional latency and error injection), and every adapter request is
+routed to it. httpx traffic (Reddit, RSS, App Store, Product Hunt) goes
+through a transport on the shared ``HttpClient``. urllib traffic
+(``google_play_scraper``) goes through the process-wide urllib opener.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import logging
+import random
+import threading
+import time
+import urllib.request
+import urllib.response
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import httpx
+
+from outbound.http.client import TransportWrapper
+
+logger = logging.getLogger(__name__)
+
+# Not replayed: bodies are stored decoded, and cookies are session noise.
+_SKIPPED_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "set-cookie",
+    "transfer-encoding",
+}
+
+
+@dataclass(frozen=True)
+class Recorded:
+    status: int
+    headers: dict[str, str]
+    content: bytes
+
+
+class Cassette:
+    """Recorded responses on disk, one JSON file per distinct request.
+
+    A request is identified by method, URL (as sent on the wire) and body,
+    so paginated GraphQL POSTs are told apart by their cursors.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self._dir = Path(directory)
+        self._lock = threading.Lock()
+
+    def _path(self, method: str, url: str, body: bytes) -> Path:
+        digest = hashlib.sha256(f"{method.upper()} {url}\n".encode() + body).hexdigest()
+        host = urlsplit(url).netloc or "_"
+        return self._dir / host / f"{digest[:32]}.json"
+
+    def load(self, method: str, url: str, body: bytes = b"") -> Recorded | None:
+        path = self._path(method, url, body)
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        content = (
+            data["text"].encode() if "text" in data else base64.b64decode(data["base64"])
+        )
+        return Recorded(status=data["status"], headers=data["headers"], content=content)
+
+    def save(self, method: str, url: str, body: bytes, response: Recorded) -> None:
+        data: dict = {
+            "method": method.upper(),
+            "url": url,
+            "status": response.status,
+            "headers": {
+                k.lower(): v
+                for k, v in response.headers.items()
+                if k.lower() not in _SKIPPED_HEADERS
+            },
+        }
+        try:
+            data["text"] = response.content.decode()
+        except UnicodeDecodeError:
+            data["base64"] = base64.b64encode(response.content).decode()
+
+        path = self._path(method, url, body)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data, indent=1))
+
+
+def _wire_url(url: httpx.URL) -> str:
+    return f"{url.scheme}://{url.netloc.decode()}{url.raw_path.decode()}"
+
+
+def _to_fixture_url(base_url: str, url: str) -> str:
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{base_url}/{parts.scheme}/{parts.netloc}{parts.path or '/'}{query}"
+
+
+class FixtureServer:
+    """Local HTTP stand-in that serves a cassette's recorded responses.
+
+    Requests arrive as ``/<scheme>/<host>/<path>`` (see the routing
+    transport and urllib handler below). Each response is delayed by
+    ``latency`` seconds, and with probability ``error_rate`` is replaced
+    by an ``error_status`` response. Requests with no recording get a 404.
+    Requests are served on their own threads, so delays overlap the way
+    real network waits do.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        *,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int | None = None,
+    ) -> None:
+        self._cassette = cassette
+        self._latency = max(0.0, latency)
+        self._error_rate = error_rate
+        self._error_status = error_status
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("FixtureServer is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        logger.info("HTTP fixture server listening on %s", self.url)
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FixtureServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _inject_error(self) -> bool:
+        if self._error_rate <= 0:
+            return False
+        with self._random_lock:
+            return self._random.random() < self._error_rate
+
+    def _respond(self, method: str, path: str, body: bytes) -> Recorded:
+        scheme, _, rest = path.lstrip("/").partition("/")
+        url = f"{scheme}://{rest}"
+        if self._latency:
+            time.sleep(self._latency)
+        if self._inject_error():
+            return Recorded(self._error_status, {"content-type": "text/plain"}, b"injected")
+        recorded = self._cassette.load(method, url, body)
+        if recorded is None:
+            logger.warning("No recording for %s %s", method, url)
+            return Recorded(404, {"content-type": "text/plain"}, b"no recording")
+        return recorded
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self) -> None:
+                length = int(self.headers.get("content-length") or 0)
+                body = self.rfile.read(length) if length else b""
+                response = server._respond(self.command, self.path, body)
+                self.send_response(response.status)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.send_header("content-length", str(len(response.content)))
+                self.end_headers()
+                self.wfile.write(response.content)
+
+            def do_GET(self) -> None:  # noqa: N802 (BaseHTTPRequestHandler hook)
+                self._serve()
+
+            def do_POST(self) -> None:  # noqa: N802
+                self._serve()
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug("fixture server: " + format, *args)
+
+        return _Handler
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Pass requests to ``inner`` and save every response to the cassette."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, cassette: Cassette) -> None:
+        self._inner = inner
+        self._cassette = cassette
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        response = await self._inner.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        # ``aread`` decodes the body, so pass it on without its content-encoding.
+        headers = {
+            k: v for k, v in response.headers.items() if k.lower() not in _SKIPPED_HEADERS
+        }
+        self._cassette.save(
+            request.method,
+            _wire_url(request.url),
+            body,
+            Recorded(response.status_code, headers, content),
+        )
+        return httpx.Response(response.status_code, headers=headers, content=content)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class RoutingTransport(httpx.AsyncBaseTransport):
+    """Send every request to the fixture server instead of its real host."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, base_url: str) -> None:
+        self._inner = inner
+        self._base_url = base_url
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        routed = httpx.Request(
+            request.method,
+            _to_fixture_url(self._base_url, _wire_url(request.url)),
+            headers=[(k, v) for k, v in request.headers.raw if k.lower() != b"host"],
+            content=await request.aread(),
+        )
+        return await self._inner.handle_async_request(routed)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class _RoutingHandler(urllib.request.BaseHandler):
+    # Runs before the stock HTTP(S) handlers build the connection.
+    handler_order = 100
+
+    def __init__(self, base_url: str) -> None:
+        self._base_url = base_url
+
+    def _route(self, req: urllib.request.Request) -> urllib.request.Request:
+        if not req.full_url.startswith(self._base_url):
+            req.full_url = _to_fixture_url(self._base_url, req.full_url)
+        return req
+
+    http_request = https_request = _route
+
+
+class _RecordingHTTPSHandler(urllib.request.HTTPSHandler):
+    def __init__(self, cassette: Cassette) -> None:
+        super().__init__()
+        self._cassette = cassette
+
+    def https_open(self, req: urllib.request.Request):
+        response = super().https_open(req)
+        content = response.read()
+        data = req.data if isinstance(req.data, bytes) else b""
+        self._cassette.save(
+            req.get_method(),
+            req.full_url,
+            data,
+            Recorded(response.status, dict(response.headers), content),
+        )
+        return urllib.response.addinfourl(
+            io.BytesIO(content), response.headers, req.full_url, response.status
+        )
+
+
+@contextmanager
+def http_fixtures(
+    mode: str,
+    directory: str | Path,
+    *,
+    latency: float = 0.0,
+    error_rate: float = 0.0,
+    seed: int | None = None,
+) -> Iterator[TransportWrapper | None]:
+    """Enable fixture ``mode`` ("off", "record" or "replay") for the block.
+
+    Yields the transport wrapper to hand to ``HttpClient`` (None when off).
+    The urllib opener is installed process-wide and reset on exit.
+    """
+    if mode == "off":
+        yield None
+        return
+
+    cassette = Cassette(directory)
+    if mode == "record":
+        logger.info("Recording outbound HTTP to %s", directory)
+        urllib.request.install_opener(
+            urllib.request.build_opener(_RecordingHTTPSHandler(cassette))
+        )
+        try:
+            yield lambda inner: RecordingTransport(inner, cassette)
+        finally:
+            urllib.request.install_opener(None)
+        return
+
+    if mode == "replay":
+        with FixtureServer(
+            cassette, latency=latency, error_rate=error_rate, seed=seed
+        ) as server:
+            logger.info(
+                "Replaying outbound HTTP from %s (latency=%.0fms, error_rate=%.2f)",
+                directory, latency * 1000, error_rate,
+            )
+            urllib.request.install_opener(
+                urllib.request.build_opener(_RoutingHandler(server.url))
+            )
+            try:
+                yield lambda inner: RoutingTransport(inner, server.url)
+            finally:
+                urllib.request.install_opener(None)
+        return
+
+    raise ValueError(f"Unknown HTTP fixtures mode: {mode!r}")
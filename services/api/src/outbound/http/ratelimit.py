@@ -0,0 +1,143 @@
+import asyncio
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+# Budget updates whose reset lands within this many seconds of the current
+# one describe the same window (reset headers are whole seconds).
+_WINDOW_SLACK_SECS = 1.0
+
+
+class TokenBucket:
+    """Async token bucket shared by every caller of one upstream.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    ``acquire()`` waits until a whole token is available, so concurrent
+    callers collectively never exceed the configured budget.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate!r}")
+        if capacity < 1:
+            raise ValueError(f"Token bucket capacity must be >= 1, got {capacity!r}")
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, requests: int, burst: int = 1) -> "TokenBucket":
+        return cls(rate=requests / 60.0, capacity=burst)
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out in FIFO order.
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class HostRateLimiter:
+    """Lazily created token bucket per upstream host.
+
+    Lets one adapter talk to several hosts (or one host through several
+    endpoints) while keeping a single request budget per host.
+    """
+
+    def __init__(self, requests_per_minute: int, burst: int = 1) -> None:
+        self._requests_per_minute = requests_per_minute
+        self._burst = max(1, burst)
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = httpx.URL(url).host
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket.per_minute(
+                self._requests_per_minute, burst=self._burst
+            )
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        await self.bucket(url).acquire()
+
+
+class AdaptiveRateLimiter:
+    """Request budget driven by the upstream's own rate-limit headers.
+
+    ``update()`` records how many requests the server still allows and
+    when its window resets. Requests then go out back to back until that
+    budget is spent, and the next one waits exactly until the reset.
+    Until the first update, and again after each reset until fresh headers
+    arrive, requests are paced by the ``fallback`` bucket.
+    """
+
+    def __init__(self, fallback: TokenBucket) -> None:
+        self._fallback = fallback
+        self._remaining: float | None = None
+        self._reset_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while self._remaining is not None:
+                now = time.monotonic()
+                if now >= self._reset_at:
+                    self._remaining = None
+                elif self._remaining >= 1:
+                    self._remaining -= 1
+                    return
+                else:
+                    await asyncio.sleep(self._reset_at - now)
+        await self._fallback.acquire()
+
+    def update(self, remaining: float, reset_after: float) -> None:
+        reset_at = time.monotonic() + max(0.0, reset_after)
+        if self._remaining is not None and reset_at < self._reset_at + _WINDOW_SLACK_SECS:
+            # Same window: responses finish out of order, so never hand
+            # back budget that concurrent requests have already spent.
+            remaining = min(remaining, self._remaining)
+        self._remaining = max(0.0, remaining)
+        self._reset_at = reset_at
+
+    def pause(self, secs: float) -> None:
+        """Hold every request for ``secs`` (e.g. a 429 ``Retry-After``)."""
+        until = time.monotonic() + max(0.0, secs)
+        already_waiting = self._remaining is not None and self._remaining < 1
+        if not already_waiting or until > self._reset_at:
+            self._reset_at = until
+        self._remaining = 0.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
@@ -0,0 +1,147 @@
+"""Process-wide scheduling of outbound fetch requests.
+
+Every adapter request passes through one ``FetchScheduler``: plain HTTP
+via ``HttpClient.request`` and scraper libraries via ``slot()`` directly.
+A request first takes a slot on its host (concurrency plus an optional
+token bucket, configured per host), then one of the global in-flight
+slots. Global slots are handed out round-robin across sources, so a
+source with a deep queue (hundreds of RSS feeds) cannot starve the others.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from outbound.http.ratelimit import TokenBucket
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    concurrency: int
+    requests_per_minute: float | None = None
+
+
+def parse_host_limits(spec: str) -> dict[str, HostLimit]:
+    """Parse ``host=concurrency[/requests_per_minute]`` entries, comma-separated.
+
+    e.g. ``"play.google.com=4/120,hnrss.org=2"``.
+    """
+    limits: dict[str, HostLimit] = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        host, _, value = entry.strip().partition("=")
+        concurrency, _, rpm = value.partition("/")
+        try:
+            limit = HostLimit(int(concurrency), float(rpm) if rpm else None)
+        except ValueError:
+            raise ValueError(f"Invalid host limit: {entry.strip()!r}") from None
+        rate_ok = limit.requests_per_minute is None or limit.requests_per_minute > 0
+        if not host or limit.concurrency < 1 or not rate_ok:
+            raise ValueError(f"Invalid host limit: {entry.strip()!r}")
+        limits[host.lower()] = limit
+    return limits
+
+
+class _FairSlots:
+    """Counting semaphore whose waiters are served round-robin by source."""
+
+    def __init__(self, limit: int) -> None:
+        self._free = limit
+        self._waiters: dict[str, deque[asyncio.Future[None]]] = {}
+        self._turns: deque[str] = deque()
+
+    async def acquire(self, source: str) -> None:
+        if self._free > 0 and not self._turns:
+            self._free -= 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue = self._waiters.setdefault(source, deque())
+        if not queue:
+            self._turns.append(source)
+        queue.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as we were cancelled; pass the slot on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._turns:
+            source = self._turns.popleft()
+            queue = self._waiters[source]
+            while queue:
+                waiter = queue.popleft()
+                if waiter.done():
+                    continue
+                waiter.set_result(None)
+                if queue:
+                    self._turns.append(source)
+                else:
+                    del self._waiters[source]
+                return
+            del self._waiters[source]
+        self._free += 1
+
+
+class _HostGate:
+    def __init__(self, limit: HostLimit) -> None:
+        self._slots = asyncio.Semaphore(max(1, limit.concurrency))
+        self._bucket = (
+            TokenBucket(rate=limit.requests_per_minute / 60.0)
+            if limit.requests_per_minute
+            else None
+        )
+
+    @asynccontextmanager
+    async def enter(self) -> AsyncIterator[None]:
+        async with self._slots:
+            if self._bucket is not None:
+                await self._bucket.acquire()
+            yield
+
+
+class FetchScheduler:
+    """Per-host limits plus a global in-flight cap shared fairly across sources.
+
+    Hosts missing from ``host_limits`` get ``default_concurrency`` slots and
+    no rate limit; adapters with their own upstream-specific pacing (Reddit's
+    header-driven budget) keep it and are only capped here.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: int = 32,
+        default_concurrency: int = 10,
+        host_limits: dict[str, HostLimit] | None = None,
+    ) -> None:
+        self._global = _FairSlots(max(1, max_in_flight))
+        self._default = HostLimit(concurrency=max(1, default_concurrency))
+        self._limits = {host.lower(): limit for host, limit in (host_limits or {}).items()}
+        self._hosts: dict[str, _HostGate] = {}
+
+    def _gate(self, host: str) -> _HostGate:
+        host = host.lower()
+        gate = self._hosts.get(host)
+        if gate is None:
+            gate = self._hosts[host] = _HostGate(self._limits.get(host, self._default))
+        return gate
+
+    @asynccontextmanager
+    async def slot(self, host: str, *, source: str) -> AsyncIterator[None]:
+        """Hold a request slot on ``host`` for the duration of the block.
+
+        The host slot is taken before the global one, so requests held back
+        by a slow or rate-limited host never occupy global capacity.
+        """
+        async with self._gate(host).enter():
+            await self._global.acquire(source)
+            try:
+                yield
+            finally:
+                self._global.release()
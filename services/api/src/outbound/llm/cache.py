@@ -0,0 +1,105 @@
+"""Local-disk backend for the LLM response cache.
+
+One file per entry under ``<dir>/<key[:2]>/<key>.json``. The write time
+is stored in the file and drives the TTL; the file's mtime is bumped on
+every hit and drives least-recently-used eviction. The Postgres backend
+lives on ``PostgresPipelineRepository``.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from domain.pipeline.ports import LlmResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+def create_llm_cache(
+    backend: str, directory: str, postgres: LlmResponseCache
+) -> LlmResponseCache | None:
+    """The response cache selected by ``LLM_CACHE_BACKEND``; ``None`` when off."""
+    if backend == "postgres":
+        return postgres
+    if backend == "disk":
+        return DiskLlmResponseCache(directory)
+    return None
+
+
+class DiskLlmResponseCache:
+    def __init__(self, directory: str | Path) -> None:
+        self._dir = Path(directory)
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.json"
+
+    async def get_llm_response(self, key: str, max_age: timedelta) -> str | None:
+        return await asyncio.to_thread(self._read, self._path(key), max_age)
+
+    async def save_llm_response(self, key: str, model: str, response: str) -> None:
+        entry = {
+            "model": model,
+            "created_at": datetime.now(UTC).isoformat(),
+            "response": response,
+        }
+        await asyncio.to_thread(self._write, self._path(key), json.dumps(entry))
+
+    async def evict_llm_responses(self, max_age: timedelta, max_bytes: int) -> int:
+        return await asyncio.to_thread(self._evict, max_age, max_bytes)
+
+    def _read(self, path: Path, max_age: timedelta) -> str | None:
+        try:
+            entry = json.loads(path.read_text())
+            created_at = datetime.fromisoformat(entry["created_at"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError):
+            logger.warning("Discarding unreadable LLM cache entry %s", path)
+            path.unlink(missing_ok=True)
+            return None
+        if datetime.now(UTC) - created_at > max_age:
+            return None
+        # Evicted concurrently: the response we read is still valid.
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+        return entry["response"]
+
+    def _write(self, path: Path, data: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so readers never see a partial entry.
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_text(data)
+        tmp.replace(path)
+
+    def _evict(self, max_age: timedelta, max_bytes: int) -> int:
+        with self._lock:
+            expired_before = time.time() - max_age.total_seconds()
+            entries: list[tuple[float, int, Path]] = []
+            removed = 0
+            for path in self._dir.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                # Unused since before the TTL window, so it was written before it too.
+                if stat.st_mtime < expired_before:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            return removed
@@ -1,13 +1,30 @@
+import hashlib
 import json
 import logging
 import re
+from collections.abc import Callable
+from datetime import timedelta
+from functools import partial
 from typing import Any
 
 from google import genai
+from google.genai import errors as genai_errors
 from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
-from domain.pipeline.models import BriefDraft, ClusteringResult, RawProduct, TaggingResult
-from domain.pipeline.ports import SafetyFilteredError
+from domain.pipeline.models import (
+    BriefDraft,
+    ClusteringResult,
+    LlmCacheStats,
+    PostEmbedding,
+    RawProduct,
+    TaggingResult,
+)
+from domain.pipeline.ports import (
+    EmbeddingStore,
+    LlmRateLimitedError,
+    LlmResponseCache,
+    SafetyFilteredError,
+)
 from domain.post.models import VALID_POST_TYPES, Post
 
 logger = logging.getLogger(__name__)
@@ -20,6 +37,11 @@ _VALID_SENTIMENTS = {
 _TAG_SLUG_RE = re.compile(r"^[a-z0-9][a-z0-9-]{0,62}[a-z0-9]?$")
 _MAX_TAG_SLUGS = 5
 _MAX_STRING_LEN = 5000
+# Response cache eviction runs on the first write and then every this many.
+_CACHE_EVICT_EVERY = 100
+_EMBEDDING_MODEL = "gemini-embedding-001"
+# embed_content accepts at most 100 texts per request.
+_EMBED_BATCH_SIZE = 100
 
 _TAGGING_PROMPT = """\
 Classify each Reddit post below. For each post, return a JSON object:
@@ -91,6 +113,86 @@ def _post_to_prompt_item(post: Post) -> str:
     )
 
 
+def _tagging_results(items: Any, *, valid_ids: set[int]) -> list[TaggingResult]:
+    if not isinstance(items, list):
+        raise ValueError(f"Expected a JSON array of tagging results, got {type(items).__name__}")
+    results: list[TaggingResult] = []
+    for item in items:
+        if not isinstance(item, dict):
+            logger.warning("LLM returned non-object tagging item %r", item)
+            continue
+        post_id = item.get("post_id")
+        if not isinstance(post_id, int):
+            logger.warning("LLM returned non-int post_id %r", post_id)
+            continue
+        sentiment = item.get("sentiment", "neutral")
+        post_type = item.get("post_type", "other")
+        tag_slugs = item.get("tag_slugs", [])
+
+        if post_id not in valid_ids:
+            logger.warning("LLM returned unknown post_id %s", post_id)
+            continue
+        if sentiment not in _VALID_SENTIMENTS:
+            sentiment = "neutral"
+        if post_type not in VALID_POST_TYPES:
+            post_type = "other"
+        tag_slugs = [
+            s[:64] for s in tag_slugs
+            if isinstance(s, str) and _TAG_SLUG_RE.match(s)
+        ][:_MAX_TAG_SLUGS]
+
+        results.append(TaggingResult(
+            post_id=post_id,
+            sentiment=sentiment,
+            post_type=post_type,
+            tag_slugs=tag_slugs,
+        ))
+    return results
+
+
+def _cluster_label(data: Any, *, cluster_label: int, post_ids: list[int]) -> ClusteringResult:
+    if isinstance(data, list):
+        data = data[0] if data else {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a JSON object for cluster label, got {type(data).__name__}")
+
+    trend_keywords = [
+        str(k)[:80] for k in data.get("trend_keywords", [])
+        if isinstance(k, str) and len(k.strip()) > 0
+    ][:5]
+
+    return ClusteringResult(
+        label=data.get("label", f"Cluster {cluster_label}"),
+        summary=data.get("summary", ""),
+        post_ids=post_ids,
+        trend_keywords=trend_keywords,
+    )
+
+
+def _brief_draft(data: Any) -> BriefDraft:
+    """Raises ``KeyError``/``TypeError`` when the reply lacks the brief's fields."""
+    return BriefDraft(
+        title=str(data["title"])[:200],
+        slug=str(data["slug"])[:200],
+        summary=str(data["summary"])[:_MAX_STRING_LEN],
+        problem_statement=str(data["problem_statement"])[:_MAX_STRING_LEN],
+        opportunity=str(data["opportunity"])[:_MAX_STRING_LEN],
+        solution_directions=data["solution_directions"],
+        demand_signals=data["demand_signals"],
+        source_snapshots=data["source_snapshots"],
+        source_post_ids=[
+            pid for pid in data["source_post_ids"] if isinstance(pid, int)
+        ],
+    )
+
+
+def _cache_key(model: str, prompt: str, config: dict[str, Any] | None) -> str:
+    material = json.dumps(
+        {"model": model, "prompt": prompt, "config": config or {}}, sort_keys=True
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
 class GeminiLlmClient:
     def __init__(
         self,
@@ -98,11 +200,26 @@ class GeminiLlmClient:
         model: str,
         lite_model: str = "gemini-2.5-flash-lite",
         brief_temperature: float = 0.9,
+        *,
+        cache: LlmResponseCache | None = None,
+        cache_ttl_hours: float = 168.0,
+        cache_max_bytes: int = 256 * 1024 * 1024,
+        embedding_store: EmbeddingStore | None = None,
     ) -> None:
         self._client = genai.Client(api_key=api_key)
         self._model = model
         self._lite_model = lite_model
         self._brief_temperature = brief_temperature
+        self._cache = cache
+        self._cache_ttl = timedelta(hours=cache_ttl_hours)
+        self._cache_max_bytes = cache_max_bytes
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_writes = 0
+        self._embedding_store = embedding_store
+
+    def cache_stats(self) -> LlmCacheStats:
+        return LlmCacheStats(hits=self._cache_hits, misses=self._cache_misses)
 
     @staticmethod
     def _parse_response_json(response: Any) -> Any:
@@ -117,9 +234,76 @@ class GeminiLlmClient:
             raise ValueError("Gemini returned empty response")
         return json.loads(_strip_code_fences(response.text))
 
+    async def _generate_json[T](
+        self,
+        model: str,
+        prompt: str,
+        parse: Callable[[Any], T],
+        config: dict[str, Any] | None = None,
+    ) -> T:
+        """``parse`` of a ``generate_content`` call's JSON, served from the response cache.
+
+        Entries are keyed by model, prompt and generation config. ``parse``
+        builds the caller's result and raises on a payload of the wrong
+        shape; only responses it accepts are cached, so a refused or
+        malformed answer is asked for again on retry instead of being replayed.
+        """
+        key = _cache_key(model, prompt, config)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            try:
+                return parse(json.loads(cached))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                logger.warning("Ignoring cached LLM response that no longer parses")
+
+        kwargs: dict[str, Any] = {} if config is None else {"config": config}
+        try:
+            response = await self._client.aio.models.generate_content(
+                model=model, contents=prompt, **kwargs,
+            )
+        except genai_errors.ClientError as exc:
+            if exc.code == 429:
+                raise LlmRateLimitedError(str(exc)) from exc
+            raise
+        result = parse(self._parse_response_json(response))
+        await self._cache_put(key, model, _strip_code_fences(response.text))
+        return result
+
+    async def _cache_get(self, key: str) -> str | None:
+        if self._cache is None:
+            return None
+        try:
+            cached = await self._cache.get_llm_response(key, self._cache_ttl)
+        except Exception:
+            logger.exception("LLM response cache read failed")
+            cached = None
+        if cached is None:
+            self._cache_misses += 1
+        else:
+            self._cache_hits += 1
+        return cached
+
+    async def _cache_put(self, key: str, model: str, text: str) -> None:
+        if self._cache is None:
+            return
+        try:
+            await self._cache.save_llm_response(key, model, text)
+            if self._cache_writes % _CACHE_EVICT_EVERY == 0:
+                evicted = await self._cache.evict_llm_responses(
+                    self._cache_ttl, self._cache_max_bytes
+                )
+                if evicted:
+                    logger.info("Evicted %d LLM cache entries", evicted)
+            self._cache_writes += 1
+        except Exception:
+            logger.exception("LLM response cache write failed")
+
+    # Rate limits are left to the caller, which backs off across all batches;
+    # safety refusals are deterministic and the caller bisects the batch.
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(min=2, max=30),
+        retry=retry_if_not_exception_type((LlmRateLimitedError, SafetyFilteredError)),
     )
     async def tag_posts(
         self, posts: list[Post], *, existing_tags: list[str] | None = None,
@@ -133,43 +317,10 @@ class GeminiLlmClient:
             posts_text=posts_text, existing_tags=tags_text,
         )
 
-        response = await self._client.aio.models.generate_content(
-            model=self._lite_model,
-            contents=prompt,
-        )
-
-        items = self._parse_response_json(response)
-
         valid_ids = {p.id for p in posts}
-        results: list[TaggingResult] = []
-        for item in items:
-            post_id = item.get("post_id")
-            if not isinstance(post_id, int):
-                logger.warning("LLM returned non-int post_id %r", post_id)
-                continue
-            sentiment = item.get("sentiment", "neutral")
-            post_type = item.get("post_type", "other")
-            tag_slugs = item.get("tag_slugs", [])
-
-            if post_id not in valid_ids:
-                logger.warning("LLM returned unknown post_id %s", post_id)
-                continue
-            if sentiment not in _VALID_SENTIMENTS:
-                sentiment = "neutral"
-            if post_type not in VALID_POST_TYPES:
-                post_type = "other"
-            tag_slugs = [
-                s[:64] for s in tag_slugs
-                if isinstance(s, str) and _TAG_SLUG_RE.match(s)
-            ][:_MAX_TAG_SLUGS]
-
-            results.append(TaggingResult(
-                post_id=post_id,
-                sentiment=sentiment,
-                post_type=post_type,
-                tag_slugs=tag_slugs,
-            ))
-        return results
+        return await self._generate_json(
+            self._lite_model, prompt, partial(_tagging_results, valid_ids=valid_ids)
+        )
 
     async def cluster_posts(
         self, posts: list[Post]
@@ -181,12 +332,8 @@ class GeminiLlmClient:
                 post_ids=[p.id for p in posts],
             )]
 
-        # 1. Generate embeddings (batch to stay under API limit of 100)
-        texts = [f"{p.title} {(p.body or '')[:300]}" for p in posts]
-        embeddings: list[list[float]] = []
-        for i in range(0, len(texts), 100):
-            batch = await self._get_embeddings(texts[i : i + 100])
-            embeddings.extend(batch)
+        # 1. Embeddings, reusing stored vectors for unchanged posts
+        embeddings = await self._embed_posts(posts)
 
         # 2. HDBSCAN clustering
         groups = self._hdbscan_cluster(embeddings, posts)
@@ -195,13 +342,52 @@ class GeminiLlmClient:
         labeled = await self._label_clusters(groups, posts)
         return labeled
 
+    async def _embed_posts(self, posts: list[Post]) -> list[list[float]]:
+        """One vector per post, in order; only posts without a stored one are embedded.
+
+        Stored vectors are keyed by post id, embedding model and a hash of the
+        embedded text, so an edited post is embedded again.
+        """
+        texts = {p.id: f"{p.title} {(p.body or '')[:300]}" for p in posts}
+        hashes = {
+            pid: hashlib.sha256(text.encode()).hexdigest() for pid, text in texts.items()
+        }
+        vectors: dict[int, list[float]] = {}
+        if self._embedding_store is not None:
+            try:
+                vectors = await self._embedding_store.get_post_embeddings(
+                    _EMBEDDING_MODEL, hashes
+                )
+            except Exception:
+                logger.exception("Embedding store read failed")
+
+        missing = [pid for pid in texts if pid not in vectors]
+        fresh: list[PostEmbedding] = []
+        for i in range(0, len(missing), _EMBED_BATCH_SIZE):
+            ids = missing[i : i + _EMBED_BATCH_SIZE]
+            batch = await self._get_embeddings([texts[pid] for pid in ids])
+            fresh.extend(
+                PostEmbedding(post_id=pid, text_hash=hashes[pid], vector=list(vector))
+                for pid, vector in zip(ids, batch, strict=True)
+            )
+        logger.info("Embeddings: %d stored, %d generated", len(vectors), len(fresh))
+
+        if fresh and self._embedding_store is not None:
+            try:
+                await self._embedding_store.save_post_embeddings(_EMBEDDING_MODEL, fresh)
+            except Exception:
+                logger.exception("Embedding store write failed")
+
+        vectors.update((e.post_id, e.vector) for e in fresh)
+        return [vectors[p.id] for p in posts]
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(min=2, max=30),
     )
     async def _get_embeddings(self, texts: list[str]) -> list[list[float]]:
         result = await self._client.aio.models.embed_content(
-            model="gemini-embedding-001",
+            model=_EMBEDDING_MODEL,
             contents=texts,
         )
         return [e.values for e in result.embeddings]
@@ -254,32 +440,18 @@ class GeminiLlmClient:
             + "\nReturn only valid JSON."
         )
 
-        response = await self._client.aio.models.generate_content(
-            model=self._lite_model, contents=prompt,
-        )
         try:
-            data = self._parse_response_json(response)
+            return await self._generate_json(
+                self._lite_model,
+                prompt,
+                partial(_cluster_label, cluster_label=cluster_label, post_ids=post_ids),
+            )
         except (ValueError, json.JSONDecodeError):
             logger.warning(
                 "Gemini returned invalid response for cluster %s", cluster_label,
             )
             return fallback
 
-        if isinstance(data, list):
-            data = data[0] if data else {}
-
-        trend_keywords = [
-            str(k)[:80] for k in data.get("trend_keywords", [])
-            if isinstance(k, str) and len(k.strip()) > 0
-        ][:5]
-
-        return ClusteringResult(
-            label=data.get("label", f"Cluster {cluster_label}"),
-            summary=data.get("summary", ""),
-            post_ids=post_ids,
-            trend_keywords=trend_keywords,
-        )
-
     async def _label_clusters(
         self, groups: dict[int, list[int]], posts: list[Post]
     ) -> list[ClusteringResult]:
@@ -359,24 +531,6 @@ class GeminiLlmClient:
             demand_signals_extra=demand_signals_extra,
         )
 
-        response = await self._client.aio.models.generate_content(
-            model=self._model,
-            contents=prompt,
-            config={"temperature": self._brief_temperature},
-        )
-
-        data = self._parse_response_json(response)
-
-        return BriefDraft(
-            title=str(data["title"])[:200],
-            slug=str(data["slug"])[:200],
-            summary=str(data["summary"])[:_MAX_STRING_LEN],
-            problem_statement=str(data["problem_statement"])[:_MAX_STRING_LEN],
-            opportunity=str(data["opportunity"])[:_MAX_STRING_LEN],
-            solution_directions=data["solution_directions"],
-            demand_signals=data["demand_signals"],
-            source_snapshots=data["source_snapshots"],
-            source_post_ids=[
-                pid for pid in data["source_post_ids"] if isinstance(pid, int)
-            ],
+        return await self._generate_json(
+            self._model, prompt, _brief_draft, {"temperature": self._brief_temperature}
         )
@@ -1,12 +1,21 @@
 import asyncio
 import logging
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
-from domain.pipeline.models import RawPost, RawProduct
+from domain.pipeline.models import FetchCursor, RawPost, RawProduct
+from domain.pipeline.ports import AppDetailCache
+from outbound.http.scheduler import FetchScheduler
 from shared.slugify import slugify
 
 logger = logging.getLogger(__name__)
 
+# Catch-up cap when following continuation tokens back to a stored mark.
+_MAX_REVIEW_BATCHES = 10
+# google_play_scraper talks to this host; its pacing comes from HTTP_HOST_LIMITS.
+_PLAY_HOST = "play.google.com"
+
 
 def _parse_released(raw: str | None) -> datetime | None:
     """Parse the 'released' field from gps.app() detail, e.g. 'Jan 1, 2024'."""
@@ -19,6 +28,26 @@ def _parse_released(raw: str | None) -> datetime | None:
 
 
 class PlayStoreClient:
+    def __init__(
+        self,
+        detail_cache: AppDetailCache | None = None,
+        *,
+        detail_ttl_days: int = 30,
+        detail_concurrency: int = 4,
+        scheduler: FetchScheduler | None = None,
+    ) -> None:
+        self._detail_cache = detail_cache
+        self._detail_ttl = timedelta(days=detail_ttl_days)
+        self._detail_concurrency = max(1, detail_concurrency)
+        self._scheduler = scheduler
+
+    async def _call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking scraper call in a thread, under the shared fetch scheduler."""
+        if self._scheduler is None:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        async with self._scheduler.slot(_PLAY_HOST, source="play_store"):
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
     async def search_apps(
         self, keywords: list[str], limit: int = 20, max_age_days: int = 365
     ) -> list[RawProduct]:
@@ -31,49 +60,48 @@ class PlayStoreClient:
 
         for keyword in keywords:
             try:
-                results = await asyncio.to_thread(
-                    gps.search, keyword, n_hits=fetch_limit
-                )
+                results = await self._call(gps.search, keyword, n_hits=fetch_limit)
+                items = []
                 for item in results:
                     app_id = item.get("appId", "")
                     if app_id in seen:
                         continue
                     seen.add(app_id)
-
-                    # Fetch detail to get released date
-                    released = None
-                    try:
-                        detail = await asyncio.to_thread(gps.app, app_id)
-                        await asyncio.sleep(0.5)
-                        released = _parse_released(detail.get("released"))
-                    except Exception:
-                        logger.warning(
-                            "Play Store detail fetch failed for %s", app_id
-                        )
-
-                    if released is not None and released < cutoff:
-                        continue
-
-                    products.append(
-                        RawProduct(
-                            external_id=app_id,
-                            name=item.get("title", ""),
-                            slug=f"{slugify(item.get('title', ''))}-{slugify(app_id)}",
-                            tagline=None,
-                            description=item.get("description"),
-                            url=f"https://play.google.com/store/apps/details?id={app_id}",
-                            category=item.get("genre"),
-                            launched_at=released,
-                            image_url=item.get("icon"),
-                            source="play_store",
-                        )
+                    items.append(item)
+
+                # Details are resolved in order, a window of as many apps as
+                # are still needed at a time, so a cold cache costs no more
+                # gps.app() calls than walking the hits one by one would.
+                start = 0
+                while start < len(items) and len(products) < limit:
+                    window = items[start:start + limit - len(products)]
+                    start += len(window)
+                    released_by_id = await self._release_dates(
+                        [item.get("appId", "") for item in window]
                     )
 
-                    if len(products) >= limit:
-                        break
+                    for item in window:
+                        app_id = item.get("appId", "")
+                        released = released_by_id.get(app_id)
+                        if released is not None and released < cutoff:
+                            continue
+
+                        products.append(
+                            RawProduct(
+                                external_id=app_id,
+                                name=item.get("title", ""),
+                                slug=f"{slugify(item.get('title', ''))}-{slugify(app_id)}",
+                                tagline=None,
+                                description=item.get("description"),
+                                url=f"https://play.google.com/store/apps/details?id={app_id}",
+                                category=item.get("genre"),
+                                launched_at=released,
+                                image_url=item.get("icon"),
+                                source="play_store",
+                            )
+                        )
             except Exception:
                 logger.exception("Play Store search failed for %r", keyword)
-            await asyncio.sleep(1.0)
 
             if len(products) >= limit:
                 break
@@ -82,42 +110,121 @@ class PlayStoreClient:
         logger.info("Found %d recent apps from Play Store", len(products))
         return products
 
+    async def _release_dates(self, app_ids: list[str]) -> dict[str, datetime | None]:
+        """Release date per app: cached within the TTL, else looked up in parallel.
+
+        Release dates never change, so hits skip ``gps.app()`` entirely.
+        Failed lookups are neither returned nor cached, and are retried next run.
+        """
+        if not app_ids:
+            return {}
+
+        cached: dict[str, datetime | None] = {}
+        if self._detail_cache is not None:
+            try:
+                cached = await self._detail_cache.get_app_release_dates(
+                    "play_store", app_ids, self._detail_ttl
+                )
+            except Exception:
+                logger.exception("Play Store detail cache read failed")
+
+        misses = [app_id for app_id in app_ids if app_id not in cached]
+        sem = asyncio.Semaphore(self._detail_concurrency)
+
+        async def _lookup(app_id: str) -> tuple[str, datetime | None] | None:
+            async with sem:
+                try:
+                    return app_id, await self._fetch_released(app_id)
+                except Exception:
+                    logger.warning("Play Store detail fetch failed for %s", app_id)
+                    return None
+
+        looked_up = await asyncio.gather(*[_lookup(app_id) for app_id in misses])
+        fetched = dict(pair for pair in looked_up if pair is not None)
+        logger.info(
+            "Play Store details: %d cached, %d fetched, %d failed",
+            len(cached), len(fetched), len(misses) - len(fetched),
+        )
+
+        if fetched and self._detail_cache is not None:
+            try:
+                await self._detail_cache.save_app_release_dates("play_store", fetched)
+            except Exception:
+                logger.exception("Play Store detail cache write failed")
+
+        return {**cached, **fetched}
+
     async def fetch_reviews(
-        self, app_id: str, count: int = 100
+        self,
+        app_id: str,
+        count: int = 100,
+        *,
+        since: FetchCursor | None = None,
     ) -> list[RawPost]:
+        """Fetch the newest reviews for an app.
+
+        Without a mark, one batch of ``count`` reviews is read. With one,
+        continuation tokens are followed (at most ``_MAX_REVIEW_BATCHES``
+        batches) until a review the mark covers shows up, so only the delta
+        since the last run is returned. A failed batch ends the read; with a
+        mark it is raised instead, since the batches read so far don't reach
+        the mark and storing them would advance it over the missing ones.
+        """
         import google_play_scraper as gps
 
-        try:
-            reviews, _ = await asyncio.to_thread(
-                gps.reviews, app_id, count=count
-            )
-        except Exception:
-            logger.exception("Play Store review fetch failed for %s", app_id)
-            return []
-
         posts: list[RawPost] = []
-        for review in reviews:
-            review_id = review.get("reviewId", "")
-            body = review.get("content", "")
-            score = review.get("score", 0)
-            at = review.get("at")
-            if isinstance(at, datetime):
-                created_at = at.replace(tzinfo=UTC) if at.tzinfo is None else at
+        token = None
+        max_batches = 1 if since is None else _MAX_REVIEW_BATCHES
+        for _ in range(max_batches):
+            try:
+                if token is None:
+                    reviews, token = await self._call(gps.reviews, app_id, count=count)
+                else:
+                    reviews, token = await self._call(
+                        gps.reviews, app_id, continuation_token=token
+                    )
+            except Exception:
+                logger.exception("Play Store review fetch failed for %s", app_id)
+                if since is not None:
+                    raise
+                break
+
+            batch = [_review_to_post(app_id, review) for review in reviews]
+            if since is not None:
+                fresh = [p for p in batch if not since.covers(p)]
+                posts.extend(fresh)
+                if len(fresh) < len(batch):
+                    break
             else:
-                created_at = datetime.now(UTC)
-
-            posts.append(
-                RawPost(
-                    source="play_store",
-                    external_id=f"playstore-{app_id}-{review_id}",
-                    title="",
-                    body=body or None,
-                    external_url=f"https://play.google.com/store/apps/details?id={app_id}",
-                    external_created_at=created_at,
-                    score=score,
-                    num_comments=0,
-                )
-            )
+                posts.extend(batch)
+            if not reviews or token is None:
+                break
 
         logger.info("Fetched %d reviews for app %s", len(posts), app_id)
         return posts
+
+    async def _fetch_released(self, app_id: str) -> datetime | None:
+        import google_play_scraper as gps
+
+        detail = await self._call(gps.app, app_id)
+        return _parse_released(detail.get("released"))
+
+
+def _review_to_post(app_id: str, review: dict) -> RawPost:
+    review_id = review.get("reviewId", "")
+    at = review.get("at")
+    if isinstance(at, datetime):
+        created_at = at.replace(tzinfo=UTC) if at.tzinfo is None else at
+    else:
+        created_at = datetime.now(UTC)
+
+    return RawPost(
+        source="play_store",
+        external_id=f"playstore-{app_id}-{review_id}",
+        title="",
+        body=review.get("content", "") or None,
+        external_url=f"https://play.google.com/store/apps/details?id={app_id}",
+        external_created_at=created_at,
+        score=review.get("score", 0),
+        num_comments=0,
+    )
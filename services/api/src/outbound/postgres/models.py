@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import BigInteger, ForeignKey, Integer, Numeric, Text
+from sqlalchemy import BigInteger, ForeignKey, Integer, LargeBinary, Numeric, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -47,6 +47,11 @@ class PostRow(Base):
     post_type: Mapped[str | None] = mapped_column(Text, default=None)
     sentiment: Mapped[str | None] = mapped_column(Text, default=None)
     tagging_status: Mapped[str] = mapped_column(Text, nullable=False, default="pending")
+    canonical_url: Mapped[str | None] = mapped_column(Text, default=None)
+    content_fingerprint: Mapped[str | None] = mapped_column(Text, default=None)
+    duplicate_of_id: Mapped[int | None] = mapped_column(
+        BigInteger, ForeignKey("post.id", ondelete="SET NULL"), default=None
+    )
 
     tags: Mapped[list[TagRow]] = relationship(
         "TagRow", secondary="post_tag", lazy="selectin"
@@ -178,3 +183,75 @@ class ClusterPostRow(Base):
     post_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey("post.id"), primary_key=True
     )
+
+
+class FetchCursorRow(Base):
+    __tablename__ = "fetch_cursor"
+
+    source: Mapped[str] = mapped_column(Text, primary_key=True)
+    key: Mapped[str] = mapped_column(Text, primary_key=True)
+    external_id: Mapped[str] = mapped_column(Text, nullable=False)
+    external_created_at: Mapped[datetime] = mapped_column(nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(nullable=False)
+
+
+class FeedValidatorRow(Base):
+    __tablename__ = "feed_validator"
+
+    url: Mapped[str] = mapped_column(Text, primary_key=True)
+    etag: Mapped[str | None] = mapped_column(Text, default=None)
+    last_modified: Mapped[str | None] = mapped_column(Text, default=None)
+    content_hash: Mapped[str] = mapped_column(Text, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(nullable=False)
+
+
+class AppDetailRow(Base):
+    __tablename__ = "app_detail"
+
+    source: Mapped[str] = mapped_column(Text, primary_key=True)
+    app_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    released_at: Mapped[datetime | None] = mapped_column(default=None)
+    fetched_at: Mapped[datetime] = mapped_column(nullable=False)
+
+
+class TrendsCacheRow(Base):
+    __tablename__ = "trends_cache"
+
+    keywords: Mapped[str] = mapped_column(Text, primary_key=True)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(nullable=False)
+
+
+class PostEmbeddingRow(Base):
+    __tablename__ = "post_embedding"
+
+    post_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("post.id", ondelete="CASCADE"), primary_key=True
+    )
+    model: Mapped[str] = mapped_column(Text, primary_key=True)
+    text_hash: Mapped[str] = mapped_column(Text, nullable=False)
+    # Little-endian float32, ``dims`` values.
+    vector: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    dims: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
+
+
+class LlmResponseRow(Base):
+    __tablename__ = "llm_response_cache"
+
+    key: Mapped[str] = mapped_column(Text, primary_key=True)
+    model: Mapped[str] = mapped_column(Text, nullable=False)
+    response: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
+    used_at: Mapped[datetime] = mapped_column(nullable=False)
+
+
+class BackfillCheckpointRow(Base):
+    __tablename__ = "backfill_checkpoint"
+
+    job: Mapped[str] = mapped_column(Text, primary_key=True)
+    partition: Mapped[str] = mapped_column(Text, primary_key=True)
+    cursor: Mapped[str | None] = mapped_column(Text, default=None)
+    fetched: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    done: Mapped[bool] = mapped_column(nullable=False, default=False)
+    updated_at: Mapped[datetime] = mapped_column(nullable=False)
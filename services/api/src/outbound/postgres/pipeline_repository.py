@@ -1,29 +1,77 @@
 import logging
-from datetime import UTC, datetime
-
-from sqlalchemy import case, func, select, text, update
+import struct
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import (
+    Integer,
+    Text,
+    case,
+    column,
+    delete,
+    func,
+    literal_column,
+    or_,
+    select,
+    text,
+    update,
+    values,
+)
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from domain.pipeline.models import BriefDraft, ClusteringResult, RawPost, RawProduct, TaggingResult
+from sqlalchemy.orm import aliased
+
+from domain.pipeline.models import (
+    BackfillCheckpoint,
+    BriefDraft,
+    ClusteringResult,
+    FeedValidators,
+    FetchCursor,
+    PostEmbedding,
+    PostEngagement,
+    RawPost,
+    RawProduct,
+    TaggingResult,
+    UpsertCounts,
+)
+from domain.pipeline.dedup import canonical_url, content_fingerprint
 from domain.post.models import ACTIONABLE_POST_TYPES, Post
 from outbound.postgres.database import Database
 from outbound.postgres.mapper import post_to_domain
 from shared.slugify import slugify
 from outbound.postgres.models import (
+    AppDetailRow,
+    BackfillCheckpointRow,
     BriefRow,
     BriefSourceRow,
     ClusterPostRow,
     ClusterRow,
+    FeedValidatorRow,
+    FetchCursorRow,
+    LlmResponseRow,
+    PostEmbeddingRow,
     PostRow,
     PostTagRow,
     ProductRow,
     ProductTagRow,
     TagRow,
+    TrendsCacheRow,
 )
 
 logger = logging.getLogger(__name__)
 
+# Fields a parser derives from the payload, rewritten when reprocessing. The
+# creation time is left out: parsers fall back to "now" for undated entries,
+# so a replay would move those posts to the time of the replay.
+_POST_CONTENT_COLUMNS = (
+    "title",
+    "body",
+    "external_url",
+    "subreddit",
+    "canonical_url",
+    "content_fingerprint",
+)
+
 
 class PostgresPipelineRepository:
     def __init__(self, db: Database) -> None:
@@ -58,9 +106,22 @@ class PostgresPipelineRepository:
                 logger.exception("Failed to close lock session")
             self._lock_session = None
 
-    async def upsert_posts(self, posts: list[RawPost]) -> int:
+    async def upsert_posts(
+        self, posts: list[RawPost], *, refresh_content: bool = False
+    ) -> UpsertCounts:
+        """Insert new posts and refresh engagement on existing ones.
+
+        A conflicting row is only rewritten when its score or comment count
+        actually changed, so re-fetching an idle post leaves no dead tuple
+        or WAL behind. ``RETURNING xmax = 0`` tells inserts from updates;
+        rows skipped by the ``WHERE`` return nothing and count as unchanged.
+        ``refresh_content`` rewrites the parsed fields (title, body, URL,
+        subreddit) instead, for reprocessing archived payloads; engagement
+        and the creation time are left alone there, as the archived numbers
+        are older than the stored ones.
+        """
         if not posts:
-            return 0
+            return UpsertCounts()
 
         async with self._db.session() as session:
             now = datetime.now(UTC).replace(tzinfo=None)
@@ -86,18 +147,451 @@ class PostgresPipelineRepository:
                         "external_url": p.external_url,
                         "score": p.score,
                         "num_comments": p.num_comments,
+                        "canonical_url": canonical_url(p.link_url),
+                        "content_fingerprint": content_fingerprint(
+                            p.title, p.body, source=p.source
+                        ),
                     }
                 )
 
             stmt = pg_insert(PostRow).values(rows)
+            columns = _POST_CONTENT_COLUMNS if refresh_content else ("score", "num_comments")
             stmt = stmt.on_conflict_do_update(
                 constraint="uq_post_source_external_id",
                 set_={
-                    "score": stmt.excluded.score,
-                    "num_comments": stmt.excluded.num_comments,
+                    **{c: stmt.excluded[c] for c in columns},
                     "updated_at": now,
                 },
+                where=or_(
+                    *(getattr(PostRow, c).is_distinct_from(stmt.excluded[c]) for c in columns)
+                ),
+            ).returning(literal_column("xmax = 0").label("inserted"))
+            result = await session.execute(stmt)
+            flags = result.scalars().all()
+            await session.commit()
+            inserted = sum(1 for flag in flags if flag)
+            updated = len(flags) - inserted
+            return UpsertCounts(
+                inserted=inserted,
+                updated=updated,
+                unchanged=len(rows) - len(flags),
+            )
+
+    async def get_recent_external_ids(self, source: str, max_age: timedelta) -> list[str]:
+        created_after = (datetime.now(UTC) - max_age).replace(tzinfo=None)
+        async with self._db.session() as session:
+            result = await session.execute(
+                select(PostRow.external_id)
+                .where(
+                    PostRow.source == source,
+                    PostRow.deleted_at.is_(None),
+                    PostRow.external_created_at >= created_after,
+                )
+                .order_by(PostRow.external_created_at.desc())
+            )
+            return list(result.scalars().all())
+
+    async def link_duplicates(self, window: timedelta) -> int:
+        """Mark pending posts that repeat an earlier story as duplicates.
+
+        A pending post matches an earlier post (lower id, not itself a
+        duplicate) that shares its canonical URL or content fingerprint and
+        was created within ``window`` of it. It is linked to the earliest
+        such post via ``duplicate_of_id`` and moved to ``tagging_status =
+        'duplicate'``, which no LLM stage selects. Returns the number linked.
+        """
+        canon = aliased(PostRow)
+        match = (
+            select(func.min(canon.id))
+            .where(
+                canon.id < PostRow.id,
+                canon.duplicate_of_id.is_(None),
+                canon.deleted_at.is_(None),
+                or_(
+                    canon.canonical_url == PostRow.canonical_url,
+                    canon.content_fingerprint == PostRow.content_fingerprint,
+                ),
+                canon.external_created_at.between(
+                    PostRow.external_created_at - window,
+                    PostRow.external_created_at + window,
+                ),
+            )
+            .scalar_subquery()
+        )
+        now = datetime.now(UTC).replace(tzinfo=None)
+        stmt = (
+            update(PostRow)
+            .where(
+                PostRow.tagging_status == "pending",
+                PostRow.deleted_at.is_(None),
+                or_(
+                    PostRow.canonical_url.is_not(None),
+                    PostRow.content_fingerprint.is_not(None),
+                ),
+                match.is_not(None),
             )
+            .values(duplicate_of_id=match, tagging_status="duplicate", updated_at=now)
+        )
+        async with self._db.session() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount
+
+    async def update_engagement(
+        self, source: str, engagement: list[PostEngagement]
+    ) -> int:
+        """Apply fresh engagement in one ``UPDATE ... FROM (VALUES ...)``.
+
+        Like ``upsert_posts``, rows whose numbers did not change are left
+        alone; the return value counts only rows actually rewritten.
+        """
+        if not engagement:
+            return 0
+
+        fresh = values(
+            column("external_id", Text),
+            column("score", Integer),
+            column("num_comments", Integer),
+            name="fresh",
+        ).data([(e.external_id, e.score, e.num_comments) for e in engagement])
+        now = datetime.now(UTC).replace(tzinfo=None)
+        stmt = (
+            update(PostRow)
+            .where(
+                PostRow.source == source,
+                PostRow.external_id == fresh.c.external_id,
+                or_(
+                    PostRow.score.is_distinct_from(fresh.c.score),
+                    PostRow.num_comments.is_distinct_from(fresh.c.num_comments),
+                ),
+            )
+            .values(score=fresh.c.score, num_comments=fresh.c.num_comments, updated_at=now)
+        )
+        async with self._db.session() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount
+
+    async def get_fetch_cursors(self, source: str) -> dict[str, FetchCursor]:
+        async with self._db.session() as session:
+            result = await session.execute(
+                select(FetchCursorRow).where(FetchCursorRow.source == source)
+            )
+            return {
+                row.key: FetchCursor(
+                    external_id=row.external_id,
+                    created_at=row.external_created_at.replace(tzinfo=UTC),
+                )
+                for row in result.scalars().all()
+            }
+
+    async def save_fetch_cursors(
+        self, source: str, cursors: dict[str, FetchCursor]
+    ) -> None:
+        if not cursors:
+            return
+
+        async with self._db.session() as session:
+            now = datetime.now(UTC).replace(tzinfo=None)
+            rows = [
+                {
+                    "source": source,
+                    "key": key,
+                    "external_id": cursor.external_id,
+                    "external_created_at": cursor.created_at.replace(tzinfo=None)
+                    if cursor.created_at.tzinfo
+                    else cursor.created_at,
+                    "updated_at": now,
+                }
+                for key, cursor in cursors.items()
+            ]
+            stmt = pg_insert(FetchCursorRow).values(rows)
+            # Never move a mark backwards (e.g. a late retry of an older page).
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["source", "key"],
+                set_={
+                    "external_id": stmt.excluded.external_id,
+                    "external_created_at": stmt.excluded.external_created_at,
+                    "updated_at": now,
+                },
+                where=FetchCursorRow.external_created_at
+                <= stmt.excluded.external_created_at,
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def get_feed_validators(self, urls: list[str]) -> dict[str, FeedValidators]:
+        if not urls:
+            return {}
+
+        async with self._db.session() as session:
+            result = await session.execute(
+                select(FeedValidatorRow).where(FeedValidatorRow.url.in_(urls))
+            )
+            return {
+                row.url: FeedValidators(
+                    url=row.url,
+                    etag=row.etag,
+                    last_modified=row.last_modified,
+                    content_hash=row.content_hash,
+                )
+                for row in result.scalars().all()
+            }
+
+    async def save_feed_validators(self, validators: list[FeedValidators]) -> None:
+        if not validators:
+            return
+
+        async with self._db.session() as session:
+            now = datetime.now(UTC).replace(tzinfo=None)
+            rows = [
+                {
+                    "url": v.url,
+                    "etag": v.etag,
+                    "last_modified": v.last_modified,
+                    "content_hash": v.content_hash,
+                    "updated_at": now,
+                }
+                for v in validators
+            ]
+            stmt = pg_insert(FeedValidatorRow).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["url"],
+                set_={
+                    "etag": stmt.excluded.etag,
+                    "last_modified": stmt.excluded.last_modified,
+                    "content_hash": stmt.excluded.content_hash,
+                    "updated_at": now,
+                },
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def get_backfill_checkpoints(self, job: str) -> dict[str, BackfillCheckpoint]:
+        async with self._db.session() as session:
+            result = await session.execute(
+                select(BackfillCheckpointRow).where(BackfillCheckpointRow.job == job)
+            )
+            return {
+                row.partition: BackfillCheckpoint(
+                    partition=row.partition,
+                    cursor=row.cursor,
+                    fetched=row.fetched,
+                    done=row.done,
+                )
+                for row in result.scalars().all()
+            }
+
+    async def save_backfill_checkpoint(
+        self, job: str, checkpoint: BackfillCheckpoint
+    ) -> None:
+        async with self._db.session() as session:
+            now = datetime.now(UTC).replace(tzinfo=None)
+            stmt = pg_insert(BackfillCheckpointRow).values(
+                job=job,
+                partition=checkpoint.partition,
+                cursor=checkpoint.cursor,
+                fetched=checkpoint.fetched,
+                done=checkpoint.done,
+                updated_at=now,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["job", "partition"],
+                set_={
+                    "cursor": stmt.excluded.cursor,
+                    "fetched": stmt.excluded.fetched,
+                    "done": stmt.excluded.done,
+                    "updated_at": now,
+                },
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def get_app_release_dates(
+        self, source: str, app_ids: list[str], max_age: timedelta
+    ) -> dict[str, datetime | None]:
+        if not app_ids:
+            return {}
+
+        fresh_after = (datetime.now(UTC) - max_age).replace(tzinfo=None)
+        async with self._db.session() as session:
+            result = await session.execute(
+                select(AppDetailRow).where(
+                    AppDetailRow.source == source,
+                    AppDetailRow.app_id.in_(app_ids),
+                    AppDetailRow.fetched_at >= fresh_after,
+                )
+            )
+            return {
+                row.app_id: row.released_at.replace(tzinfo=UTC)
+                if row.released_at
+                else None
+                for row in result.scalars().all()
+            }
+
+    async def save_app_release_dates(
+        self, source: str, released: dict[str, datetime | None]
+    ) -> None:
+        if not released:
+            return
+
+        async with self._db.session() as session:
+            now = datetime.now(UTC).replace(tzinfo=None)
+            rows = [
+                {
+                    "source": source,
+                    "app_id": app_id,
+                    "released_at": at.replace(tzinfo=None) if at else None,
+                    "fetched_at": now,
+                }
+                for app_id, at in released.items()
+            ]
+            stmt = pg_insert(AppDetailRow).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["source", "app_id"],
+                set_={
+                    "released_at": stmt.excluded.released_at,
+                    "fetched_at": now,
+                },
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def get_trends(self, key: str, max_age: timedelta) -> dict[str, Any] | None:
+        fresh_after = (datetime.now(UTC) - max_age).replace(tzinfo=None)
+        async with self._db.session() as session:
+            result = await session.execute(
+                select(TrendsCacheRow.payload).where(
+                    TrendsCacheRow.keywords == key,
+                    TrendsCacheRow.fetched_at >= fresh_after,
+                )
+            )
+            return result.scalar_one_or_none()
+
+    async def save_trends(self, key: str, payload: dict[str, Any]) -> None:
+        async with self._db.session() as session:
+            now = datetime.now(UTC).replace(tzinfo=None)
+            stmt = pg_insert(TrendsCacheRow).values(
+                keywords=key, payload=payload, fetched_at=now
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["keywords"],
+                set_={"payload": stmt.excluded.payload, "fetched_at": now},
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def get_post_embeddings(
+        self, model: str, text_hashes: dict[int, str]
+    ) -> dict[int, list[float]]:
+        if not text_hashes:
+            return {}
+        async with self._db.session() as session:
+            result = await session.execute(
+                select(
+                    PostEmbeddingRow.post_id,
+                    PostEmbeddingRow.text_hash,
+                    PostEmbeddingRow.vector,
+                ).where(
+                    PostEmbeddingRow.model == model,
+                    PostEmbeddingRow.post_id.in_(list(text_hashes)),
+                )
+            )
+            return {
+                post_id: _unpack_vector(vector)
+                for post_id, text_hash, vector in result.all()
+                if text_hashes.get(post_id) == text_hash
+            }
+
+    async def save_post_embeddings(
+        self, model: str, embeddings: list[PostEmbedding]
+    ) -> None:
+        if not embeddings:
+            return
+        now = datetime.now(UTC).replace(tzinfo=None)
+        rows = [
+            {
+                "post_id": e.post_id,
+                "model": model,
+                "text_hash": e.text_hash,
+                "vector": _pack_vector(e.vector),
+                "dims": len(e.vector),
+                "created_at": now,
+            }
+            for e in embeddings
+        ]
+        async with self._db.session() as session:
+            stmt = pg_insert(PostEmbeddingRow).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["post_id", "model"],
+                set_={
+                    "text_hash": stmt.excluded.text_hash,
+                    "vector": stmt.excluded.vector,
+                    "dims": stmt.excluded.dims,
+                    "created_at": now,
+                },
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def get_llm_response(self, key: str, max_age: timedelta) -> str | None:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        async with self._db.session() as session:
+            # A hit also marks the entry used, which is what eviction orders by.
+            result = await session.execute(
+                update(LlmResponseRow)
+                .where(
+                    LlmResponseRow.key == key,
+                    LlmResponseRow.created_at >= now - max_age,
+                )
+                .values(used_at=now)
+                .returning(LlmResponseRow.response)
+            )
+            response = result.scalar_one_or_none()
+            await session.commit()
+            return response
+
+    async def save_llm_response(self, key: str, model: str, response: str) -> None:
+        async with self._db.session() as session:
+            now = datetime.now(UTC).replace(tzinfo=None)
+            stmt = pg_insert(LlmResponseRow).values(
+                key=key, model=model, response=response, created_at=now, used_at=now
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["key"],
+                set_={
+                    "model": stmt.excluded.model,
+                    "response": stmt.excluded.response,
+                    "created_at": now,
+                    "used_at": now,
+                },
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def evict_llm_responses(self, max_age: timedelta, max_bytes: int) -> int:
+        expired_before = (datetime.now(UTC) - max_age).replace(tzinfo=None)
+        # Running size of fresh entries, most recently used first; everything
+        # past ``max_bytes`` is the least recently used overflow.
+        running = (
+            select(
+                LlmResponseRow.key,
+                func.sum(func.octet_length(LlmResponseRow.response))
+                .over(order_by=(LlmResponseRow.used_at.desc(), LlmResponseRow.key))
+                .label("total_bytes"),
+            )
+            .where(LlmResponseRow.created_at >= expired_before)
+            .subquery()
+        )
+        stmt = delete(LlmResponseRow).where(
+            or_(
+                LlmResponseRow.created_at < expired_before,
+                LlmResponseRow.key.in_(
+                    select(running.c.key).where(running.c.total_bytes > max_bytes)
+                ),
+            )
+        )
+        async with self._db.session() as session:
             result = await session.execute(stmt)
             await session.commit()
             return result.rowcount
@@ -190,10 +684,14 @@ class PostgresPipelineRepository:
 
             await session.commit()
 
-    async def get_existing_tag_slugs(self) -> list[str]:
+    async def get_tag_post_counts(self) -> dict[str, int]:
         async with self._db.session() as session:
-            result = await session.execute(select(TagRow.slug).order_by(TagRow.slug))
-            return [r for (r,) in result]
+            result = await session.execute(
+                select(TagRow.slug, func.count(PostTagRow.post_id))
+                .outerjoin(PostTagRow, PostTagRow.tag_id == TagRow.id)
+                .group_by(TagRow.slug)
+            )
+            return {slug: count for slug, count in result}
 
     async def mark_tagging_failed(self, post_ids: list[int]) -> None:
         async with self._db.session() as session:
@@ -505,3 +1003,11 @@ class PostgresPipelineRepository:
                 )
                 for r in rows
             ]
+
+
+def _pack_vector(vector: list[float]) -> bytes:
+    return struct.pack(f"<{len(vector)}f", *vector)
+
+
+def _unpack_vector(data: bytes) -> list[float]:
+    return list(struct.unpack(f"<{len(data) // 4}f", data))
@@ -1,18 +1,23 @@
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
 
-import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from domain.pipeline.models import RawProduct
+from domain.pipeline.models import FetchCursor, RawProduct
+from outbound.http.client import HttpClient, HttpSession, borrow
 
 logger = logging.getLogger(__name__)
 
 _PH_GRAPHQL_URL = "https://api.producthunt.com/v2/api/graphql"
 
 _POSTS_QUERY = """\
-query RecentProducts($first: Int!) {
-  posts(first: $first, order: NEWEST) {
+query RecentProducts($first: Int!, $after: String) {
+  posts(first: $first, after: $after, order: NEWEST) {
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
     edges {
       node {
         id
@@ -39,30 +44,82 @@ query RecentProducts($first: Int!) {
 
 
 class ProductHuntApiClient:
-    def __init__(self, api_token: str) -> None:
+    def __init__(
+        self,
+        api_token: str,
+        http: HttpClient | None = None,
+        *,
+        max_pages: int = 10,
+    ) -> None:
         self._api_token = api_token
+        self._http = http
+        self._max_pages = max(1, max_pages)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
     async def fetch_recent_products(self, limit: int = 30) -> list[RawProduct]:
         if not self._api_token:
             logger.warning("PRODUCTHUNT_API_TOKEN not set, skipping PH fetch")
             return []
 
-        async with httpx.AsyncClient(timeout=30) as http:
-            resp = await http.post(
-                _PH_GRAPHQL_URL,
-                json={"query": _POSTS_QUERY, "variables": {"first": limit}},
-                headers={
-                    "Authorization": f"Bearer {self._api_token}",
-                    "Content-Type": "application/json",
-                },
-            )
-            resp.raise_for_status()
+        async with borrow(self._http, timeout=30) as http:
+            products, _ = await self._fetch_page(http, limit)
 
-        data = resp.json()
-        edges = (
-            data.get("data", {}).get("posts", {}).get("edges", [])
+        logger.info("Fetched %d products from Product Hunt", len(products))
+        return products
+
+    async def stream_products(
+        self, *, since: FetchCursor | None = None, page_size: int = 30
+    ) -> AsyncIterator[list[RawProduct]]:
+        """Yield pages of products, newest first.
+
+        Without a mark only the first page is fetched. With one, ``after``
+        cursors are followed until a product the mark covers shows up (or
+        ``max_pages`` is hit), so busy days are covered completely and quiet
+        days cost a single request.
+        """
+        if not self._api_token:
+            logger.warning("PRODUCTHUNT_API_TOKEN not set, skipping PH fetch")
+            return
+
+        max_pages = 1 if since is None else self._max_pages
+        after: str | None = None
+        fetched = 0
+        async with borrow(self._http, timeout=30) as http:
+            for _ in range(max_pages):
+                page, after = await self._fetch_page(http, page_size, after)
+                fresh = page if since is None else [p for p in page if not _covers(since, p)]
+                fetched += len(fresh)
+                if fresh:
+                    yield fresh
+                if len(fresh) < len(page) or not after:
+                    break
+            else:
+                if since is not None:
+                    logger.warning(
+                        "Product Hunt: stopped after %d pages before reaching %s",
+                        self._max_pages, since.external_id,
+                    )
+
+        logger.info("Fetched %d products from Product Hunt", fetched)
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=30))
+    async def _fetch_page(
+        self, http: HttpSession, first: int, after: str | None = None
+    ) -> tuple[list[RawProduct], str | None]:
+        resp = await http.post(
+            _PH_GRAPHQL_URL,
+            json={"query": _POSTS_QUERY, "variables": {"first": first, "after": after}},
+            headers={
+                "Authorization": f"Bearer {self._api_token}",
+                "Content-Type": "application/json",
+            },
         )
+        resp.raise_for_status()
+
+        data = resp.json()
+        posts = data.get("data", {}).get("posts", {})
+        edges = posts.get("edges", [])
+        page_info = posts.get("pageInfo") or {}
+        next_cursor = page_info.get("endCursor") if page_info.get("hasNextPage") else None
 
         products: list[RawProduct] = []
         for edge in edges:
@@ -92,5 +149,10 @@ class ProductHuntApiClient:
                 source="producthunt",
             ))
 
-        logger.info("Fetched %d products from Product Hunt", len(products))
-        return products
+        return products, next_cursor
+
+
+def _covers(mark: FetchCursor, product: RawProduct) -> bool:
+    if product.external_id == mark.external_id:
+        return True
+    return product.launched_at is not None and product.launched_at < mark.created_at
@@ -1,12 +1,17 @@
-import asyncio
 import logging
 import re
+from collections.abc import AsyncIterator, Mapping
+from contextlib import aclosing
 from datetime import UTC, datetime
+from typing import Any
 
-import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from domain.pipeline.models import RawPost
+from domain.pipeline.models import FetchCursor, PostEngagement, RawPost
+from domain.pipeline.ports import RawArchive
+from outbound.http.client import HttpClient, HttpSession, borrow
+from outbound.http.ratelimit import AdaptiveRateLimiter, TokenBucket, parse_retry_after
+from shared.concurrency import imap_unordered
 
 logger = logging.getLogger(__name__)
 
@@ -22,63 +27,277 @@ def _safe_permalink(permalink: str) -> str:
 
 REDDIT_PUBLIC_BASE = "https://www.reddit.com"
 
+# 429s wait out Retry-After without spending a tenacity attempt, up to this cap.
+_MAX_RATE_LIMIT_WAITS = 5
+# Used when a 429 carries neither Retry-After nor X-Ratelimit-Reset.
+_DEFAULT_RETRY_AFTER_SECS = 60.0
+# /api/info accepts at most 100 fullnames per request.
+_INFO_BATCH_SIZE = 100
+
 
 class RedditApiClient:
-    def __init__(self, user_agent: str) -> None:
+    def __init__(
+        self,
+        user_agent: str,
+        *,
+        requests_per_minute: int = 30,
+        concurrency: int = 1,
+        max_pages: int = 10,
+        http: HttpClient | None = None,
+        archive: RawArchive | None = None,
+    ) -> None:
         self._user_agent = user_agent
+        self._http = http
+        self._archive = archive
+        self._max_pages = max(1, max_pages)
+        # One limiter per client: every request (including tenacity retries)
+        # draws from the same budget, however many run in parallel. Reddit's
+        # X-Ratelimit-* headers drive it; requests_per_minute paces requests
+        # only until the first response reports the real budget.
+        self._limiter = AdaptiveRateLimiter(TokenBucket.per_minute(requests_per_minute))
+        self._concurrency = max(1, concurrency)
 
     async def fetch_posts(
         self,
         subreddits: list[str],
         limit: int = 100,
         time_filter: str = "week",
+        *,
+        since: dict[str, FetchCursor] | None = None,
     ) -> list[RawPost]:
+        by_subreddit: dict[str, list[RawPost]] = {}
+        async with aclosing(
+            self._stream(subreddits, limit, time_filter, since or {})
+        ) as chunks:
+            async for subreddit, sub_posts in chunks:
+                by_subreddit[subreddit] = sub_posts
+        return [post for s in subreddits for post in by_subreddit.get(s, [])]
+
+    async def stream_posts(
+        self,
+        subreddits: list[str],
+        limit: int = 100,
+        time_filter: str = "week",
+        *,
+        since: dict[str, FetchCursor] | None = None,
+    ) -> AsyncIterator[list[RawPost]]:
+        """Yield each subreddit's posts as soon as that subreddit is done.
+
+        Subreddits finish in whatever order the network allows. A new
+        subreddit is only started once a finished one has been consumed, so
+        a slow consumer throttles fetching instead of buffering results.
+        """
+        async with aclosing(
+            self._stream(subreddits, limit, time_filter, since or {})
+        ) as chunks:
+            async for _, sub_posts in chunks:
+                yield sub_posts
+
+    async def fetch_page(
+        self, subreddit: str, *, after: str | None = None, limit: int = 100
+    ) -> tuple[list[RawPost], str | None]:
+        """One /new.json page (newest first) and the ``after`` token for the next.
+
+        Used by backfills, which page back through history themselves and
+        checkpoint the token between pages.
+        """
+        if not _SUBREDDIT_RE.match(subreddit):
+            raise ValueError(f"Invalid subreddit name: {subreddit!r}")
+        async with borrow(self._http, timeout=30) as http:
+            return await self._fetch_subreddit(http, subreddit, limit, "all", after=after)
+
+    async def _stream(
+        self,
+        subreddits: list[str],
+        limit: int,
+        time_filter: str,
+        since: dict[str, FetchCursor],
+    ) -> AsyncIterator[tuple[str, list[RawPost]]]:
         for name in subreddits:
             if not _SUBREDDIT_RE.match(name):
                 raise ValueError(f"Invalid subreddit name: {name!r}")
-        async with httpx.AsyncClient(timeout=30) as http:
-            posts: list[RawPost] = []
-            for subreddit in subreddits:
-                sub_posts = await self._fetch_subreddit(
-                    http, subreddit, limit, time_filter
+
+        async with borrow(self._http, timeout=30) as http:
+
+            async def _fetch_one(subreddit: str) -> tuple[str, list[RawPost]]:
+                sub_posts = await self._fetch_since(
+                    http, subreddit, limit, time_filter, since.get(subreddit.lower())
                 )
-                posts.extend(sub_posts)
                 logger.info("Fetched %d posts from r/%s", len(sub_posts), subreddit)
-                await asyncio.sleep(2)
+                return subreddit, sub_posts
+
+            async with aclosing(
+                imap_unordered(_fetch_one, subreddits, concurrency=self._concurrency)
+            ) as results:
+                async for item in results:
+                    yield item
 
+    async def _fetch_since(
+        self,
+        http: HttpSession,
+        subreddit: str,
+        limit: int,
+        time_filter: str,
+        mark: FetchCursor | None,
+    ) -> list[RawPost]:
+        """Walk /new.json with ``after`` cursors until the high-water mark is reached.
+
+        Without a mark only the first page is fetched (first run for a
+        subreddit). Paging is capped at ``max_pages`` so a stale mark cannot
+        turn one run into an unbounded crawl.
+        """
+        if mark is None:
+            posts, _ = await self._fetch_subreddit(http, subreddit, limit, time_filter)
             return posts
 
+        posts: list[RawPost] = []
+        after: str | None = None
+        for _ in range(self._max_pages):
+            page, after = await self._fetch_subreddit(
+                http, subreddit, limit, time_filter, after=after
+            )
+            fresh = [p for p in page if not mark.covers(p)]
+            posts.extend(fresh)
+            if len(fresh) < len(page) or not after:
+                break
+        else:
+            logger.warning(
+                "r/%s: stopped after %d pages before reaching high-water mark %s",
+                subreddit, self._max_pages, mark.external_id,
+            )
+        return posts
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def _fetch_subreddit(
         self,
-        http: httpx.AsyncClient,
+        http: HttpSession,
         subreddit: str,
         limit: int,
         time_filter: str,
-    ) -> list[RawPost]:
-        resp = await http.get(
-            f"{REDDIT_PUBLIC_BASE}/r/{subreddit}/new.json",
-            params={"limit": min(limit, 100), "t": time_filter},
-            headers={"User-Agent": self._user_agent},
+        after: str | None = None,
+    ) -> tuple[list[RawPost], str | None]:
+        params: dict[str, str | int] = {"limit": min(limit, 100), "t": time_filter}
+        if after:
+            params["after"] = after
+
+        listing = await self._get_listing(
+            http, f"{REDDIT_PUBLIC_BASE}/r/{subreddit}/new.json", params, f"r/{subreddit}"
+        )
+        if self._archive is not None:
+            await self._archive.append("reddit", {"subreddit": subreddit}, listing)
+        return _parse_listing(listing, subreddit), listing.get("after")
+
+    async def fetch_engagement(self, external_ids: list[str]) -> list[PostEngagement]:
+        """Current score and comment count for stored posts via ``/api/info``.
+
+        Ids are looked up 100 fullnames per request (the endpoint's cap),
+        with batches sharing the client's concurrency and rate budget.
+        Posts Reddit no longer returns (deleted, removed) are omitted.
+        """
+        batches = [
+            external_ids[i : i + _INFO_BATCH_SIZE]
+            for i in range(0, len(external_ids), _INFO_BATCH_SIZE)
+        ]
+        engagement: list[PostEngagement] = []
+        async with borrow(self._http, timeout=30) as http:
+
+            async def _fetch_one(batch: list[str]) -> list[PostEngagement]:
+                return await self._fetch_info(http, batch)
+
+            async with aclosing(
+                imap_unordered(_fetch_one, batches, concurrency=self._concurrency)
+            ) as results:
+                async for batch_engagement in results:
+                    engagement.extend(batch_engagement)
+        logger.info(
+            "Fetched engagement for %d/%d posts in %d requests",
+            len(engagement), len(external_ids), len(batches),
         )
+        return engagement
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
+    async def _fetch_info(self, http: HttpSession, ids: list[str]) -> list[PostEngagement]:
+        listing = await self._get_listing(
+            http,
+            f"{REDDIT_PUBLIC_BASE}/api/info.json",
+            {"id": ",".join(f"t3_{i}" for i in ids)},
+            "api/info",
+        )
+        return [
+            PostEngagement(
+                external_id=data["id"],
+                score=data.get("score", 0),
+                num_comments=data.get("num_comments", 0),
+            )
+            for child in listing.get("children", [])
+            if (data := child.get("data", {})).get("id")
+        ]
+
+    async def _get_listing(
+        self, http: HttpSession, url: str, params: dict[str, str | int], label: str
+    ) -> dict:
+        """GET a listing under the shared limiter, waiting out 429s in place."""
+        for _ in range(_MAX_RATE_LIMIT_WAITS):
+            await self._limiter.acquire()
+            resp = await http.get(
+                url, params=params, headers={"User-Agent": self._user_agent}
+            )
+            self._observe(resp.headers)
+            if resp.status_code != 429:
+                break
+            delay = parse_retry_after(resp.headers.get("retry-after"))
+            if delay is None:
+                delay = _header_float(resp.headers, "x-ratelimit-reset")
+            delay = _DEFAULT_RETRY_AFTER_SECS if delay is None else delay
+            logger.warning("%s rate limited (429), waiting %.0fs", label, delay)
+            self._limiter.pause(delay)
         resp.raise_for_status()
+        return resp.json().get("data", {})
 
-        posts: list[RawPost] = []
-        for child in resp.json().get("data", {}).get("children", []):
-            data = child.get("data", {})
-            posts.append(
-                RawPost(
-                    source="reddit",
-                    external_id=data["id"],
-                    title=data.get("title", ""),
-                    body=data.get("selftext") or None,
-                    external_url=_safe_permalink(data.get("permalink", "")),
-                    external_created_at=datetime.fromtimestamp(
-                        data.get("created_utc", 0), tz=UTC
-                    ),
-                    score=data.get("score", 0),
-                    num_comments=data.get("num_comments", 0),
-                    subreddit=data.get("subreddit", subreddit),
-                )
+    def _observe(self, headers: Mapping[str, str]) -> None:
+        remaining = _header_float(headers, "x-ratelimit-remaining")
+        reset = _header_float(headers, "x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        if remaining < 1:
+            logger.info(
+                "Reddit rate budget spent (used=%s), pausing %.0fs until reset",
+                headers.get("x-ratelimit-used"), reset,
             )
-        return posts
+        self._limiter.update(remaining, reset)
+
+
+def _parse_listing(listing: dict, subreddit: str) -> list[RawPost]:
+    posts: list[RawPost] = []
+    for child in listing.get("children", []):
+        data = child.get("data", {})
+        posts.append(
+            RawPost(
+                source="reddit",
+                external_id=data["id"],
+                title=data.get("title", ""),
+                body=data.get("selftext") or None,
+                external_url=_safe_permalink(data.get("permalink", "")),
+                external_created_at=datetime.fromtimestamp(
+                    data.get("created_utc", 0), tz=UTC
+                ),
+                score=data.get("score", 0),
+                num_comments=data.get("num_comments", 0),
+                subreddit=data.get("subreddit", subreddit),
+                link_url=None if data.get("is_self", True) else data.get("url"),
+            )
+        )
+    return posts
+
+
+def parse_archived(context: dict[str, Any], payload: Any) -> list[RawPost]:
+    """Posts from an archived /new.json listing (see ``outbound.archive``)."""
+    return _parse_listing(payload, context["subreddit"])
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        return None
+
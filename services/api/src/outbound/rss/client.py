@@ -1,13 +1,19 @@
+import asyncio
 import hashlib
 import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
+from typing import Any
 from urllib.parse import urlparse
 
 import feedparser
-import httpx
 
-from domain.pipeline.models import RawPost
+from domain.pipeline.models import FeedFetch, FeedValidators, RawPost
+from domain.pipeline.ports import RawArchive
+from outbound.http.client import HttpClient, HttpSession, borrow
+from shared.concurrency import imap_unordered
 
 logger = logging.getLogger(__name__)
 
@@ -40,43 +46,142 @@ def _is_safe_url(url: str) -> bool:
 
 
 class RssFeedClient:
+    def __init__(
+        self,
+        http: HttpClient | None = None,
+        *,
+        concurrency: int = 4,
+        feed_timeout: float = 30.0,
+        archive: RawArchive | None = None,
+    ) -> None:
+        self._http = http
+        self._archive = archive
+        self._concurrency = max(1, concurrency)
+        self._feed_timeout = feed_timeout
+
     async def fetch_posts(self, feed_urls: list[str]) -> list[RawPost]:
-        posts: list[RawPost] = []
-        async with httpx.AsyncClient(timeout=15, max_redirects=3) as http:
-            for url in feed_urls:
-                if not _is_safe_url(url):
-                    logger.warning("Skipping unsafe RSS feed URL: %s", url)
-                    continue
+        feeds = await self.fetch_feeds(feed_urls)
+        return [post for feed in feeds for post in feed.posts]
+
+    async def fetch_feeds(
+        self,
+        feed_urls: list[str],
+        validators: dict[str, FeedValidators] | None = None,
+    ) -> list[FeedFetch]:
+        by_url: dict[str, FeedFetch] = {}
+        async with aclosing(self.stream_feeds(feed_urls, validators)) as feeds:
+            async for feed in feeds:
+                by_url[feed.url] = feed
+        return [by_url[url] for url in feed_urls if url in by_url]
+
+    async def stream_feeds(
+        self,
+        feed_urls: list[str],
+        validators: dict[str, FeedValidators] | None = None,
+    ) -> AsyncIterator[FeedFetch]:
+        """Fetch feeds conditionally, yielding each one as soon as it is done.
+
+        A feed counts as unchanged on ``304 Not Modified`` or when the body
+        hashes to the stored ``content_hash`` (for servers that ignore
+        validators), and is then yielded with no posts and never parsed.
+        Feeds are fetched concurrently, each within ``feed_timeout``
+        seconds; failed or timed-out feeds are omitted.
+        """
+        validators = validators or {}
+        safe_urls: list[str] = []
+        for url in feed_urls:
+            if _is_safe_url(url):
+                safe_urls.append(url)
+            else:
+                logger.warning("Skipping unsafe RSS feed URL: %s", url)
+
+        async with borrow(self._http, timeout=15, max_redirects=3) as http:
+
+            async def _fetch_one(url: str) -> FeedFetch | None:
                 try:
-                    resp = await http.get(url)
-                    resp.raise_for_status()
-                    feed = feedparser.parse(resp.text)
-                    for entry in feed.entries[:20]:
-                        link = entry.get("link", "")
-                        external_id = hashlib.sha256(
-                            link.encode()
-                        ).hexdigest()
-
-                        published = _parse_published(entry)
-
-                        posts.append(RawPost(
-                            source="rss",
-                            external_id=external_id,
-                            title=entry.get("title", ""),
-                            body=entry.get("summary"),
-                            external_url=link,
-                            external_created_at=published,
-                            score=0,
-                            num_comments=0,
-                        ))
-                    logger.info(
-                        "Fetched %d entries from RSS feed %s",
-                        min(len(feed.entries), 20),
-                        url,
+                    return await asyncio.wait_for(
+                        self._fetch_feed(http, url, validators.get(url)),
+                        timeout=self._feed_timeout,
+                    )
+                except TimeoutError:
+                    logger.warning(
+                        "RSS feed %s exceeded %.0fs budget, skipped",
+                        url, self._feed_timeout,
                     )
                 except Exception:
                     logger.exception("Failed to fetch RSS feed %s", url)
-        return posts
+                return None
+
+            async with aclosing(
+                imap_unordered(_fetch_one, safe_urls, concurrency=self._concurrency)
+            ) as results:
+                async for feed in results:
+                    if feed is not None:
+                        yield feed
+
+    async def _fetch_feed(
+        self, http: HttpSession, url: str, previous: FeedValidators | None
+    ) -> FeedFetch:
+        headers: dict[str, str] = {}
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+
+        resp = await http.get(url, headers=headers, timeout=15)
+        if resp.status_code == 304:
+            logger.info("RSS feed %s not modified (304)", url)
+            return FeedFetch(url=url, posts=[], validators=previous, not_modified=True)
+        resp.raise_for_status()
+
+        current = FeedValidators(
+            url=url,
+            etag=resp.headers.get("etag"),
+            last_modified=resp.headers.get("last-modified"),
+            content_hash=hashlib.sha256(resp.text.encode()).hexdigest(),
+        )
+        if previous is not None and previous.content_hash == current.content_hash:
+            logger.info("RSS feed %s unchanged (same content hash)", url)
+            return FeedFetch(url=url, posts=[], validators=current, not_modified=True)
+
+        if self._archive is not None:
+            await self._archive.append("rss", {"url": url}, resp.text)
+        # feedparser is pure-Python and CPU-bound; keep it off the event loop.
+        posts, total = await asyncio.to_thread(_parse_entries, resp.text)
+        logger.info("Fetched %d entries from RSS feed %s", min(total, 20), url)
+        return FeedFetch(url=url, posts=posts, validators=current)
+
+
+def _parse_entries(text: str) -> tuple[list[RawPost], int]:
+    feed = feedparser.parse(text)
+    posts: list[RawPost] = []
+    for entry in feed.entries[:20]:
+        link = entry.get("link", "")
+        external_id = hashlib.sha256(
+            link.encode()
+        ).hexdigest()
+
+        published = _parse_published(entry)
+
+        posts.append(RawPost(
+            source="rss",
+            external_id=external_id,
+            title=entry.get("title", ""),
+            body=entry.get("summary"),
+            external_url=link,
+            external_created_at=published,
+            score=0,
+            num_comments=0,
+            link_url=link or None,
+        ))
+    return posts, len(feed.entries)
+
+
+def parse_archived(context: dict[str, Any], payload: Any) -> list[RawPost]:
+    """Posts from an archived feed document (see ``outbound.archive``)."""
+    posts, _ = _parse_entries(payload)
+    return posts
 
 
 def _parse_published(entry) -> datetime:
@@ -1,19 +1,52 @@
 import asyncio
 import logging
 import time
+from datetime import timedelta
 from typing import Any
 
+from domain.pipeline.ports import TrendsCache
+
 logger = logging.getLogger(__name__)
 
 _MIN_INTERVAL_SECS = 5.0
 
 
 class GoogleTrendsClient:
-    def __init__(self) -> None:
+    def __init__(
+        self, cache: TrendsCache | None = None, *, cache_ttl_hours: float = 72.0
+    ) -> None:
+        self._cache = cache
+        self._cache_ttl = timedelta(hours=cache_ttl_hours)
         self._last_call: float = 0.0
         self._lock = asyncio.Lock()
+        self._session = None
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
 
     async def get_interest(self, keywords: list[str]) -> dict[str, Any]:
+        """Trends for up to five keywords, served from cache when fresh.
+
+        Concurrent calls for the same keyword set (in any order or case)
+        share one in-flight fetch; only real fetches queue on the rate limit.
+        """
+        key = _cache_key(keywords)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._cached_fetch(key, keywords))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: one caller giving up must not cancel the fetch for the others.
+        return _rekey(await asyncio.shield(task), keywords)
+
+    async def _cached_fetch(self, key: str, keywords: list[str]) -> dict[str, Any]:
+        if self._cache is not None:
+            try:
+                cached = await self._cache.get_trends(key, self._cache_ttl)
+            except Exception:
+                logger.exception("Trends cache read failed")
+                cached = None
+            if cached is not None:
+                return cached
+
         try:
             async with self._lock:
                 # Rate-limit: wait if needed to respect Google's limits
@@ -21,15 +54,27 @@ class GoogleTrendsClient:
                 if elapsed < _MIN_INTERVAL_SECS:
                     await asyncio.sleep(_MIN_INTERVAL_SECS - elapsed)
                 self._last_call = time.monotonic()
-                return await asyncio.to_thread(self._fetch, keywords)
+                result = await asyncio.to_thread(self._fetch, keywords)
         except Exception:
             logger.warning("Google Trends fetch failed for %s (skipped)", keywords)
             return {}
 
+        if self._cache is not None:
+            try:
+                await self._cache.save_trends(key, result)
+            except Exception:
+                logger.exception("Trends cache write failed")
+        return result
+
     def _fetch(self, keywords: list[str]) -> dict[str, Any]:
         from pytrends.request import TrendReq
 
-        pytrends = TrendReq(hl="en-US")
+        # One long-lived session (cookies, connection pool). Fetches are
+        # serialized by ``_lock``, so the non-thread-safe TrendReq is never
+        # used from two worker threads at once.
+        if self._session is None:
+            self._session = TrendReq(hl="en-US")
+        pytrends = self._session
         kw = keywords[:5]
         pytrends.build_payload(kw, timeframe="today 3-m")
 
@@ -58,3 +103,19 @@ class GoogleTrendsClient:
                 result["related_queries"][k] = []
 
         return result
+
+
+def _cache_key(keywords: list[str]) -> str:
+    """Order- and case-insensitive key for the (first five) keywords."""
+    return "|".join(sorted({k.strip().lower() for k in keywords[:5]}))
+
+
+def _rekey(result: dict[str, Any], keywords: list[str]) -> dict[str, Any]:
+    # A cached or shared result may spell keywords differently from this caller.
+    by_folded = {k.strip().lower(): k for k in keywords[:5]}
+    return {
+        section: {by_folded.get(k.strip().lower(), k): v for k, v in values.items()}
+        if isinstance(values, dict)
+        else values
+        for section, values in result.items()
+    }
@@ -0,0 +1,86 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+
+async def imap_unordered[T, R](
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    concurrency: int,
+) -> AsyncIterator[R]:
+    """Run ``func`` over ``items`` with bounded concurrency, yielding results as they finish.
+
+    At most ``concurrency`` calls are pending at once, finished ones
+    included, so a slow consumer applies backpressure instead of letting
+    results pile up in memory. The first failure propagates once every
+    call finished alongside it has been collected; unfinished calls are
+    cancelled and awaited when the iterator is closed or raises.
+    """
+    source = iter(items)
+    pending: set[asyncio.Task[R]] = set()
+
+    def _fill() -> None:
+        while len(pending) < max(1, concurrency):
+            try:
+                item = next(source)
+            except StopIteration:
+                return
+            pending.add(asyncio.ensure_future(func(item)))
+
+    _fill()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            errors = [task.exception() for task in done if not task.cancelled()]
+            error = next((exc for exc in errors if exc is not None), None)
+            if error is not None:
+                raise error
+            for task in done:
+                pending.discard(task)
+                _fill()
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+class AdaptiveLimit:
+    """Concurrency limit that halves on overload and grows back on success.
+
+    ``async with limit:`` holds one of the currently allowed slots.
+    ``decrease()`` halves the allowance (never below one) when the upstream
+    pushes back; after as many consecutive ``increase()`` calls as the
+    current allowance, it grows by one again, up to the starting value.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._max = max(1, limit)
+        self._limit = self._max
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def increase(self) -> None:
+        self._successes += 1
+        if self._successes >= self._limit and self._limit < self._max:
+            self._limit += 1
+            self._successes = 0
+
+    def decrease(self) -> None:
+        self._limit = max(1, self._limit // 2)
+        self._successes = 0
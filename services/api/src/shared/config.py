@@ -1,5 +1,6 @@
 import functools
 import re
+from typing import Literal
 
 from pydantic import model_validator
 from pydantic_settings import BaseSettings
@@ -13,8 +14,28 @@ class Settings(BaseSettings):
     API_DEBUG: bool = False
     API_INTERNAL_SECRET: str = ""
 
+    # Outbound HTTP (shared pooled client)
+    HTTP_TIMEOUT_SECS: float = 30.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 10
+    HTTP_HTTP2: bool = False
+    # Fetch scheduler: global in-flight cap, shared round-robin across sources,
+    # and per-host "host=concurrency[/requests_per_minute]" overrides (hosts not
+    # listed get HTTP_MAX_CONNECTIONS_PER_HOST and no rate limit)
+    HTTP_MAX_IN_FLIGHT: int = 32
+    HTTP_HOST_LIMITS: str = "play.google.com=4/120"
+    # Record/replay of fetch traffic for offline benchmarks (pipeline CLI only)
+    HTTP_FIXTURES_MODE: Literal["off", "record", "replay"] = "off"
+    HTTP_FIXTURES_DIR: str = "fixtures/http"
+    HTTP_FIXTURES_LATENCY_MS: int = 0
+    HTTP_FIXTURES_ERROR_RATE: float = 0.0
+
     # Reddit API
     REDDIT_USER_AGENT: str = "idea-fork/0.1.0"
+    # Pacing until Reddit's X-Ratelimit-* headers report the real budget
+    REDDIT_REQUESTS_PER_MINUTE: int = 30
+    REDDIT_FETCH_CONCURRENCY: int = 4
 
     # Pipeline
     PIPELINE_SUBREDDITS: str = (
@@ -42,21 +63,52 @@ class Settings(BaseSettings):
         "marketing"
     )
     PIPELINE_FETCH_LIMIT: int = 25
+    # Max /new.json pages walked per subreddit to catch up to its high-water mark
+    PIPELINE_FETCH_MAX_PAGES: int = 10
+    # Reddit posts younger than this get score/comments refreshed via /api/info
+    PIPELINE_ENGAGEMENT_MAX_AGE_DAYS: int = 7
+    # New posts sharing a canonical URL or content fingerprint with a post
+    # created within this many hours are linked to it instead of being tagged
+    PIPELINE_DEDUP_WINDOW_HOURS: int = 72
+    # Tagging: batches sent to the LLM at once (halved on rate limits), the
+    # estimated prompt tokens per batch, and existing tags offered per batch
+    PIPELINE_TAG_CONCURRENCY: int = 4
+    PIPELINE_TAG_TOKEN_BUDGET: int = 4000
+    PIPELINE_TAG_VOCABULARY_SIZE: int = 150
+    # Backfill: partitions (subreddits/feeds) fetched at once, posts per upsert,
+    # and /new.json pages per subreddit per invocation (re-run to continue)
+    PIPELINE_BACKFILL_CONCURRENCY: int = 4
+    PIPELINE_BACKFILL_BATCH_SIZE: int = 500
+    PIPELINE_BACKFILL_MAX_PAGES: int = 10
+    # Raw source payloads are archived here for `pipeline_cli reprocess`; empty = off
+    PIPELINE_ARCHIVE_DIR: str = ""
 
     # RSS
     PIPELINE_RSS_FEEDS: str = "https://hnrss.org/newest?points=50,https://techcrunch.com/feed/"
+    PIPELINE_RSS_CONCURRENCY: int = 4
+    PIPELINE_RSS_FEED_TIMEOUT_SECS: float = 30.0
 
     # Gemini
     GOOGLE_API_KEY: str = ""
     LLM_MODEL: str = "gemini-2.5-flash"
     LLM_LITE_MODEL: str = "gemini-2.5-flash-lite"
     LLM_BRIEF_TEMPERATURE: float = 0.9
+    # Response cache for Gemini calls, so retried or resumed runs don't pay twice
+    LLM_CACHE_BACKEND: Literal["off", "disk", "postgres"] = "postgres"
+    LLM_CACHE_DIR: str = ".cache/llm"
+    LLM_CACHE_TTL_HOURS: float = 168.0
+    LLM_CACHE_MAX_MB: int = 256
 
     # App Store / Play Store
     PIPELINE_APPSTORE_KEYWORDS: str = ""
     PIPELINE_APPSTORE_REVIEW_PAGES: int = 1
     PIPELINE_PLAYSTORE_REVIEW_COUNT: int = 30
+    PIPELINE_PLAYSTORE_DETAIL_TTL_DAYS: int = 30
+    PIPELINE_PLAYSTORE_DETAIL_CONCURRENCY: int = 4
+    PIPELINE_TRENDS_CACHE_TTL_HOURS: float = 72.0
     PIPELINE_APPSTORE_MAX_AGE_DAYS: int = 365
+    PIPELINE_APPSTORE_REQUESTS_PER_MINUTE: int = 60
+    PIPELINE_APPSTORE_CONCURRENCY: int = 4
 
     # Product Hunt
     PRODUCTHUNT_API_TOKEN: str = ""
@@ -0,0 +1,56 @@
+"""Tests for domain/pipeline/dedup.py — canonical URLs and content fingerprints."""
+from domain.pipeline.dedup import canonical_url, content_fingerprint
+
+
+def test_canonical_url_ignores_scheme_www_fragment_and_trailing_slash():
+    assert canonical_url("https://www.Example.com/a/story/#comments") == "example.com/a/story"
+    assert canonical_url("http://example.com/a/story") == "example.com/a/story"
+
+
+def test_canonical_url_drops_tracking_params_and_sorts_the_rest():
+    url = "https://example.com/p?utm_source=hn&b=2&fbclid=x&a=1&ref=rss"
+    assert canonical_url(url) == "example.com/p?a=1&b=2"
+
+
+def test_canonical_url_keeps_non_default_port():
+    assert canonical_url("https://example.com:8443/p") == "example.com:8443/p"
+    assert canonical_url("https://example.com:443/p") == "example.com/p"
+
+
+def test_canonical_url_rejects_non_http_and_empty():
+    assert canonical_url(None) is None
+    assert canonical_url("") is None
+    assert canonical_url("mailto:someone@example.com") is None
+    assert canonical_url("https://example.com:notaport/") is None
+
+
+def test_content_fingerprint_ignores_case_and_punctuation():
+    a = content_fingerprint("Show HN: We built an open-source CRM for agencies", None)
+    b = content_fingerprint("show hn — we built an open source CRM, for agencies!", "other")
+    assert a is not None
+    assert a == b
+
+
+def test_content_fingerprint_short_title_includes_body():
+    a = content_fingerprint("Need advice", "Our churn doubled after the pricing change")
+    b = content_fingerprint("Need advice", "Looking for a cheaper invoicing tool")
+    assert a != b
+
+
+def test_content_fingerprint_short_title_without_body_is_none():
+    assert content_fingerprint("Great app", None) is None
+    assert content_fingerprint("", "") is None
+
+
+def test_content_fingerprint_short_generic_text_is_none():
+    """Generic short reviews would otherwise collide across apps and sources."""
+    assert content_fingerprint("", "Nice app") is None
+    assert content_fingerprint("", "nice app!") is None
+    assert content_fingerprint("Great app", "Love it") is None
+
+
+def test_content_fingerprint_skips_store_reviews():
+    title, body = "Crashes every time I open the camera tab", "Please fix this"
+    assert content_fingerprint(title, body, source="reddit") is not None
+    assert content_fingerprint(title, body, source="app_store") is None
+    assert content_fingerprint(title, body, source="play_store") is None
@@ -1,11 +1,12 @@
 """Tests for domain/pipeline/models.py — pure dataclasses and PipelineRunResult."""
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timezone
 
 import pytest
 
 from domain.pipeline.models import (
     BriefDraft,
     ClusteringResult,
+    FetchCursor,
     PipelineRunResult,
     RawPost,
     RawProduct,
@@ -401,3 +402,31 @@ def test_pipeline_run_result_errors_list_is_independent_per_instance():
     assert r1.has_errors is True
     assert r2.has_errors is False
     assert r2.errors == []
+
+
+# ---------------------------------------------------------------------------
+# FetchCursor
+# ---------------------------------------------------------------------------
+
+
+def _post_at(external_id: str, day: int) -> RawPost:
+    return RawPost(
+        source="app_store",
+        external_id=external_id,
+        title="",
+        body=None,
+        external_url="https://apps.apple.com/app/id1",
+        external_created_at=datetime(2026, 2, day, tzinfo=UTC),
+        score=5,
+        num_comments=0,
+    )
+
+
+def test_fetch_cursor_covers_mark_and_older_posts():
+    mark = FetchCursor(external_id="m", created_at=datetime(2026, 2, 10, tzinfo=UTC))
+
+    assert mark.covers(_post_at("m", 10)) is True
+    assert mark.covers(_post_at("old", 9)) is True
+    assert mark.covers(_post_at("new", 11)) is False
+    # Same timestamp, different id: a sibling posted in the same second is still new.
+    assert mark.covers(_post_at("sibling", 10)) is False
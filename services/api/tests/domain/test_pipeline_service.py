@@ -1,15 +1,28 @@
 """Tests for domain/pipeline/service.py — PipelineService."""
-from unittest.mock import AsyncMock, call
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
 from domain.pipeline.models import (
+    BackfillCheckpoint,
     BriefDraft,
     ClusteringResult,
+    FeedFetch,
+    FeedValidators,
+    LlmCacheStats,
     PipelineRunResult,
     TaggingResult,
+    UpsertCounts,
+)
+from domain.pipeline.ports import LlmRateLimitedError
+from domain.pipeline.service import (
+    TAG_RATE_LIMIT_RETRIES,
+    TAG_VOCABULARY_SIZE,
+    TAGGING_BATCH_SIZE,
+    PipelineService,
 )
-from domain.pipeline.service import PipelineService, TAGGING_BATCH_SIZE
 from tests.conftest import make_post
 
 
@@ -22,10 +35,15 @@ def make_repo(*, locked: bool = True) -> AsyncMock:
     repo = AsyncMock()
     repo.acquire_advisory_lock = AsyncMock(return_value=locked)
     repo.release_advisory_lock = AsyncMock(return_value=None)
-    repo.upsert_posts = AsyncMock(return_value=0)
+    repo.upsert_posts = AsyncMock(return_value=UpsertCounts())
     repo.upsert_products = AsyncMock(return_value=0)
+    repo.link_duplicates = AsyncMock(return_value=0)
+    repo.get_fetch_cursors = AsyncMock(return_value={})
+    repo.save_fetch_cursors = AsyncMock(return_value=None)
+    repo.get_feed_validators = AsyncMock(return_value={})
+    repo.save_feed_validators = AsyncMock(return_value=None)
     repo.get_pending_posts = AsyncMock(return_value=[])
-    repo.get_existing_tag_slugs = AsyncMock(return_value=[])
+    repo.get_tag_post_counts = AsyncMock(return_value={})
     repo.get_tagged_posts_without_cluster = AsyncMock(return_value=[])
     repo.get_clusters_without_briefs = AsyncMock(return_value=[])
     repo.save_tagging_results = AsyncMock(return_value=None)
@@ -36,9 +54,16 @@ def make_repo(*, locked: bool = True) -> AsyncMock:
     return repo
 
 
-def make_reddit(*, posts=None) -> AsyncMock:
+async def _stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def make_reddit(*, posts=None, chunks=None) -> AsyncMock:
     reddit = AsyncMock()
-    reddit.fetch_posts = AsyncMock(return_value=posts if posts is not None else [])
+    if chunks is None:
+        chunks = [posts] if posts else []
+    reddit.stream_posts = MagicMock(side_effect=lambda *a, **kw: _stream(chunks))
     return reddit
 
 
@@ -47,12 +72,18 @@ def make_llm() -> AsyncMock:
     llm.tag_posts = AsyncMock(return_value=[])
     llm.cluster_posts = AsyncMock(return_value=[])
     llm.synthesize_brief = AsyncMock(return_value=None)
+    llm.cache_stats = MagicMock(return_value=LlmCacheStats())
     return llm
 
 
-def make_rss(*, posts=None) -> AsyncMock:
+def make_rss(*, posts=None, feeds=None) -> AsyncMock:
     rss = AsyncMock()
-    rss.fetch_posts = AsyncMock(return_value=posts if posts is not None else [])
+    if feeds is None:
+        feeds = (
+            [FeedFetch(url="https://feed.example/rss", posts=posts, validators=None)]
+            if posts else []
+        )
+    rss.stream_feeds = MagicMock(side_effect=lambda *a, **kw: _stream(feeds))
     return rss
 
 
@@ -64,7 +95,8 @@ def make_trends(*, data=None) -> AsyncMock:
 
 def make_producthunt(*, products=None) -> AsyncMock:
     ph = AsyncMock()
-    ph.fetch_recent_products = AsyncMock(return_value=products if products is not None else [])
+    pages = [products] if products else []
+    ph.stream_products = MagicMock(side_effect=lambda *a, **kw: _stream(pages))
     return ph
 
 
@@ -97,7 +129,7 @@ def make_brief_draft(title: str = "Test Brief") -> BriefDraft:
 
 def make_service(
     repo=None, reddit=None, llm=None, rss=None,
-    trends=None, producthunt=None, subreddits=None,
+    trends=None, producthunt=None, subreddits=None, **kwargs,
 ) -> PipelineService:
     return PipelineService(
         repo=repo or make_repo(),
@@ -108,6 +140,7 @@ def make_service(
         producthunt=producthunt or make_producthunt(),
         subreddits=subreddits or ["saas", "startups"],
         fetch_limit=50,
+        **kwargs,
     )
 
 
@@ -128,7 +161,7 @@ async def test_run_skips_all_stages_when_lock_not_acquired():
     assert result.has_errors is True
     assert any("advisory lock" in e.lower() for e in result.errors)
     repo.release_advisory_lock.assert_not_called()
-    reddit.fetch_posts.assert_not_called()
+    reddit.stream_posts.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -155,6 +188,19 @@ async def test_run_releases_lock_even_when_stage_raises():
     assert result.has_errors is True
 
 
+@pytest.mark.asyncio
+async def test_run_reports_llm_cache_counts_for_this_run_only():
+    llm = make_llm()
+    llm.cache_stats = MagicMock(
+        side_effect=[LlmCacheStats(hits=4, misses=10), LlmCacheStats(hits=7, misses=12)]
+    )
+    svc = make_service(repo=make_repo(locked=True), llm=llm)
+
+    result = await svc.run()
+
+    assert (result.llm_cache_hits, result.llm_cache_misses) == (3, 2)
+
+
 # ---------------------------------------------------------------------------
 # Stage fetch
 # ---------------------------------------------------------------------------
@@ -178,7 +224,7 @@ async def test_stage_fetch_records_fetched_count():
     )
     reddit = make_reddit(posts=[raw_post, raw_post])
     repo = make_repo()
-    repo.upsert_posts = AsyncMock(return_value=2)
+    repo.upsert_posts = AsyncMock(return_value=UpsertCounts(inserted=2))
     svc = make_service(repo=repo, reddit=reddit)
 
     result = await svc.run()
@@ -204,7 +250,7 @@ async def test_stage_fetch_no_posts_skips_upsert():
 @pytest.mark.asyncio
 async def test_stage_fetch_error_recorded_continues_pipeline():
     reddit = make_reddit()
-    reddit.fetch_posts = AsyncMock(side_effect=RuntimeError("network error"))
+    reddit.stream_posts = MagicMock(side_effect=RuntimeError("network error"))
     repo = make_repo()
     svc = make_service(repo=repo, reddit=reddit)
 
@@ -245,7 +291,7 @@ async def test_stage_fetch_includes_rss_posts():
     reddit = make_reddit(posts=[reddit_post])
     rss = make_rss(posts=[rss_post])
     repo = make_repo()
-    repo.upsert_posts = AsyncMock(return_value=2)
+    repo.upsert_posts = AsyncMock(return_value=UpsertCounts(inserted=2))
 
     svc = PipelineService(
         repo=repo,
@@ -385,8 +431,8 @@ async def test_stage_tag_batch_error_message_includes_batch_size():
 
 
 @pytest.mark.asyncio
-async def test_stage_tag_second_batch_succeeds_first_fails():
-    """First batch fails, second succeeds — both are counted correctly."""
+async def test_stage_tag_failed_batch_is_bisected_and_halves_resent():
+    """An unparseable reply is recovered by re-sending the batch in halves."""
     first_batch = [make_post(id=i) for i in range(1, TAGGING_BATCH_SIZE + 1)]
     second_batch = [make_post(id=TAGGING_BATCH_SIZE + 1)]
     all_posts = first_batch + second_batch
@@ -400,7 +446,7 @@ async def test_stage_tag_second_batch_succeeds_first_fails():
         nonlocal call_count
         call_count += 1
         if call_count == 1:
-            raise RuntimeError("first batch error")
+            raise ValueError("first batch error")
         return [make_tagging_result(p.id) for p in batch]
 
     llm = make_llm()
@@ -410,41 +456,217 @@ async def test_stage_tag_second_batch_succeeds_first_fails():
 
     result = await svc.run()
 
-    assert result.posts_tagged == 1
-    assert result.has_errors is True
-    assert any("Tag batch" in e for e in result.errors)
-    # New format: exception class and message must appear in the error string
+    assert result.posts_tagged == len(all_posts)
+    assert not any("Tag batch" in e for e in result.errors)
+    sizes = sorted(len(c.args[0]) for c in llm.tag_posts.call_args_list)
+    assert sizes == [1, TAGGING_BATCH_SIZE // 2, TAGGING_BATCH_SIZE // 2, TAGGING_BATCH_SIZE]
+    repo.mark_tagging_failed.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stage_tag_bisection_isolates_bad_post():
+    """Only the post that keeps failing is marked failed; the rest are saved."""
+    posts = [make_post(id=i) for i in range(1, 9)]
+    repo = make_repo()
+    repo.get_pending_posts = AsyncMock(return_value=posts)
+
+    async def tag_side_effect(batch, **kw):
+        if any(p.id == 5 for p in batch):
+            raise ValueError("bad json from llm")
+        return [make_tagging_result(p.id) for p in batch]
+
+    llm = make_llm()
+    llm.tag_posts = AsyncMock(side_effect=tag_side_effect)
+
+    svc = make_service(repo=repo, llm=llm)
+
+    result = await svc.run()
+
+    assert result.posts_tagged == 7
+    saved = sorted(r.post_id for c in repo.save_tagging_results.call_args_list for r in c.args[0])
+    assert saved == [1, 2, 3, 4, 6, 7, 8]
+    repo.mark_tagging_failed.assert_called_once_with([5])
     error = next(e for e in result.errors if "Tag batch" in e)
-    assert "RuntimeError" in error
-    assert "first batch error" in error
-    repo.mark_tagging_failed.assert_called_once()
+    assert error == "Tag batch failed (1 posts): ValueError: bad json from llm"
 
 
 @pytest.mark.asyncio
-async def test_stage_tag_sleeps_after_each_batch():
-    """asyncio.sleep(0.3) must be called once per batch, even on success."""
-    from unittest.mock import patch as mock_patch
+async def test_stage_tag_outage_fails_whole_batch_without_bisecting():
+    """Errors unrelated to post content (5xx, auth, network) are not bisected."""
+    posts = [make_post(id=i) for i in range(1, 9)]
+    repo = make_repo()
+    repo.get_pending_posts = AsyncMock(return_value=posts)
+
+    llm = make_llm()
+    llm.tag_posts = AsyncMock(side_effect=ConnectionError("503 Service Unavailable"))
+
+    svc = make_service(repo=repo, llm=llm)
+
+    result = await svc.run()
+
+    llm.tag_posts.assert_called_once()
+    repo.mark_tagging_failed.assert_called_once_with(list(range(1, 9)))
+    error = next(e for e in result.errors if "Tag batch" in e)
+    assert error.startswith("Tag batch failed (8 posts): ConnectionError")
+
+
+@pytest.mark.asyncio
+async def test_stage_tag_bisects_when_retries_wrap_a_content_error():
+    """Client retry wrappers keep the unparseable reply as their cause."""
+    posts = [make_post(id=1), make_post(id=2)]
+    repo = make_repo()
+    repo.get_pending_posts = AsyncMock(return_value=posts)
+
+    async def tag_side_effect(batch, **kw):
+        if len(batch) > 1:
+            raise RuntimeError("retries exhausted") from ValueError("bad json")
+        return [make_tagging_result(p.id) for p in batch]
+
+    llm = make_llm()
+    llm.tag_posts = AsyncMock(side_effect=tag_side_effect)
+
+    svc = make_service(repo=repo, llm=llm)
+
+    result = await svc.run()
+
+    assert result.posts_tagged == 2
+    assert llm.tag_posts.call_count == 3
+    repo.mark_tagging_failed.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stage_tag_save_failure_is_not_bisected():
+    posts = [make_post(id=1), make_post(id=2)]
+    repo = make_repo()
+    repo.get_pending_posts = AsyncMock(return_value=posts)
+    repo.save_tagging_results = AsyncMock(side_effect=RuntimeError("db down"))
 
-    posts = [make_post(id=i) for i in range(1, TAGGING_BATCH_SIZE + 6)]  # 2 batches
+    llm = make_llm()
+    llm.tag_posts = AsyncMock(return_value=[make_tagging_result(1), make_tagging_result(2)])
+
+    svc = make_service(repo=repo, llm=llm)
+
+    result = await svc.run()
+
+    llm.tag_posts.assert_called_once()
+    repo.mark_tagging_failed.assert_called_once_with([1, 2])
+    assert any("RuntimeError: db down" in e for e in result.errors)
+
+
+@pytest.mark.asyncio
+async def test_stage_tag_passes_all_tags_when_vocabulary_is_small():
+    posts = [make_post(id=1)]
     repo = make_repo()
     repo.get_pending_posts = AsyncMock(return_value=posts)
+    repo.get_tag_post_counts = AsyncMock(return_value={"saas": 4, "ai-ml": 9})
 
     llm = make_llm()
-    llm.tag_posts = AsyncMock(side_effect=lambda batch, **kw: [make_tagging_result(p.id) for p in batch])
+    llm.tag_posts = AsyncMock(return_value=[make_tagging_result(1)])
 
     svc = make_service(repo=repo, llm=llm)
+    await svc.run()
+
+    llm.tag_posts.assert_called_once_with(posts, existing_tags=["ai-ml", "saas"])
+
+
+@pytest.mark.asyncio
+async def test_stage_tag_offers_relevant_then_popular_tags_per_batch():
+    """Large tag tables are cut to the batch's matching tags, topped up by usage."""
+    posts = [make_post(id=1, title="Stripe billing is painful", body="Invoices keep failing")]
+    tag_counts = {f"filler-{i}": 1 for i in range(TAG_VOCABULARY_SIZE * 10)}
+    tag_counts |= {"billing": 2, "stripe-billing": 1, "saas": 50, "pricing": 40}
+
+    repo = make_repo()
+    repo.get_pending_posts = AsyncMock(return_value=posts)
+    repo.get_tag_post_counts = AsyncMock(return_value=tag_counts)
+
+    llm = make_llm()
+    llm.tag_posts = AsyncMock(return_value=[make_tagging_result(1)])
+
+    svc = make_service(repo=repo, llm=llm, tag_vocabulary_size=4)
+    await svc.run()
+
+    llm.tag_posts.assert_called_once_with(
+        posts, existing_tags=["billing", "pricing", "saas", "stripe-billing"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_stage_tag_splits_batches_by_token_budget():
+    """Long posts fill the token budget before the post-count cap."""
+    posts = [make_post(id=i, body="x" * 2000) for i in range(1, 6)]
+    repo = make_repo()
+    repo.get_pending_posts = AsyncMock(return_value=posts)
+
+    llm = make_llm()
+    llm.tag_posts = AsyncMock(
+        side_effect=lambda batch, **kw: [make_tagging_result(p.id) for p in batch]
+    )
+
+    # Each post costs ~160 estimated tokens (body truncated to 500 chars).
+    svc = make_service(repo=repo, llm=llm, tag_token_budget=350)
+    result = await svc.run()
+
+    assert result.posts_tagged == 5
+    sizes = [len(c.args[0]) for c in llm.tag_posts.call_args_list]
+    assert sizes == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_stage_tag_runs_batches_concurrently_up_to_limit():
+    posts = [make_post(id=i) for i in range(1, TAGGING_BATCH_SIZE * 5 + 1)]
+    repo = make_repo()
+    repo.get_pending_posts = AsyncMock(return_value=posts)
+
+    in_flight = 0
+    peak = 0
+
+    async def tag(batch, **kw):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [make_tagging_result(p.id) for p in batch]
+
+    llm = make_llm()
+    llm.tag_posts = AsyncMock(side_effect=tag)
+
+    svc = make_service(repo=repo, llm=llm, tag_concurrency=3)
+    result = await svc.run()
 
+    assert result.posts_tagged == len(posts)
+    assert llm.tag_posts.call_count == 5
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_stage_tag_retries_rate_limited_batch_after_backoff():
+    from unittest.mock import patch as mock_patch
+
+    posts = [make_post(id=1), make_post(id=2)]
+    repo = make_repo()
+    repo.get_pending_posts = AsyncMock(return_value=posts)
+
+    llm = make_llm()
+    llm.tag_posts = AsyncMock(side_effect=[
+        LlmRateLimitedError("429"),
+        [make_tagging_result(1), make_tagging_result(2)],
+    ])
+
+    svc = make_service(repo=repo, llm=llm)
     with mock_patch("domain.pipeline.service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-        await svc.run()
+        result = await svc.run()
 
-    # 2 batches → 2 sleep calls
-    assert mock_sleep.call_count == 2
-    mock_sleep.assert_called_with(0.3)
+    assert result.posts_tagged == 2
+    assert not any("Tag batch" in e for e in result.errors)
+    assert llm.tag_posts.call_count == 2
+    mock_sleep.assert_awaited_once()
+    repo.mark_tagging_failed.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_stage_tag_sleeps_after_failed_batch():
-    """asyncio.sleep(0.3) must be called even when a batch raises an exception."""
+async def test_stage_tag_marks_batch_failed_when_rate_limit_persists():
     from unittest.mock import patch as mock_patch
 
     posts = [make_post(id=1)]
@@ -452,14 +674,18 @@ async def test_stage_tag_sleeps_after_failed_batch():
     repo.get_pending_posts = AsyncMock(return_value=posts)
 
     llm = make_llm()
-    llm.tag_posts = AsyncMock(side_effect=RuntimeError("fail"))
+    llm.tag_posts = AsyncMock(side_effect=LlmRateLimitedError("quota exceeded"))
 
     svc = make_service(repo=repo, llm=llm)
-
     with mock_patch("domain.pipeline.service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-        await svc.run()
+        result = await svc.run()
 
-    mock_sleep.assert_called_once_with(0.3)
+    assert llm.tag_posts.call_count == TAG_RATE_LIMIT_RETRIES + 1
+    delays = [c.args[0] for c in mock_sleep.await_args_list]
+    assert delays == sorted(delays) and delays[0] < delays[-1]
+    repo.mark_tagging_failed.assert_called_once_with([1])
+    error = next(e for e in result.errors if "Tag batch" in e)
+    assert "LlmRateLimitedError: quota exceeded" in error
 
 
 @pytest.mark.asyncio
@@ -701,7 +927,7 @@ async def test_full_pipeline_run_happy_path():
     tagging_result = [make_tagging_result(1)]
 
     repo = make_repo()
-    repo.upsert_posts = AsyncMock(return_value=1)
+    repo.upsert_posts = AsyncMock(return_value=UpsertCounts(inserted=1))
     repo.get_pending_posts = AsyncMock(return_value=[post])
     repo.get_tagged_posts_without_cluster = AsyncMock(return_value=[post])
     repo.get_clusters_without_briefs = AsyncMock(return_value=clusters_data)
@@ -827,7 +1053,7 @@ async def test_stage_fetch_producthunt_error_recorded_continues():
     """Product Hunt failure should add error and let pipeline continue."""
     repo = make_repo()
     ph = make_producthunt()
-    ph.fetch_recent_products = AsyncMock(side_effect=RuntimeError("PH API down"))
+    ph.stream_products = MagicMock(side_effect=RuntimeError("PH API down"))
 
     svc = make_service(repo=repo, producthunt=ph)
     result = await svc.run()
@@ -925,6 +1151,97 @@ async def test_stage_brief_keywords_fallback_to_label_when_all_words_are_stop_wo
     trends.get_interest.assert_called_once_with(["is"])
 
 
+# ---------------------------------------------------------------------------
+# Stage brief — Trends keyword coalescing across clusters
+# ---------------------------------------------------------------------------
+
+
+def test_pack_keywords_dedupes_case_insensitively_into_full_payloads():
+    from domain.pipeline.service import _pack_keywords
+
+    payloads = _pack_keywords([
+        ["saas", "crm", "invoicing"],
+        ["CRM", "billing", "SaaS", "payroll"],
+        ["payroll", "hr software"],
+    ])
+
+    assert payloads == [
+        ["saas", "crm", "invoicing", "billing", "payroll"],
+        ["hr software"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stage_brief_shares_trends_payloads_across_clusters():
+    posts = [make_post(id=1)]
+    clusters_data = [
+        (10, "A", "S", ["saas", "crm", "invoicing"], posts),
+        (11, "B", "S", ["CRM", "billing", "payroll"], posts),
+        (12, "C", "S", ["payroll", "hr software"], posts),
+    ]
+    repo = make_repo()
+    repo.get_clusters_without_briefs = AsyncMock(return_value=clusters_data)
+    repo.find_related_products = AsyncMock(return_value=[])
+
+    async def get_interest(keywords):
+        return {
+            "avg_interest": {k: float(len(k)) for k in keywords},
+            "trend_direction": {k: "rising" for k in keywords},
+        }
+
+    trends = make_trends()
+    trends.get_interest = AsyncMock(side_effect=get_interest)
+    llm = make_llm()
+    llm.synthesize_brief = AsyncMock(return_value=make_brief_draft())
+
+    svc = make_service(repo=repo, trends=trends, llm=llm)
+    result = await svc.run()
+
+    assert result.briefs_generated == 3
+    assert trends.get_interest.await_args_list == [
+        call(["saas", "crm", "invoicing", "billing", "payroll"]),
+        call(["hr software"]),
+    ]
+    by_label = {
+        c.args[0]: c.kwargs["trends_data"] for c in llm.synthesize_brief.call_args_list
+    }
+    # Each cluster sees only its own keywords, spelled the way it asked.
+    assert by_label["B"]["avg_interest"] == {"CRM": 3.0, "billing": 7.0, "payroll": 7.0}
+    assert by_label["C"]["avg_interest"] == {"payroll": 7.0, "hr software": 11.0}
+
+
+@pytest.mark.asyncio
+async def test_stage_brief_failed_payload_only_affects_clusters_that_need_it():
+    posts = [make_post(id=1)]
+    clusters_data = [
+        (10, "A", "S", ["a1", "a2", "a3", "a4", "a5"], posts),
+        (11, "B", "S", ["b1"], posts),
+    ]
+    repo = make_repo()
+    repo.get_clusters_without_briefs = AsyncMock(return_value=clusters_data)
+    repo.find_related_products = AsyncMock(return_value=[])
+
+    async def get_interest(keywords):
+        if "b1" in keywords:
+            raise RuntimeError("trends API down")
+        return {"avg_interest": {k: 1.0 for k in keywords}}
+
+    trends = make_trends()
+    trends.get_interest = AsyncMock(side_effect=get_interest)
+    llm = make_llm()
+    llm.synthesize_brief = AsyncMock(return_value=make_brief_draft())
+
+    svc = make_service(repo=repo, trends=trends, llm=llm)
+    result = await svc.run()
+
+    assert result.briefs_generated == 2
+    by_label = {
+        c.args[0]: c.kwargs["trends_data"] for c in llm.synthesize_brief.call_args_list
+    }
+    assert set(by_label["A"]["avg_interest"]) == {"a1", "a2", "a3", "a4", "a5"}
+    assert by_label["B"] is None
+
+
 # ---------------------------------------------------------------------------
 # Stage fetch — App Store / Play Store max_age_days
 # ---------------------------------------------------------------------------
@@ -1053,7 +1370,7 @@ async def test_run_skip_fetch_does_not_call_fetch_stage():
 
     result = await svc.run(skip_fetch=True)
 
-    reddit.fetch_posts.assert_not_called()
+    reddit.stream_posts.assert_not_called()
     repo.upsert_posts.assert_not_called()
     assert result.posts_fetched == 0
     assert result.posts_upserted == 0
@@ -1070,7 +1387,7 @@ async def test_run_skip_fetch_false_calls_fetch_stage():
 
     await svc.run(skip_fetch=False)
 
-    reddit.fetch_posts.assert_called_once()
+    reddit.stream_posts.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -1082,7 +1399,7 @@ async def test_run_default_does_not_skip_fetch():
 
     await svc.run()
 
-    reddit.fetch_posts.assert_called_once()
+    reddit.stream_posts.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -1101,3 +1418,767 @@ async def test_get_pending_counts_delegates_to_repo():
 
     assert result == expected
     repo.get_pending_counts.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# Reddit high-water marks
+# ---------------------------------------------------------------------------
+
+
+def _reddit_raw_post(external_id, subreddit, day):
+    from domain.pipeline.models import RawPost
+
+    return RawPost(
+        source="reddit",
+        external_id=external_id,
+        title="t",
+        body=None,
+        external_url=f"https://reddit.com/r/{subreddit}/{external_id}",
+        external_created_at=datetime(2026, 2, day, tzinfo=UTC),
+        score=1,
+        num_comments=0,
+        subreddit=subreddit,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_passes_stored_marks_to_reddit():
+    from domain.pipeline.models import FetchCursor
+
+    marks = {
+        "saas": FetchCursor(external_id="x", created_at=datetime(2026, 2, 1, tzinfo=UTC))
+    }
+    repo = make_repo()
+    repo.get_fetch_cursors = AsyncMock(return_value=marks)
+    reddit = make_reddit()
+    svc = make_service(repo=repo, reddit=reddit)
+
+    await svc.run()
+
+    repo.get_fetch_cursors.assert_any_await("reddit")
+    assert reddit.stream_posts.call_args.kwargs["since"] is marks
+
+
+@pytest.mark.asyncio
+async def test_fetch_saves_newest_post_per_subreddit_after_upsert():
+    from domain.pipeline.models import FetchCursor
+
+    posts = [
+        _reddit_raw_post("a1", "SaaS", 3),
+        _reddit_raw_post("a2", "SaaS", 5),
+        _reddit_raw_post("b1", "startups", 4),
+    ]
+    repo = make_repo()
+    svc = make_service(repo=repo, reddit=make_reddit(posts=posts))
+
+    await svc.run()
+
+    repo.save_fetch_cursors.assert_awaited_once()
+    source, cursors = repo.save_fetch_cursors.call_args.args
+    assert source == "reddit"
+    assert cursors == {
+        "saas": FetchCursor(external_id="a2", created_at=posts[1].external_created_at),
+        "startups": FetchCursor(external_id="b1", created_at=posts[2].external_created_at),
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_does_not_advance_marks_when_upsert_fails():
+    repo = make_repo()
+    repo.upsert_posts = AsyncMock(side_effect=RuntimeError("db down"))
+    svc = make_service(repo=repo, reddit=make_reddit(posts=[_reddit_raw_post("a", "saas", 1)]))
+
+    result = await svc.run()
+
+    assert result.has_errors
+    repo.save_fetch_cursors.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# RSS conditional GET validators
+# ---------------------------------------------------------------------------
+
+
+def _rss_service(repo, rss):
+    return PipelineService(
+        repo=repo,
+        reddit=make_reddit(),
+        llm=make_llm(),
+        rss=rss,
+        trends=make_trends(),
+        producthunt=make_producthunt(),
+        subreddits=["saas"],
+        rss_feeds=["https://a.example/rss", "https://b.example/rss"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_sends_stored_validators_to_rss_client():
+    known = {
+        "https://a.example/rss": FeedValidators(
+            url="https://a.example/rss", etag='"v1"', last_modified=None, content_hash="h",
+        )
+    }
+    repo = make_repo()
+    repo.get_feed_validators = AsyncMock(return_value=known)
+    rss = make_rss()
+
+    await _rss_service(repo, rss).run()
+
+    repo.get_feed_validators.assert_awaited_once_with(
+        ["https://a.example/rss", "https://b.example/rss"]
+    )
+    rss.stream_feeds.assert_called_once()
+    assert rss.stream_feeds.call_args.kwargs["validators"] is known
+
+
+@pytest.mark.asyncio
+async def test_fetch_skips_upsert_when_all_feeds_unchanged():
+    validators = FeedValidators(
+        url="https://a.example/rss", etag='"v1"', last_modified=None, content_hash="h",
+    )
+    rss = make_rss(feeds=[
+        FeedFetch(url="https://a.example/rss", posts=[], validators=validators, not_modified=True),
+    ])
+    repo = make_repo()
+
+    result = await _rss_service(repo, rss).run()
+
+    assert result.posts_fetched == 0
+    repo.upsert_posts.assert_not_called()
+    repo.save_feed_validators.assert_awaited_once_with([validators])
+
+
+@pytest.mark.asyncio
+async def test_fetch_does_not_save_validators_when_upsert_fails():
+    from domain.pipeline.models import RawPost
+
+    post = RawPost(
+        source="rss", external_id="x", title="t", body=None,
+        external_url="https://a.example/1",
+        external_created_at=datetime(2026, 2, 1, tzinfo=UTC),
+        score=0, num_comments=0,
+    )
+    validators = FeedValidators(
+        url="https://a.example/rss", etag=None, last_modified=None, content_hash="h2",
+    )
+    rss = make_rss(feeds=[
+        FeedFetch(url="https://a.example/rss", posts=[post], validators=validators),
+    ])
+    repo = make_repo()
+    repo.upsert_posts = AsyncMock(side_effect=RuntimeError("db down"))
+
+    await _rss_service(repo, rss).run()
+
+    repo.save_feed_validators.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Streaming fetch → upsert
+# ---------------------------------------------------------------------------
+
+
+def _cursor(post):
+    from domain.pipeline.models import FetchCursor
+
+    return FetchCursor(external_id=post.external_id, created_at=post.external_created_at)
+
+
+@pytest.mark.asyncio
+async def test_fetch_upserts_each_chunk_as_it_arrives():
+    chunks = [
+        [_reddit_raw_post("a1", "saas", 3)],
+        [_reddit_raw_post("b1", "startups", 4), _reddit_raw_post("b2", "startups", 5)],
+    ]
+    repo = make_repo()
+    repo.upsert_posts = AsyncMock(side_effect=lambda posts: UpsertCounts(inserted=len(posts)))
+    svc = make_service(repo=repo, reddit=make_reddit(chunks=chunks))
+
+    result = await svc.run()
+
+    assert repo.upsert_posts.await_args_list == [call(chunks[0]), call(chunks[1])]
+    assert result.posts_fetched == 3
+    assert result.posts_upserted == 3
+    assert [c.args[1] for c in repo.save_fetch_cursors.await_args_list] == [
+        {"saas": _cursor(chunks[0][0])},
+        {"startups": _cursor(chunks[1][1])},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_writes_early_chunks_before_slow_source_finishes():
+    import asyncio
+
+    first = [_reddit_raw_post("a1", "saas", 3)]
+    upserted_first = asyncio.Event()
+
+    async def _slow_stream(*args, **kwargs):
+        yield first
+        await asyncio.wait_for(upserted_first.wait(), timeout=1)
+        yield [_reddit_raw_post("b1", "startups", 4)]
+
+    async def _upsert(posts):
+        if posts is first:
+            upserted_first.set()
+        return UpsertCounts(inserted=len(posts))
+
+    reddit = make_reddit()
+    reddit.stream_posts = MagicMock(side_effect=_slow_stream)
+    repo = make_repo()
+    repo.upsert_posts = AsyncMock(side_effect=_upsert)
+    svc = make_service(repo=repo, reddit=reddit)
+
+    result = await svc.run()
+
+    assert result.has_errors is False
+    assert result.posts_upserted == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_failed_chunk_does_not_block_later_chunks():
+    chunks = [
+        [_reddit_raw_post("a1", "saas", 3)],
+        [_reddit_raw_post("b1", "startups", 4)],
+    ]
+    repo = make_repo()
+    repo.upsert_posts = AsyncMock(side_effect=[RuntimeError("db down"), UpsertCounts(inserted=1)])
+    svc = make_service(repo=repo, reddit=make_reddit(chunks=chunks))
+
+    result = await svc.run()
+
+    assert result.posts_upserted == 1
+    assert any("Fetch upsert failed" in e for e in result.errors)
+    repo.save_fetch_cursors.assert_awaited_once_with("reddit", {"startups": _cursor(chunks[1][0])})
+
+
+@pytest.mark.asyncio
+async def test_fetch_keeps_chunks_written_before_source_fails():
+    first = [_reddit_raw_post("a1", "saas", 3)]
+
+    async def _failing_stream(*args, **kwargs):
+        yield first
+        raise RuntimeError("network error")
+
+    reddit = make_reddit()
+    reddit.stream_posts = MagicMock(side_effect=_failing_stream)
+    repo = make_repo()
+    repo.upsert_posts = AsyncMock(return_value=UpsertCounts(inserted=1))
+    svc = make_service(repo=repo, reddit=reddit)
+
+    result = await svc.run()
+
+    repo.upsert_posts.assert_awaited_once_with(first)
+    repo.save_fetch_cursors.assert_awaited_once()
+    assert any("Fetch stage failed" in e for e in result.errors)
+
+
+@pytest.mark.asyncio
+async def test_fetch_records_inserted_updated_and_unchanged_counts():
+    chunks = [
+        [_reddit_raw_post("a1", "saas", 3), _reddit_raw_post("a2", "saas", 4)],
+        [_reddit_raw_post("b1", "startups", 4)],
+    ]
+    repo = make_repo()
+    repo.upsert_posts = AsyncMock(side_effect=[
+        UpsertCounts(inserted=1, updated=0, unchanged=1),
+        UpsertCounts(inserted=0, updated=1, unchanged=0),
+    ])
+    svc = make_service(repo=repo, reddit=make_reddit(chunks=chunks))
+
+    result = await svc.run()
+
+    assert result.posts_fetched == 3
+    assert result.posts_upserted == 2
+    assert (result.posts_inserted, result.posts_updated, result.posts_unchanged) == (1, 1, 1)
+
+
+# ---------------------------------------------------------------------------
+# Store reviews — per-app high-water marks
+# ---------------------------------------------------------------------------
+
+
+def _store_review(external_id, day):
+    from domain.pipeline.models import RawPost
+
+    return RawPost(
+        source="app_store",
+        external_id=external_id,
+        title="t",
+        body=None,
+        external_url="https://apps.apple.com/app/id1",
+        external_created_at=datetime(2026, 2, day, tzinfo=UTC),
+        score=4,
+        num_comments=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_store_reviews_resume_from_and_advance_per_app_mark():
+    from domain.pipeline.models import RawProduct
+
+    product = RawProduct(
+        external_id="111", name="App", slug="app-111", tagline=None,
+        description=None, url=None, category=None, launched_at=None, source="app_store",
+    )
+    mark = _cursor(_store_review("old", 1))
+    reviews = [_store_review("r2", 2), _store_review("r3", 3)]
+    appstore = AsyncMock()
+    appstore.search_apps = AsyncMock(return_value=[product])
+    appstore.fetch_reviews = AsyncMock(return_value=reviews)
+    repo = make_repo()
+    repo.get_fetch_cursors = AsyncMock(
+        side_effect=lambda source: {"111": mark} if source == "app_store" else {}
+    )
+    svc = PipelineService(
+        repo=repo,
+        reddit=make_reddit(),
+        llm=make_llm(),
+        rss=make_rss(),
+        trends=make_trends(),
+        producthunt=make_producthunt(),
+        subreddits=["saas"],
+        appstore=appstore,
+        appstore_keywords=["notes"],
+    )
+
+    await svc.run()
+
+    assert appstore.fetch_reviews.call_args.kwargs["since"] is mark
+    repo.save_fetch_cursors.assert_awaited_once_with("app_store", {"111": _cursor(reviews[1])})
+
+
+@pytest.mark.asyncio
+async def test_fetch_store_reviews_failed_catch_up_keeps_the_mark():
+    from domain.pipeline.models import RawProduct
+
+    product = RawProduct(
+        external_id="com.a", name="App", slug="app", tagline=None,
+        description=None, url=None, category=None, launched_at=None, source="play_store",
+    )
+    playstore = make_playstore(products=[product])
+    playstore.fetch_reviews = AsyncMock(side_effect=RuntimeError("HTTP 503"))
+    repo = make_repo()
+    svc = PipelineService(
+        repo=repo,
+        reddit=make_reddit(),
+        llm=make_llm(),
+        rss=make_rss(),
+        trends=make_trends(),
+        producthunt=make_producthunt(),
+        subreddits=["saas"],
+        playstore=playstore,
+        appstore_keywords=["notes"],
+    )
+
+    await svc.run()
+
+    playstore.fetch_reviews.assert_awaited_once()
+    assert all(c.args[0] != "play_store" for c in repo.save_fetch_cursors.await_args_list)
+    upserted = [p for c in repo.upsert_posts.await_args_list for p in c.args[0]]
+    assert not any(p.source == "play_store" for p in upserted)
+
+
+# ---------------------------------------------------------------------------
+# Product Hunt — incremental pages from a high-water mark
+# ---------------------------------------------------------------------------
+
+
+def _ph_product(external_id, day):
+    from domain.pipeline.models import RawProduct
+
+    return RawProduct(
+        external_id=external_id, name=external_id, slug=external_id, tagline=None,
+        description=None, url=None, category=None,
+        launched_at=datetime(2026, 2, day, tzinfo=UTC) if day else None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_producthunt_upserts_each_page_and_advances_mark_after_walk():
+    from domain.pipeline.models import FetchCursor
+
+    mark = FetchCursor(external_id="old", created_at=_ph_product("old", 1).launched_at)
+    pages = [
+        [_ph_product("p5", 5), _ph_product("p4", 4)],
+        [_ph_product("p3", 3), _ph_product("nodate", None)],
+    ]
+    ph = make_producthunt()
+    ph.stream_products = MagicMock(side_effect=lambda *a, **kw: _stream(pages))
+    repo = make_repo()
+    repo.upsert_products = AsyncMock(return_value=2)
+    repo.get_fetch_cursors = AsyncMock(
+        side_effect=lambda source: {"posts": mark} if source == "producthunt" else {}
+    )
+
+    result = await make_service(repo=repo, producthunt=ph).run()
+
+    assert ph.stream_products.call_args.kwargs["since"] is mark
+    assert repo.upsert_products.await_args_list == [call(pages[0]), call(pages[1])]
+    assert result.products_upserted == 4
+    repo.save_fetch_cursors.assert_awaited_once_with(
+        "producthunt",
+        {"posts": FetchCursor(external_id="p5", created_at=pages[0][0].launched_at)},
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_producthunt_keeps_mark_when_walk_is_interrupted():
+    first = [_ph_product("p5", 5)]
+
+    async def _failing_pages(*args, **kwargs):
+        yield first
+        raise RuntimeError("PH API down")
+
+    ph = make_producthunt()
+    ph.stream_products = MagicMock(side_effect=_failing_pages)
+    repo = make_repo()
+    repo.upsert_products = AsyncMock(return_value=1)
+
+    result = await make_service(repo=repo, producthunt=ph).run()
+
+    repo.upsert_products.assert_awaited_once_with(first)
+    repo.save_fetch_cursors.assert_not_called()
+    assert any("Product Hunt" in e for e in result.errors)
+
+
+# ---------------------------------------------------------------------------
+# refresh_engagement
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_refresh_engagement_updates_recent_reddit_posts():
+    from datetime import timedelta
+
+    from domain.pipeline.models import EngagementRefreshResult, PostEngagement
+
+    engagement = [PostEngagement("a", 10, 2), PostEngagement("b", 3, 0)]
+    repo = make_repo()
+    repo.get_recent_external_ids = AsyncMock(return_value=["a", "b", "c"])
+    repo.update_engagement = AsyncMock(return_value=1)
+    reddit = make_reddit()
+    reddit.fetch_engagement = AsyncMock(return_value=engagement)
+
+    svc = make_service(repo=repo, reddit=reddit)
+    svc._engagement_max_age = timedelta(days=3)
+    result = await svc.refresh_engagement()
+
+    assert result == EngagementRefreshResult(posts_checked=3, posts_updated=1)
+    repo.get_recent_external_ids.assert_awaited_once_with("reddit", timedelta(days=3))
+    reddit.fetch_engagement.assert_awaited_once_with(["a", "b", "c"])
+    repo.update_engagement.assert_awaited_once_with("reddit", engagement)
+    # Only engagement columns are touched, so the pipeline lock is not taken.
+    repo.acquire_advisory_lock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_engagement_skips_lookup_without_recent_posts():
+    repo = make_repo()
+    repo.get_recent_external_ids = AsyncMock(return_value=[])
+    reddit = make_reddit()
+
+    result = await make_service(repo=repo, reddit=reddit).refresh_engagement()
+
+    assert result.posts_checked == 0
+    reddit.fetch_engagement.assert_not_called()
+    repo.update_engagement.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# backfill
+# ---------------------------------------------------------------------------
+
+_BACKFILL_SINCE = datetime(2026, 2, 5, tzinfo=UTC)
+_BACKFILL_UNTIL = datetime(2026, 2, 20, tzinfo=UTC)
+_BACKFILL_JOB = "2026-02-05..2026-02-20"
+
+
+def _backfill_repo(checkpoints=None) -> AsyncMock:
+    repo = make_repo()
+    repo.get_backfill_checkpoints = AsyncMock(return_value=checkpoints or {})
+    repo.save_backfill_checkpoint = AsyncMock(return_value=None)
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_backfill_resumes_from_checkpoint_and_skips_done_partitions():
+    in_range = _reddit_raw_post("a1", "saas", 10)
+    checkpoints = {
+        "reddit:saas": BackfillCheckpoint("reddit:saas", cursor="t3_x", fetched=4),
+        "reddit:done": BackfillCheckpoint("reddit:done", fetched=9, done=True),
+    }
+    repo = _backfill_repo(checkpoints)
+    reddit = make_reddit()
+    # The page reaches past ``since``, so the partition finishes here.
+    reddit.fetch_page = AsyncMock(
+        return_value=([in_range, _reddit_raw_post("a0", "saas", 4)], "t3_y")
+    )
+    svc = make_service(repo=repo, reddit=reddit)
+
+    result = await svc.backfill(
+        _BACKFILL_SINCE, _BACKFILL_UNTIL, subreddits=["SaaS", "done"], feeds=[]
+    )
+
+    assert result.posts_fetched == 1
+    repo.get_backfill_checkpoints.assert_awaited_once_with(_BACKFILL_JOB)
+    reddit.fetch_page.assert_awaited_once_with("SaaS", after="t3_x")
+    repo.upsert_posts.assert_awaited_once_with([in_range])
+    repo.save_backfill_checkpoint.assert_awaited_once_with(
+        _BACKFILL_JOB,
+        BackfillCheckpoint("reddit:saas", cursor="t3_y", fetched=5, done=True),
+    )
+    repo.acquire_advisory_lock.assert_not_called()
+    repo.save_fetch_cursors.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_backfill_batches_partitions_into_one_upsert():
+    pages = {
+        "saas": ([_reddit_raw_post("a1", "saas", 10)], None),
+        "startups": ([_reddit_raw_post("b1", "startups", 11)], None),
+    }
+    repo = _backfill_repo()
+    reddit = make_reddit()
+    reddit.fetch_page = AsyncMock(side_effect=lambda sub, after=None: pages[sub])
+    svc = make_service(repo=repo, reddit=reddit)
+
+    result = await svc.backfill(
+        _BACKFILL_SINCE, _BACKFILL_UNTIL,
+        subreddits=["saas", "startups"], feeds=[], batch_size=100,
+    )
+
+    assert result.has_errors is False
+    repo.upsert_posts.assert_awaited_once()
+    assert {p.external_id for p in repo.upsert_posts.await_args.args[0]} == {"a1", "b1"}
+    saved = [c.args[1] for c in repo.save_backfill_checkpoint.await_args_list]
+    assert {c.partition for c in saved} == {"reddit:saas", "reddit:startups"}
+    assert all(c.done for c in saved)
+
+
+@pytest.mark.asyncio
+async def test_backfill_failed_upsert_keeps_checkpoint():
+    repo = _backfill_repo()
+    repo.upsert_posts = AsyncMock(side_effect=RuntimeError("db down"))
+    reddit = make_reddit()
+    reddit.fetch_page = AsyncMock(return_value=([_reddit_raw_post("a1", "saas", 10)], None))
+    svc = make_service(repo=repo, reddit=reddit)
+
+    result = await svc.backfill(
+        _BACKFILL_SINCE, _BACKFILL_UNTIL, subreddits=["saas"], feeds=[]
+    )
+
+    assert result.has_errors is True
+    repo.save_backfill_checkpoint.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_backfill_failed_write_stops_later_pages_checkpoints():
+    repo = _backfill_repo()
+    stored = repo.upsert_posts.return_value
+    repo.upsert_posts = AsyncMock(side_effect=[RuntimeError("db down"), stored, stored])
+    reddit = make_reddit()
+    reddit.fetch_page = AsyncMock(side_effect=[
+        ([_reddit_raw_post("a3", "saas", 13)], "t3_a3"),
+        ([_reddit_raw_post("a2", "saas", 12)], "t3_a2"),
+        ([_reddit_raw_post("a1", "saas", 11)], "t3_a1"),
+    ])
+    svc = make_service(repo=repo, reddit=reddit)
+
+    result = await svc.backfill(
+        _BACKFILL_SINCE, _BACKFILL_UNTIL,
+        subreddits=["saas"], feeds=[], batch_size=1, max_pages=3,
+    )
+
+    # Page 2's checkpoint would resume past page 1, whose posts were lost.
+    assert result.has_errors is True
+    repo.save_backfill_checkpoint.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_backfill_open_ended_range_is_saved_under_a_stable_key():
+    store: dict[str, dict[str, BackfillCheckpoint]] = {}
+
+    async def save(job, checkpoint):
+        store.setdefault(job, {})[checkpoint.partition] = checkpoint
+
+    repo = _backfill_repo()
+    repo.get_backfill_checkpoints = AsyncMock(side_effect=lambda job: dict(store.get(job, {})))
+    repo.save_backfill_checkpoint = AsyncMock(side_effect=save)
+    reddit = make_reddit()
+    reddit.fetch_page = AsyncMock(return_value=([_reddit_raw_post("a1", "saas", 10)], None))
+    svc = make_service(repo=repo, reddit=reddit)
+
+    await svc.backfill(_BACKFILL_SINCE, subreddits=["saas"], feeds=[])
+
+    first, *_, last = repo.save_backfill_checkpoint.await_args_list
+    assert first.args[0] == last.args[0] == "2026-02-05.."
+    assert first.args[1].partition == "range"
+    assert first.args[1].cursor.startswith(f"{_BACKFILL_SINCE.isoformat()}..")
+    assert first.args[1].done is False
+    assert last.args[1] == BackfillCheckpoint("range", cursor=first.args[1].cursor, done=True)
+
+
+@pytest.mark.asyncio
+async def test_backfill_by_days_resumes_the_saved_range():
+    saved_range = BackfillCheckpoint(
+        "range", cursor=f"{_BACKFILL_SINCE.isoformat()}..{_BACKFILL_UNTIL.isoformat()}"
+    )
+    repo = _backfill_repo()
+    repo.get_backfill_checkpoints = AsyncMock(
+        side_effect=lambda job: {"range": saved_range} if job == "last-15d" else {}
+    )
+    reddit = make_reddit()
+    # A second page remains, so the request is not finished yet.
+    reddit.fetch_page = AsyncMock(return_value=([_reddit_raw_post("a1", "saas", 10)], "t3_a1"))
+    svc = make_service(repo=repo, reddit=reddit)
+
+    await svc.backfill(None, days=15, subreddits=["saas"], feeds=[], max_pages=1)
+
+    jobs = [c.args[0] for c in repo.get_backfill_checkpoints.await_args_list]
+    assert jobs == ["last-15d", _BACKFILL_JOB, _BACKFILL_JOB]
+    repo.save_backfill_checkpoint.assert_awaited_once_with(
+        _BACKFILL_JOB, BackfillCheckpoint("reddit:saas", cursor="t3_a1", fetched=1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_pauses_after_max_pages_with_cursor_saved():
+    repo = _backfill_repo()
+    reddit = make_reddit()
+    reddit.fetch_page = AsyncMock(side_effect=[
+        ([_reddit_raw_post("a2", "saas", 12)], "t3_a2"),
+        ([_reddit_raw_post("a1", "saas", 11)], "t3_a1"),
+    ])
+    svc = make_service(repo=repo, reddit=reddit)
+
+    await svc.backfill(
+        _BACKFILL_SINCE, _BACKFILL_UNTIL, subreddits=["saas"], feeds=[], max_pages=2
+    )
+
+    assert reddit.fetch_page.await_args_list[1].kwargs == {"after": "t3_a2"}
+    last = repo.save_backfill_checkpoint.await_args_list[-1].args[1]
+    assert last == BackfillCheckpoint("reddit:saas", cursor="t3_a1", fetched=2, done=False)
+
+
+@pytest.mark.asyncio
+async def test_backfill_feed_keeps_entries_in_range_and_finishes():
+    url = "https://feed.example/rss"
+    in_range = _reddit_raw_post("r1", "rss", 15)
+    repo = _backfill_repo()
+    rss = make_rss()
+    rss.fetch_feeds = AsyncMock(return_value=[
+        FeedFetch(url=url, posts=[in_range, _reddit_raw_post("r0", "rss", 21)], validators=None)
+    ])
+    svc = make_service(repo=repo, rss=rss)
+
+    result = await svc.backfill(_BACKFILL_SINCE, _BACKFILL_UNTIL, subreddits=[], feeds=[url])
+
+    assert result.posts_fetched == 1
+    rss.fetch_feeds.assert_awaited_once_with([url])
+    repo.upsert_posts.assert_awaited_once_with([in_range])
+    repo.save_backfill_checkpoint.assert_awaited_once_with(
+        _BACKFILL_JOB, BackfillCheckpoint(f"rss:{url}", fetched=1, done=True)
+    )
+
+
+# ---------------------------------------------------------------------------
+# raw archive / reprocess
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_fetch_flushes_raw_archive_after_writes():
+    repo = make_repo()
+    archive = AsyncMock()
+    archive.flush = AsyncMock(
+        side_effect=lambda: repo.upsert_posts.assert_awaited_once()
+    )
+    svc = make_service(
+        repo=repo, reddit=make_reddit(posts=[_reddit_raw_post("a1", "saas", 3)])
+    )
+    svc._archive = archive
+
+    result = await svc.run(fetch_only=True)
+
+    assert result.has_errors is False
+    archive.flush.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_archive_flush_failure_does_not_fail_run():
+    archive = AsyncMock()
+    archive.flush = AsyncMock(side_effect=OSError("disk full"))
+    svc = make_service()
+    svc._archive = archive
+
+    result = await svc.run(fetch_only=True)
+
+    assert result.has_errors is False
+
+
+@pytest.mark.asyncio
+async def test_reprocess_upserts_replayed_posts_with_content_refresh():
+    chunks = [
+        [_reddit_raw_post("a1", "saas", 3)],
+        [_reddit_raw_post("b1", "saas", 4), _reddit_raw_post("b2", "saas", 4)],
+    ]
+    repo = make_repo()
+    repo.upsert_posts = AsyncMock(return_value=UpsertCounts(updated=3))
+    svc = make_service(repo=repo)
+
+    result = await svc.reprocess(_stream(chunks), batch_size=10)
+
+    assert result.posts_fetched == 3
+    assert result.posts_updated == 3
+    repo.upsert_posts.assert_awaited_once_with(
+        [p for chunk in chunks for p in chunk], refresh_content=True
+    )
+    repo.acquire_advisory_lock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_reprocess_splits_large_segments_into_batch_size_upserts():
+    """A day's segment must not become one upsert over the bind-parameter limit."""
+    segment = [_reddit_raw_post(f"p{i}", "saas", 3) for i in range(25)]
+    repo = make_repo()
+    repo.upsert_posts = AsyncMock(return_value=UpsertCounts(updated=10))
+    svc = make_service(repo=repo)
+
+    await svc.reprocess(_stream([segment]), batch_size=10)
+
+    sizes = [len(c.args[0]) for c in repo.upsert_posts.await_args_list]
+    assert sizes == [10, 10, 5]
+
+
+# ---------------------------------------------------------------------------
+# duplicate linking
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_fetch_links_duplicates_before_tagging():
+    from datetime import timedelta
+
+    repo = make_repo()
+    repo.link_duplicates = AsyncMock(return_value=2)
+    repo.get_pending_posts = AsyncMock(
+        side_effect=lambda *a, **kw: repo.link_duplicates.assert_awaited_once() or []
+    )
+    svc = make_service(repo=repo)
+    svc._dedup_window = timedelta(hours=24)
+
+    result = await svc.run()
+
+    assert result.posts_duplicate == 2
+    repo.link_duplicates.assert_awaited_once_with(timedelta(hours=24))
+    repo.get_pending_posts.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fetch_duplicate_linking_failure_is_reported():
+    repo = make_repo()
+    repo.link_duplicates = AsyncMock(side_effect=RuntimeError("db down"))
+
+    result = await make_service(repo=repo).run(fetch_only=True)
+
+    assert "Duplicate linking failed" in result.errors
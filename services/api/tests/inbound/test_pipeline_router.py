@@ -551,3 +551,48 @@ async def test_run_pipeline_without_skip_fetch_defaults_false():
 
     assert resp.status_code == 200
     mock_service.run.assert_awaited_once_with(skip_fetch=False)
+
+
+# ---------------------------------------------------------------------------
+# POST /internal/pipeline/refresh-engagement
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_refresh_engagement_requires_secret():
+    mock_service = AsyncMock()
+    app = _build_pipeline_app(mock_service)
+
+    with patch("inbound.http.pipeline.router.get_settings") as mock_get_settings:
+        mock_get_settings.return_value = _mock_settings(secret="my-secret")
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.post("/internal/pipeline/refresh-engagement")
+
+    assert resp.status_code == 403
+    mock_service.refresh_engagement.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_engagement_returns_counts():
+    from domain.pipeline.models import EngagementRefreshResult
+
+    mock_service = AsyncMock()
+    mock_service.refresh_engagement = AsyncMock(
+        return_value=EngagementRefreshResult(posts_checked=250, posts_updated=40)
+    )
+    app = _build_pipeline_app(mock_service)
+
+    with patch("inbound.http.pipeline.router.get_settings") as mock_get_settings:
+        mock_get_settings.return_value = _mock_settings(secret="my-secret")
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.post(
+                "/internal/pipeline/refresh-engagement",
+                headers={"x-internal-secret": "my-secret"},
+            )
+
+    assert resp.status_code == 200
+    assert resp.json() == {"data": {"posts_checked": 250, "posts_updated": 40}}
@@ -3,6 +3,7 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from tenacity import RetryError, wait_none
 
 from domain.pipeline.models import RawPost, RawProduct
 from outbound.appstore.client import AppStoreClient, _parse_release_date
@@ -115,7 +116,7 @@ async def test_search_apps_returns_raw_products():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["productivity"])
 
     assert len(result) == 1
@@ -135,7 +136,7 @@ async def test_search_apps_records_launched_at():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["app"])
 
     assert result[0].launched_at is not None
@@ -151,7 +152,7 @@ async def test_search_apps_filters_old_apps():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["old"], max_age_days=365)
 
     assert result == []
@@ -165,7 +166,7 @@ async def test_search_apps_includes_app_without_release_date():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["app"])
 
     assert len(result) == 1
@@ -179,7 +180,7 @@ async def test_search_apps_maps_image_url_from_artworkurl512():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["photo"])
 
     assert result[0].image_url == "https://example.com/icon512.png"
@@ -192,7 +193,7 @@ async def test_search_apps_falls_back_to_artworkurl100_when_512_absent():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["photo"])
 
     assert result[0].image_url == "https://example.com/icon100.png"
@@ -205,7 +206,7 @@ async def test_search_apps_image_url_none_when_both_artwork_absent():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["photo"])
 
     assert result[0].image_url is None
@@ -218,7 +219,7 @@ async def test_search_apps_maps_category_from_primary_genre():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["game"])
 
     assert result[0].category == "Games"
@@ -231,7 +232,7 @@ async def test_search_apps_maps_url_from_track_view_url():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["test"])
 
     assert result[0].url == "https://apps.apple.com/app/id999"
@@ -245,7 +246,7 @@ async def test_search_apps_tagline_is_always_none():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["app"])
 
     assert result[0].tagline is None
@@ -259,7 +260,7 @@ async def test_search_apps_deduplicates_across_keywords():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["keyword1", "keyword2"])
 
     assert len(result) == 1
@@ -289,7 +290,7 @@ async def test_search_apps_multiple_keywords_aggregate_distinct_items():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["kw1", "kw2"])
 
     assert len(result) == 2
@@ -303,7 +304,7 @@ async def test_search_apps_empty_results_returns_empty_list():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["nothing"])
 
     assert result == []
@@ -315,7 +316,7 @@ async def test_search_apps_empty_keyword_list_returns_empty():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps([])
 
     assert result == []
@@ -329,7 +330,7 @@ async def test_search_apps_missing_results_key_returns_empty():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.search_apps(["test"])
 
     assert result == []
@@ -352,7 +353,7 @@ async def test_search_apps_http_error_is_caught_and_skipped(caplog):
     client = AppStoreClient()
 
     with (
-        patch("outbound.appstore.client.httpx.AsyncClient", return_value=http),
+        patch("outbound.http.client.httpx.AsyncClient", return_value=http),
         caplog.at_level(logging.ERROR, logger="outbound.appstore.client"),
     ):
         result = await client.search_apps(["failing-keyword"])
@@ -367,7 +368,7 @@ async def test_search_apps_limit_capped_at_200():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         await client.search_apps(["test"], limit=500)
 
     call_kwargs = http.get.call_args.kwargs
@@ -380,7 +381,7 @@ async def test_search_apps_sends_correct_itunes_params():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         await client.search_apps(["todo"], limit=10)
 
     call_kwargs = http.get.call_args.kwargs
@@ -397,7 +398,7 @@ async def test_search_apps_fetches_more_candidates():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         await client.search_apps(["test"], limit=10)
 
     call_kwargs = http.get.call_args.kwargs
@@ -417,7 +418,7 @@ async def test_fetch_reviews_returns_raw_posts():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("123456", pages=1)
 
     assert len(result) == 1
@@ -426,6 +427,24 @@ async def test_fetch_reviews_returns_raw_posts():
     assert post.source == "app_store"
 
 
+@pytest.mark.asyncio
+async def test_fetch_reviews_archived_page_parses_to_same_posts():
+    from outbound.appstore.client import parse_archived
+
+    response = _rss_feed_response("123456", [_rss_entry()])
+    http = _make_async_http(response)
+    archive = AsyncMock()
+
+    client = AppStoreClient(archive=archive)
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        result = await client.fetch_reviews("123456", pages=1)
+
+    source, context, payload = archive.append.await_args.args
+    assert (source, context) == ("app_store", {"app_id": "123456"})
+    assert parse_archived(context, payload) == result
+
+
 @pytest.mark.asyncio
 async def test_fetch_reviews_external_id_format():
     entry = _rss_entry(entry_id="rev-999")
@@ -434,7 +453,7 @@ async def test_fetch_reviews_external_id_format():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result[0].external_id == "appstore-111-rev-999"
@@ -448,7 +467,7 @@ async def test_fetch_reviews_maps_title_from_dict_label():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result[0].title == "Fantastic!"
@@ -464,7 +483,7 @@ async def test_fetch_reviews_maps_title_from_plain_string():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result[0].title == "Plain title"
@@ -478,7 +497,7 @@ async def test_fetch_reviews_maps_body_from_dict_label():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result[0].body == "Love this app!"
@@ -493,7 +512,7 @@ async def test_fetch_reviews_maps_body_from_plain_string():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result[0].body == "Plain body"
@@ -508,7 +527,7 @@ async def test_fetch_reviews_empty_content_becomes_none():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result[0].body is None
@@ -522,7 +541,7 @@ async def test_fetch_reviews_maps_rating_from_dict_label():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result[0].score == 4
@@ -537,7 +556,7 @@ async def test_fetch_reviews_maps_rating_from_plain_string():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result[0].score == 3
@@ -553,7 +572,7 @@ async def test_fetch_reviews_skips_entries_without_im_rating():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert len(result) == 1
@@ -568,7 +587,7 @@ async def test_fetch_reviews_parses_updated_iso_timestamp():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result[0].external_created_at.year == 2026
@@ -586,7 +605,7 @@ async def test_fetch_reviews_falls_back_to_now_on_invalid_date():
     client = AppStoreClient()
 
     before = datetime.now(UTC)
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
     after = datetime.now(UTC)
 
@@ -603,7 +622,7 @@ async def test_fetch_reviews_falls_back_to_now_when_updated_absent():
     client = AppStoreClient()
 
     before = datetime.now(UTC)
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
     after = datetime.now(UTC)
 
@@ -618,7 +637,7 @@ async def test_fetch_reviews_external_url_uses_app_id():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("777", pages=1)
 
     assert result[0].external_url == "https://apps.apple.com/app/id777"
@@ -632,7 +651,7 @@ async def test_fetch_reviews_num_comments_is_zero():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result[0].num_comments == 0
@@ -647,7 +666,7 @@ async def test_fetch_reviews_requests_multiple_pages():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=3)
 
     assert http.get.call_count == 3
@@ -661,7 +680,7 @@ async def test_fetch_reviews_empty_feed_returns_empty_list():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result == []
@@ -674,15 +693,15 @@ async def test_fetch_reviews_missing_feed_key_returns_empty():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         result = await client.fetch_reviews("111", pages=1)
 
     assert result == []
 
 
 @pytest.mark.asyncio
-async def test_fetch_reviews_http_error_is_caught_and_page_skipped(caplog):
-    """An HTTP error for one page must be caught; other pages still process."""
+async def test_fetch_reviews_http_error_stops_pagination(caplog):
+    """A page that fails is logged and ends pagination; earlier pages are kept."""
     import logging
 
     call_count = 0
@@ -698,23 +717,25 @@ async def test_fetch_reviews_http_error_is_caught_and_page_skipped(caplog):
     http.__aenter__ = AsyncMock(return_value=http)
     http.__aexit__ = AsyncMock(return_value=False)
 
-    async def get_side_effect(*args, **kwargs):
+    async def get_side_effect(url, *args, **kwargs):
         nonlocal call_count
         call_count += 1
-        return good_resp if call_count == 1 else bad_resp
+        return bad_resp if "page=2/" in url else good_resp
 
     http.get = AsyncMock(side_effect=get_side_effect)
 
     client = AppStoreClient()
 
     with (
-        patch("outbound.appstore.client.httpx.AsyncClient", return_value=http),
+        patch("outbound.http.client.httpx.AsyncClient", return_value=http),
         caplog.at_level(logging.ERROR, logger="outbound.appstore.client"),
     ):
-        result = await client.fetch_reviews("111", pages=2)
+        result = await client.fetch_reviews("111", pages=3)
 
-    # Page 1 succeeded (1 post); page 2 failed (0 posts)
+    # Page 1 succeeded; page 2 failed after retries, so page 3 is never read.
     assert len(result) == 1
+    assert not any("page=3/" in c.args[0] for c in http.get.call_args_list)
+    assert "page 2" in caplog.text
 
 
 @pytest.mark.asyncio
@@ -725,10 +746,224 @@ async def test_fetch_reviews_uses_correct_url_format():
 
     client = AppStoreClient()
 
-    with patch("outbound.appstore.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         await client.fetch_reviews("888", country="gb", pages=1)
 
     called_url = http.get.call_args.args[0]
     assert "gb" in called_url
     assert "888" in called_url
     assert "page=1" in called_url
+
+
+@pytest.mark.asyncio
+async def test_fetch_reviews_reuses_injected_client_across_apps():
+    """With a shared client, reviewing several apps opens no per-app clients."""
+    response = _rss_feed_response("1", [_rss_entry()])
+    http = _make_async_http(response)
+
+    client = AppStoreClient(http=http)
+
+    with (
+        patch("outbound.http.client.httpx.AsyncClient") as mock_async_client,
+        patch("outbound.appstore.client.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        await client.fetch_reviews("1", pages=1)
+        await client.fetch_reviews("2", pages=1)
+
+    mock_async_client.assert_not_called()
+    assert http.get.await_count == 2
+
+
+# ---------------------------------------------------------------------------
+# AppStoreClient — concurrent mode
+# ---------------------------------------------------------------------------
+
+
+def _unlimited(client: AppStoreClient) -> AppStoreClient:
+    client._limiter.acquire = AsyncMock()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_search_apps_runs_keywords_concurrently_up_to_limit():
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def _slow_get(url, params=None, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        resp = MagicMock()
+        resp.raise_for_status = MagicMock()
+        resp.json = MagicMock(return_value={"results": []})
+        return resp
+
+    http = _make_async_http()
+    http.get = AsyncMock(side_effect=_slow_get)
+    client = _unlimited(AppStoreClient(http=http, concurrency=2))
+
+    await client.search_apps(["a", "b", "c", "d", "e"])
+
+    assert peak == 2
+    assert http.get.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_search_apps_merges_concurrent_results_in_keyword_order():
+    import asyncio
+
+    async def _get(url, params=None, **kwargs):
+        term = params["term"]
+        # The first keyword answers last; its apps must still come first.
+        await asyncio.sleep(0.02 if term == "first" else 0)
+        resp = MagicMock()
+        resp.raise_for_status = MagicMock()
+        track_id = 1 if term == "first" else 2
+        resp.json = MagicMock(return_value={"results": [_itunes_item(track_id=track_id)]})
+        return resp
+
+    http = _make_async_http()
+    http.get = AsyncMock(side_effect=_get)
+    client = _unlimited(AppStoreClient(http=http, concurrency=2))
+
+    result = await client.search_apps(["first", "second"], limit=1)
+
+    assert [p.external_id for p in result] == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_reviews_stops_at_first_empty_page():
+    def _page(url, **kwargs):
+        page = int(url.split("page=")[1].split("/")[0])
+        entries = [_rss_entry(entry_id=f"r{page}")] if page <= 2 else []
+        resp = MagicMock()
+        resp.raise_for_status = MagicMock()
+        resp.json = MagicMock(return_value=_rss_feed_response("111", entries))
+        return resp
+
+    http = _make_async_http()
+    http.get = AsyncMock(side_effect=_page)
+    client = _unlimited(AppStoreClient(http=http, concurrency=2))
+
+    result = await client.fetch_reviews("111", pages=10)
+
+    # Page 1 alone, then the window 2-3 hits the empty page 3 and stops.
+    assert [p.external_id for p in result] == ["appstore-111-r1", "appstore-111-r2"]
+    assert http.get.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_search_and_reviews_draw_from_one_itunes_budget():
+    http = _make_async_http({"results": [], "feed": {"entry": [_rss_entry()]}})
+    client = AppStoreClient(http=http)
+    bucket = client._limiter.bucket("https://itunes.apple.com/")
+    bucket.acquire = AsyncMock()
+
+    await client.search_apps(["a"])
+    await client.fetch_reviews("111", pages=2)
+
+    assert bucket.acquire.await_count == 3
+
+
+# ---------------------------------------------------------------------------
+# AppStoreClient.fetch_reviews — incremental from a high-water mark
+# ---------------------------------------------------------------------------
+
+
+def _paged_reviews(days_by_page):
+    def _page(url, **kwargs):
+        page = int(url.split("page=")[1].split("/")[0])
+        entries = [
+            _rss_entry(entry_id=f"d{day}", updated=f"2026-02-{day:02d}T00:00:00Z")
+            for day in days_by_page.get(page, [])
+        ]
+        resp = MagicMock()
+        resp.raise_for_status = MagicMock()
+        resp.json = MagicMock(return_value=_rss_feed_response("111", entries))
+        return resp
+
+    return _page
+
+
+@pytest.mark.asyncio
+async def test_fetch_reviews_with_mark_pages_past_limit_until_mark():
+    from domain.pipeline.models import FetchCursor
+
+    http = _make_async_http()
+    http.get = AsyncMock(side_effect=_paged_reviews({1: [20, 19], 2: [18, 17], 3: [16, 15]}))
+    client = _unlimited(AppStoreClient(http=http))
+    mark = FetchCursor(
+        external_id="appstore-111-d15", created_at=datetime(2026, 2, 15, tzinfo=UTC)
+    )
+
+    result = await client.fetch_reviews("111", pages=1, since=mark)
+
+    assert [p.external_id for p in result] == [
+        "appstore-111-d20", "appstore-111-d19", "appstore-111-d18",
+        "appstore-111-d17", "appstore-111-d16",
+    ]
+    assert http.get.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_reviews_with_mark_stops_on_first_covered_page():
+    from domain.pipeline.models import FetchCursor
+
+    http = _make_async_http()
+    http.get = AsyncMock(side_effect=_paged_reviews({1: [20, 10], 2: [9, 8]}))
+    client = _unlimited(AppStoreClient(http=http))
+    mark = FetchCursor(
+        external_id="appstore-111-d10", created_at=datetime(2026, 2, 10, tzinfo=UTC)
+    )
+
+    result = await client.fetch_reviews("111", since=mark)
+
+    assert [p.external_id for p in result] == ["appstore-111-d20"]
+    assert http.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_reviews_with_mark_on_page_one_requests_only_page_one():
+    from domain.pipeline.models import FetchCursor
+
+    http = _make_async_http()
+    http.get = AsyncMock(side_effect=_paged_reviews({1: [20, 10], 2: [9, 8], 3: [7], 4: [6]}))
+    client = _unlimited(AppStoreClient(http=http, concurrency=4))
+    mark = FetchCursor(
+        external_id="appstore-111-d10", created_at=datetime(2026, 2, 10, tzinfo=UTC)
+    )
+
+    result = await client.fetch_reviews("111", since=mark)
+
+    assert [p.external_id for p in result] == ["appstore-111-d20"]
+    assert http.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_reviews_with_mark_raises_when_a_page_before_the_mark_fails():
+    """Returning pages 1-2 would advance the mark past the failed page 3."""
+    from domain.pipeline.models import FetchCursor
+
+    pages = _paged_reviews({1: [20, 19], 2: [18, 17], 4: [14, 13]})
+
+    def _page(url, **kwargs):
+        if "page=3/" in url:
+            raise RuntimeError("HTTP 503")
+        return pages(url, **kwargs)
+
+    http = _make_async_http()
+    http.get = AsyncMock(side_effect=_page)
+    client = _unlimited(AppStoreClient(http=http, concurrency=2))
+    mark = FetchCursor(
+        external_id="appstore-111-d13", created_at=datetime(2026, 2, 13, tzinfo=UTC)
+    )
+
+    with (
+        patch.object(AppStoreClient._fetch_review_page.retry, "wait", wait_none()),
+        pytest.raises(RetryError),
+    ):
+        await client.fetch_reviews("111", since=mark)
@@ -0,0 +1,124 @@
+"""Tests for outbound/http/client.py — HttpClient and borrow()."""
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from outbound.http.client import HttpClient, borrow
+
+
+def _client_with_transport(handler, **kwargs) -> HttpClient:
+    client = HttpClient(**kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_and_post_delegate_to_pooled_client():
+    seen: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, str(request.url)))
+        return httpx.Response(200, json={"ok": True})
+
+    client = _client_with_transport(handler)
+    resp = await client.get("https://a.example/x", params={"q": "1"})
+    await client.post("https://a.example/y", json={})
+    await client.aclose()
+
+    assert resp.json() == {"ok": True}
+    assert seen == [("GET", "https://a.example/x?q=1"), ("POST", "https://a.example/y")]
+
+
+@pytest.mark.asyncio
+async def test_caps_in_flight_requests_per_host():
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200)
+
+    client = _client_with_transport(handler, max_connections_per_host=2)
+    urls = [f"https://a.example/{i}" for i in range(6)] + [
+        f"https://b.example/{i}" for i in range(6)
+    ]
+    await asyncio.gather(*[client.get(u) for u in urls])
+    await client.aclose()
+
+    assert peak == {"a.example": 2, "b.example": 2}
+
+
+def test_http2_falls_back_when_h2_missing():
+    with (
+        patch("outbound.http.client.importlib.util.find_spec", return_value=None),
+        patch("outbound.http.client.httpx.AsyncClient") as mock_async_client,
+    ):
+        HttpClient(http2=True)
+
+    assert mock_async_client.call_args.kwargs["http2"] is False
+
+
+def test_pool_limits_are_applied():
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_async_client:
+        HttpClient(max_connections=7, max_keepalive_connections=3, timeout=12)
+
+    kwargs = mock_async_client.call_args.kwargs
+    assert kwargs["limits"].max_connections == 7
+    assert kwargs["limits"].max_keepalive_connections == 3
+    assert kwargs["timeout"] == 12
+
+
+@pytest.mark.asyncio
+async def test_borrow_yields_shared_client_without_closing_it():
+    shared = HttpClient()
+    async with borrow(shared, timeout=5) as http:
+        assert http is shared
+    assert not shared._client.is_closed
+    await shared.aclose()
+
+
+@pytest.mark.asyncio
+async def test_borrow_without_shared_client_opens_and_closes_one():
+    async with borrow(None, timeout=5) as http:
+        assert isinstance(http, httpx.AsyncClient)
+        assert not http.is_closed
+    assert http.is_closed
+
+
+@pytest.mark.asyncio
+async def test_for_source_shares_pool_and_scheduler():
+    shared = HttpClient(max_in_flight=1)
+    view = shared.for_source("reddit")
+
+    assert view._client is shared._client
+    assert view.scheduler is shared.scheduler
+    assert view._source == "reddit" and shared._source is None
+    await shared.aclose()
+
+
+@pytest.mark.asyncio
+async def test_requests_are_scheduled_by_host_under_the_view_source():
+    seen: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200)
+
+    client = _client_with_transport(handler)
+    real_slot = client.scheduler.slot
+
+    def slot(host, *, source):
+        seen.append((host, source))
+        return real_slot(host, source=source)
+
+    with patch.object(client.scheduler, "slot", side_effect=slot):
+        await client.for_source("rss").get("https://feeds.example/rss")
+        await client.get("https://other.example/x")
+    await client.aclose()
+
+    assert seen == [("feeds.example", "rss"), ("other.example", "other.example")]
@@ -0,0 +1,148 @@
+"""Tests for outbound/http/fixtures.py — cassette, stand-in server, record/replay."""
+import asyncio
+import time
+import urllib.request
+
+import httpx
+import pytest
+
+from outbound.http.client import HttpClient
+from outbound.http.fixtures import Cassette, Recorded, RecordingTransport, http_fixtures
+
+
+def _seed(cassette: Cassette, method: str, url: str, body: bytes = b"", **kwargs) -> None:
+    cassette.save(
+        method,
+        url,
+        body,
+        Recorded(
+            status=kwargs.get("status", 200),
+            headers=kwargs.get("headers", {"content-type": "application/json"}),
+            content=kwargs.get("content", b'{"ok": true}'),
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Cassette
+# ---------------------------------------------------------------------------
+
+
+def test_cassette_round_trips_text_and_binary_bodies(tmp_path):
+    cassette = Cassette(tmp_path)
+    _seed(cassette, "GET", "https://a.example/x?q=1", content=b"hello")
+    _seed(cassette, "GET", "https://a.example/bin", content=b"\xff\x00")
+
+    assert cassette.load("GET", "https://a.example/x?q=1").content == b"hello"
+    assert cassette.load("GET", "https://a.example/bin").content == b"\xff\x00"
+    assert cassette.load("GET", "https://a.example/x?q=2") is None
+
+
+def test_cassette_tells_post_bodies_apart_and_drops_transport_headers(tmp_path):
+    cassette = Cassette(tmp_path)
+    _seed(cassette, "POST", "https://a.example/graphql", b'{"after": null}', content=b"1")
+    _seed(
+        cassette,
+        "POST",
+        "https://a.example/graphql",
+        b'{"after": "c1"}',
+        content=b"2",
+        headers={"Content-Encoding": "gzip", "ETag": '"v1"'},
+    )
+
+    first = cassette.load("POST", "https://a.example/graphql", b'{"after": null}')
+    second = cassette.load("POST", "https://a.example/graphql", b'{"after": "c1"}')
+    assert (first.content, second.content) == (b"1", b"2")
+    assert second.headers == {"etag": '"v1"'}
+
+
+# ---------------------------------------------------------------------------
+# Record / replay through HttpClient
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_recording_transport_saves_responses(tmp_path):
+    cassette = Cassette(tmp_path)
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"path": request.url.path}, headers={"etag": "e1"})
+
+    client = HttpClient(
+        wrap_transport=lambda _: RecordingTransport(httpx.MockTransport(upstream), cassette)
+    )
+    resp = await client.get("https://www.reddit.com/r/SaaS/new.json", params={"limit": 5})
+    await client.aclose()
+
+    assert resp.json() == {"path": "/r/SaaS/new.json"}
+    recorded = cassette.load("GET", "https://www.reddit.com/r/SaaS/new.json?limit=5")
+    assert recorded is not None
+    assert recorded.headers["etag"] == "e1"
+
+
+@pytest.mark.asyncio
+async def test_replay_serves_recordings_for_original_urls(tmp_path):
+    cassette = Cassette(tmp_path)
+    _seed(cassette, "GET", "https://itunes.apple.com/search?term=crm", content=b'{"n": 1}')
+    _seed(cassette, "POST", "https://api.producthunt.com/v2/api/graphql", b'{"q":1}')
+
+    with http_fixtures("replay", tmp_path) as wrap_transport:
+        client = HttpClient(wrap_transport=wrap_transport)
+        found = await client.get("https://itunes.apple.com/search", params={"term": "crm"})
+        posted = await client.post(
+            "https://api.producthunt.com/v2/api/graphql", content=b'{"q":1}'
+        )
+        missing = await client.get("https://itunes.apple.com/search?term=other")
+        await client.aclose()
+
+    assert found.json() == {"n": 1}
+    assert str(found.url) == "https://itunes.apple.com/search?term=crm"
+    assert posted.json() == {"ok": True}
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_replay_injects_errors_and_latency(tmp_path):
+    cassette = Cassette(tmp_path)
+    for i in range(4):
+        _seed(cassette, "GET", f"https://a.example/{i}")
+
+    with http_fixtures("replay", tmp_path, error_rate=1.0) as wrap_transport:
+        client = HttpClient(wrap_transport=wrap_transport)
+        resp = await client.get("https://a.example/0")
+        await client.aclose()
+    assert resp.status_code == 503
+
+    with http_fixtures("replay", tmp_path, latency=0.1) as wrap_transport:
+        client = HttpClient(wrap_transport=wrap_transport)
+        started = time.monotonic()
+        responses = await asyncio.gather(
+            *[client.get(f"https://a.example/{i}") for i in range(4)]
+        )
+        elapsed = time.monotonic() - started
+        await client.aclose()
+
+    assert [r.status_code for r in responses] == [200] * 4
+    # Delays are served concurrently, like real network waits.
+    assert 0.1 <= elapsed < 0.35
+
+
+def test_replay_routes_urllib_requests_and_restores_opener(tmp_path):
+    cassette = Cassette(tmp_path)
+    url = "https://play.google.com/store/apps/details?id=com.a&hl=en"
+    _seed(cassette, "GET", url, content=b"<html>detail</html>")
+
+    with http_fixtures("replay", tmp_path):
+        body = urllib.request.urlopen(url).read()
+
+    assert body == b"<html>detail</html>"
+    assert urllib.request._opener is None
+
+
+def test_off_yields_no_wrapper_and_unknown_mode_raises(tmp_path):
+    with http_fixtures("off", tmp_path) as wrap_transport:
+        assert wrap_transport is None
+    with pytest.raises(ValueError, match="Unknown HTTP fixtures mode"), http_fixtures(
+        "live", tmp_path
+    ):
+        pass
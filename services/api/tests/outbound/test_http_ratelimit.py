@@ -0,0 +1,191 @@
+"""Tests for outbound/http/ratelimit.py — TokenBucket, HostRateLimiter, AdaptiveRateLimiter."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from outbound.http.ratelimit import (
+    AdaptiveRateLimiter,
+    HostRateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class _FakeClock:
+    """Monotonic clock that only advances when the bucket sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, secs: float) -> None:
+        self.sleeps.append(secs)
+        self.now += secs
+
+
+@pytest.fixture
+def clock():
+    fake = _FakeClock()
+    with (
+        patch("outbound.http.ratelimit.time.monotonic", side_effect=fake.monotonic),
+        patch("outbound.http.ratelimit.asyncio.sleep", side_effect=fake.sleep),
+    ):
+        yield fake
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError, match="rate must be positive"):
+        TokenBucket(rate=0)
+
+
+def test_rejects_capacity_below_one():
+    with pytest.raises(ValueError, match="capacity"):
+        TokenBucket(rate=1, capacity=0.5)
+
+
+def test_per_minute_converts_to_per_second_rate():
+    bucket = TokenBucket.per_minute(30)
+    assert bucket.rate == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_first_acquire_does_not_wait(clock):
+    bucket = TokenBucket.per_minute(30)
+    await bucket.acquire()
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_acquire_paces_to_rate(clock):
+    """At 30/min, three back-to-back acquires span four seconds."""
+    bucket = TokenBucket.per_minute(30)
+    start = clock.now
+    for _ in range(3):
+        await bucket.acquire()
+    assert clock.now - start == pytest.approx(4.0)
+
+
+@pytest.mark.asyncio
+async def test_burst_capacity_allows_immediate_tokens(clock):
+    bucket = TokenBucket.per_minute(60, burst=3)
+    for _ in range(3):
+        await bucket.acquire()
+    assert clock.sleeps == []
+
+    await bucket.acquire()
+    assert sum(clock.sleeps) == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_share_one_budget(clock):
+    bucket = TokenBucket.per_minute(60)
+    start = clock.now
+    await asyncio.gather(*[bucket.acquire() for _ in range(5)])
+    assert clock.now - start == pytest.approx(4.0)
+
+
+@pytest.mark.asyncio
+async def test_idle_time_refills_tokens(clock):
+    bucket = TokenBucket.per_minute(60)
+    await bucket.acquire()
+    clock.now += 10  # idle well past one refill period
+    await bucket.acquire()
+    assert clock.sleeps == []
+
+
+def test_host_limiter_shares_bucket_per_host():
+    limiter = HostRateLimiter(60)
+    a = limiter.bucket("https://itunes.apple.com/search?term=x")
+    b = limiter.bucket("https://itunes.apple.com/us/rss/customerreviews/page=1/id=1/json")
+    c = limiter.bucket("https://play.google.com/store")
+    assert a is b
+    assert a is not c
+
+
+@pytest.mark.asyncio
+async def test_host_limiter_paces_each_host_independently(clock):
+    limiter = HostRateLimiter(60)
+    await limiter.acquire("https://a.example/1")
+    await limiter.acquire("https://b.example/1")
+    assert clock.sleeps == []
+
+    await limiter.acquire("https://a.example/2")
+    assert sum(clock.sleeps) == pytest.approx(1.0)
+
+
+# ---------------------------------------------------------------------------
+# AdaptiveRateLimiter
+# ---------------------------------------------------------------------------
+
+
+def _adaptive() -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(TokenBucket.per_minute(30))
+
+
+@pytest.mark.asyncio
+async def test_adaptive_spends_budget_then_waits_exactly_until_reset(clock):
+    limiter = _adaptive()
+    limiter.update(remaining=3, reset_after=40)
+
+    for _ in range(3):
+        await limiter.acquire()
+    assert clock.sleeps == []
+
+    await limiter.acquire()
+    # Waited out the window, then fell back to the bucket (first token is free).
+    assert clock.sleeps == [pytest.approx(40.0)]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_uses_fallback_bucket_until_headers_arrive(clock):
+    limiter = _adaptive()
+    await limiter.acquire()
+    await limiter.acquire()
+    assert sum(clock.sleeps) == pytest.approx(2.0)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_late_response_in_same_window_never_raises_budget(clock):
+    limiter = _adaptive()
+    limiter.update(remaining=1, reset_after=30)
+    await limiter.acquire()
+    # A slower, earlier-issued response still reports the older, higher count.
+    limiter.update(remaining=5, reset_after=30)
+
+    await limiter.acquire()
+    assert clock.sleeps == [pytest.approx(30.0)]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_new_window_replaces_budget(clock):
+    limiter = _adaptive()
+    limiter.update(remaining=0, reset_after=30)
+    limiter.update(remaining=100, reset_after=600)
+
+    await limiter.acquire()
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_adaptive_pause_holds_requests(clock):
+    limiter = _adaptive()
+    limiter.update(remaining=50, reset_after=600)
+    limiter.pause(7)
+
+    await limiter.acquire()
+    assert clock.sleeps[0] == pytest.approx(7.0)
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    from datetime import UTC, datetime, timedelta
+    from email.utils import format_datetime
+
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    future = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+    assert 25 < parse_retry_after(future) <= 30
@@ -0,0 +1,111 @@
+"""Tests for outbound/http/scheduler.py — FetchScheduler and host limit parsing."""
+import asyncio
+
+import pytest
+
+from outbound.http.scheduler import FetchScheduler, HostLimit, parse_host_limits
+
+
+def test_parse_host_limits():
+    assert parse_host_limits(" play.google.com=4/120, HNRSS.org=2 ,") == {
+        "play.google.com": HostLimit(4, 120.0),
+        "hnrss.org": HostLimit(2, None),
+    }
+    assert parse_host_limits("") == {}
+
+
+@pytest.mark.parametrize("spec", ["a.com", "=2", "a.com=0", "a.com=x", "a.com=2/0"])
+def test_parse_host_limits_rejects_bad_entries(spec):
+    with pytest.raises(ValueError, match="Invalid host limit"):
+        parse_host_limits(spec)
+
+
+async def _run_all(scheduler, requests, *, hold=0.01):
+    in_flight: dict[str, int] = {"*": 0}
+    peak: dict[str, int] = {}
+
+    async def _one(host: str, source: str) -> None:
+        async with scheduler.slot(host, source=source):
+            for key in ("*", host):
+                in_flight[key] = in_flight.get(key, 0) + 1
+                peak[key] = max(peak.get(key, 0), in_flight[key])
+            await asyncio.sleep(hold)
+            for key in ("*", host):
+                in_flight[key] -= 1
+
+    await asyncio.gather(*[_one(host, source) for host, source in requests])
+    return peak
+
+
+@pytest.mark.asyncio
+async def test_caps_in_flight_per_host_and_globally():
+    scheduler = FetchScheduler(
+        max_in_flight=3, default_concurrency=2, host_limits={"c.example": HostLimit(1)}
+    )
+    requests = [(host, host) for host in ("a.example", "b.example", "c.example") for _ in range(4)]
+
+    peak = await _run_all(scheduler, requests)
+
+    assert peak == {"*": 3, "a.example": 2, "b.example": 2, "c.example": 1}
+
+
+@pytest.mark.asyncio
+async def test_global_slots_alternate_between_waiting_sources():
+    scheduler = FetchScheduler(max_in_flight=1)
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def _one(host: str, source: str) -> None:
+        async with scheduler.slot(host, source=source):
+            order.append(source)
+            await gate.wait()
+
+    blocker = asyncio.create_task(_one("feeds.example", "rss"))
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(_one(f"feed{i}.example", "rss")) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(_one("www.reddit.com", "reddit")))
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(blocker, *tasks)
+
+    assert order == ["rss", "rss", "reddit", "rss", "rss"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    scheduler = FetchScheduler(max_in_flight=1)
+    release = asyncio.Event()
+
+    async def _hold() -> None:
+        async with scheduler.slot("a.example", source="a"):
+            await release.wait()
+
+    holder = asyncio.create_task(_hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    release.set()
+    await holder
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    peak = await _run_all(scheduler, [("a.example", "a"), ("b.example", "b")])
+    assert peak["*"] == 1
+
+
+@pytest.mark.asyncio
+async def test_host_rate_limit_paces_requests():
+    scheduler = FetchScheduler(host_limits={"a.example": HostLimit(4, 600.0)})
+    loop = asyncio.get_running_loop()
+    started: list[float] = []
+
+    async def _one() -> None:
+        async with scheduler.slot("a.example", source="a"):
+            started.append(loop.time())
+
+    await asyncio.gather(*[_one() for _ in range(3)])
+
+    # 600/min is one request per 0.1s; the first token is available up front.
+    assert started[-1] - started[0] >= 0.19
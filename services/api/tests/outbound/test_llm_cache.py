@@ -0,0 +1,65 @@
+"""Tests for outbound/llm/cache.py — DiskLlmResponseCache."""
+import json
+import os
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from outbound.llm.cache import DiskLlmResponseCache
+
+_DAY = timedelta(days=1)
+
+
+@pytest.mark.asyncio
+async def test_round_trips_responses(tmp_path):
+    cache = DiskLlmResponseCache(tmp_path)
+
+    await cache.save_llm_response("ab12", "gemini", '{"a": 1}')
+
+    assert await cache.get_llm_response("ab12", _DAY) == '{"a": 1}'
+    assert await cache.get_llm_response("cd34", _DAY) is None
+    assert (tmp_path / "ab" / "ab12.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_entries_older_than_ttl_miss(tmp_path):
+    cache = DiskLlmResponseCache(tmp_path)
+    path = tmp_path / "ab" / "ab12.json"
+    path.parent.mkdir()
+    written = datetime.now(UTC) - timedelta(hours=2)
+    path.write_text(
+        json.dumps({"model": "m", "created_at": written.isoformat(), "response": "[]"})
+    )
+
+    assert await cache.get_llm_response("ab12", timedelta(hours=1)) is None
+    assert await cache.get_llm_response("ab12", timedelta(hours=3)) == "[]"
+
+
+@pytest.mark.asyncio
+async def test_corrupt_entry_is_discarded(tmp_path):
+    cache = DiskLlmResponseCache(tmp_path)
+    path = tmp_path / "ab" / "ab12.json"
+    path.parent.mkdir()
+    path.write_text("{trunc")
+
+    assert await cache.get_llm_response("ab12", _DAY) is None
+    assert not path.exists()
+
+
+@pytest.mark.asyncio
+async def test_evict_drops_stale_then_least_recently_used(tmp_path):
+    cache = DiskLlmResponseCache(tmp_path)
+    for key in ("aa01", "bb02", "cc03", "dd04"):
+        await cache.save_llm_response(key, "m", "x" * 100)
+    now = time.time()
+    for key, age in (("aa01", 3 * 86400), ("bb02", 300), ("cc03", 200), ("dd04", 100)):
+        os.utime(tmp_path / key[:2] / f"{key}.json", (now - age, now - age))
+    # A hit makes bb02 the most recently used.
+    assert await cache.get_llm_response("bb02", _DAY) is not None
+
+    entry_size = (tmp_path / "bb" / "bb02.json").stat().st_size
+    removed = await cache.evict_llm_responses(_DAY, max_bytes=2 * entry_size)
+
+    assert removed == 2
+    assert sorted(p.stem for p in tmp_path.glob("*/*.json")) == ["bb02", "dd04"]
@@ -6,8 +6,11 @@ import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.genai import errors as genai_errors
+from tenacity import RetryError, wait_none
 
 from domain.pipeline.models import BriefDraft, ClusteringResult, RawProduct, TaggingResult
+from domain.pipeline.ports import LlmRateLimitedError, SafetyFilteredError
 from outbound.llm.client import GeminiLlmClient
 from tests.conftest import make_post
 
@@ -171,6 +174,37 @@ async def test_tag_posts_uses_correct_model():
     assert call_kwargs.kwargs["model"] == "gemini-2.5-flash-lite"
 
 
+@pytest.mark.asyncio
+async def test_tag_posts_raises_rate_limited_without_retrying():
+    """429s surface immediately so the caller can back off across all batches."""
+    client = _make_client()
+    client._client.aio.models.generate_content = AsyncMock(
+        side_effect=genai_errors.ClientError(
+            429, {"error": {"message": "Resource exhausted", "status": "RESOURCE_EXHAUSTED"}}
+        )
+    )
+
+    with pytest.raises(LlmRateLimitedError):
+        await client.tag_posts([make_post(id=1)])
+
+    client._client.aio.models.generate_content.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_tag_posts_does_not_retry_safety_refusal():
+    """A refusal is deterministic; the caller bisects the batch instead."""
+    resp = _make_response("")
+    resp.text = None
+    resp.candidates = [MagicMock(finish_reason="SAFETY")]
+    client = _make_client()
+    client._client.aio.models.generate_content = AsyncMock(return_value=resp)
+
+    with pytest.raises(SafetyFilteredError):
+        await client.tag_posts([make_post(id=1)])
+
+    client._client.aio.models.generate_content.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_tag_posts_missing_fields_use_defaults():
     """Items missing sentiment/tag_slugs should use safe defaults."""
@@ -702,3 +736,170 @@ async def test_synthesize_brief_raises_when_response_text_is_empty_string():
     cause = exc_info.value.last_attempt.exception()
     assert isinstance(cause, ValueError)
     assert "Gemini returned empty response" in str(cause)
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+def _make_cached_client(cached=None) -> tuple[GeminiLlmClient, AsyncMock]:
+    cache = AsyncMock()
+    cache.get_llm_response = AsyncMock(return_value=cached)
+    cache.evict_llm_responses = AsyncMock(return_value=0)
+    with patch("outbound.llm.client.genai.Client"):
+        client = GeminiLlmClient(api_key="test-key", model="gemini-2.5-flash", cache=cache)
+    client._client.aio.models.generate_content = AsyncMock()
+    return client, cache
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_gemini_call():
+    client, _ = _make_cached_client(cached='[{"post_id": 1, "sentiment": "negative"}]')
+
+    results = await client.tag_posts([make_post(id=1)])
+
+    assert [r.sentiment for r in results] == ["negative"]
+    client._client.aio.models.generate_content.assert_not_awaited()
+    assert (client.cache_stats().hits, client.cache_stats().misses) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_saves_parsed_response_and_evicts_on_first_write():
+    client, cache = _make_cached_client()
+    client._client.aio.models.generate_content.return_value = _make_response(
+        '```json\n{"label": "Billing", "summary": "s"}\n```'
+    )
+
+    result = await client._label_single_cluster(0, [1], {1: make_post(id=1)})
+
+    assert result.label == "Billing"
+    key, model, text = cache.save_llm_response.call_args.args
+    assert (model, text) == ("gemini-2.5-flash-lite", '{"label": "Billing", "summary": "s"}')
+    assert cache.get_llm_response.call_args.args[0] == key
+    cache.evict_llm_responses.assert_awaited_once()
+    assert (client.cache_stats().hits, client.cache_stats().misses) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_unparseable_response_is_not_cached():
+    client, cache = _make_cached_client()
+    client._client.aio.models.generate_content.return_value = _make_response("not json")
+
+    result = await client._label_single_cluster(3, [1], {1: make_post(id=1)})
+
+    assert result.label == "Cluster 3"
+    cache.save_llm_response.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_wrong_shape_response_is_not_cached_and_retried_fresh():
+    """JSON that parses but fails the caller's checks must not be replayed."""
+    client, cache = _make_cached_client()
+    valid = json.dumps({
+        "title": "T", "slug": "t", "summary": "S", "problem_statement": "P",
+        "opportunity": "O", "solution_directions": [], "demand_signals": {},
+        "source_snapshots": [], "source_post_ids": [1],
+    })
+    client._client.aio.models.generate_content.side_effect = [
+        _make_response('{"headline": "missing fields"}'),
+        _make_response(valid),
+    ]
+
+    draft = await GeminiLlmClient.synthesize_brief.retry_with(wait=wait_none())(
+        client, label="L", summary="S", posts=[make_post(id=1)]
+    )
+
+    assert draft.title == "T"
+    assert client._client.aio.models.generate_content.await_count == 2
+    cache.save_llm_response.assert_awaited_once()
+    assert cache.save_llm_response.call_args.args[2] == valid
+
+
+@pytest.mark.asyncio
+async def test_non_list_tagging_response_is_not_cached():
+    client, cache = _make_cached_client()
+    client._client.aio.models.generate_content.return_value = _make_response('{"post_id": 1}')
+
+    with pytest.raises(RetryError):
+        await GeminiLlmClient.tag_posts.retry_with(wait=wait_none())(client, [make_post(id=1)])
+
+    assert client._client.aio.models.generate_content.await_count == 3
+    cache.save_llm_response.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cached_response_of_wrong_shape_is_ignored():
+    client, cache = _make_cached_client(cached='{"post_id": 1}')
+    client._client.aio.models.generate_content.return_value = _make_response("[]")
+
+    assert await client.tag_posts([make_post(id=1)]) == []
+    client._client.aio.models.generate_content.assert_awaited_once()
+    cache.save_llm_response.assert_awaited_once()
+
+
+def test_cache_key_covers_model_prompt_and_config():
+    from outbound.llm.client import _cache_key
+
+    base = _cache_key("m", "prompt", {"temperature": 0.9})
+    assert base == _cache_key("m", "prompt", {"temperature": 0.9})
+    assert base != _cache_key("m2", "prompt", {"temperature": 0.9})
+    assert base != _cache_key("m", "prompt2", {"temperature": 0.9})
+    assert base != _cache_key("m", "prompt", {"temperature": 0.2})
+
+
+@pytest.mark.asyncio
+async def test_cache_failures_fall_back_to_gemini():
+    client, cache = _make_cached_client()
+    cache.get_llm_response.side_effect = RuntimeError("db down")
+    cache.save_llm_response.side_effect = RuntimeError("db down")
+    client._client.aio.models.generate_content.return_value = _make_response("[]")
+
+    assert await client.tag_posts([make_post(id=1)]) == []
+    client._client.aio.models.generate_content.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# Embedding store
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_cluster_posts_embeds_only_posts_without_stored_vectors():
+    posts = [make_post(id=i, title=f"Post {i}") for i in range(1, 5)]
+    store = AsyncMock()
+    store.get_post_embeddings = AsyncMock(return_value={1: [1.0, 0.0], 3: [3.0, 0.0]})
+    with patch("outbound.llm.client.genai.Client"):
+        client = GeminiLlmClient(api_key="k", model="m", embedding_store=store)
+    embed_result = MagicMock()
+    embed_result.embeddings = [MagicMock(values=[2.0, 0.0]), MagicMock(values=[4.0, 0.0])]
+    client._client.aio.models.embed_content = AsyncMock(return_value=embed_result)
+    client._hdbscan_cluster = MagicMock(return_value={-1: [1, 2, 3, 4]})
+
+    await client.cluster_posts(posts)
+
+    model, hashes = store.get_post_embeddings.call_args.args
+    assert model == "gemini-embedding-001" and sorted(hashes) == [1, 2, 3, 4]
+    embedded = client._client.aio.models.embed_content.call_args.kwargs["contents"]
+    assert [t.split()[1] for t in embedded] == ["2", "4"]
+    saved = store.save_post_embeddings.call_args.args[1]
+    assert [(e.post_id, e.text_hash, e.vector) for e in saved] == [
+        (2, hashes[2], [2.0, 0.0]),
+        (4, hashes[4], [4.0, 0.0]),
+    ]
+    vectors = client._hdbscan_cluster.call_args.args[0]
+    assert vectors == [[1.0, 0.0], [2.0, 0.0], [3.0, 0.0], [4.0, 0.0]]
+
+
+@pytest.mark.asyncio
+async def test_cluster_posts_skips_embedding_call_when_all_vectors_are_stored():
+    posts = [make_post(id=i) for i in range(1, 4)]
+    store = AsyncMock()
+    store.get_post_embeddings = AsyncMock(return_value={i: [float(i)] for i in range(1, 4)})
+    with patch("outbound.llm.client.genai.Client"):
+        client = GeminiLlmClient(api_key="k", model="m", embedding_store=store)
+    client._client.aio.models.embed_content = AsyncMock()
+    client._hdbscan_cluster = MagicMock(return_value={-1: [1, 2, 3]})
+
+    await client.cluster_posts(posts)
+
+    client._client.aio.models.embed_content.assert_not_awaited()
+    store.save_post_embeddings.assert_not_awaited()
@@ -182,35 +182,570 @@ async def test_release_advisory_lock_sets_session_none_on_exit_exception():
 
 @pytest.mark.asyncio
 async def test_upsert_posts_empty_list_returns_zero():
+    from domain.pipeline.models import UpsertCounts
+
     db, _ = _make_db()
     repo = PostgresPipelineRepository(db)
 
-    count = await repo.upsert_posts([])
+    counts = await repo.upsert_posts([])
 
-    assert count == 0
+    assert counts == UpsertCounts()
 
 
 @pytest.mark.asyncio
-async def test_upsert_posts_returns_rowcount():
+async def test_upsert_posts_splits_inserted_updated_and_unchanged():
+    from domain.pipeline.models import UpsertCounts
+
     db, session = _make_db()
-    db.session.return_value = session
 
     exec_result = MagicMock()
-    exec_result.rowcount = 3
+    # One row per written post: xmax = 0 for inserts; skipped no-op updates return nothing.
+    exec_result.scalars.return_value.all.return_value = [True, True, False]
     session.execute = AsyncMock(return_value=exec_result)
 
-    posts = [_make_raw_post("a"), _make_raw_post("b"), _make_raw_post("c")]
+    posts = [_make_raw_post(rid) for rid in ("a", "b", "c", "d", "e")]
 
-    with patch("outbound.postgres.pipeline_repository.pg_insert") as mock_insert:
-        mock_stmt = MagicMock()
-        mock_stmt.on_conflict_do_update.return_value = mock_stmt
-        mock_insert.return_value = mock_stmt
-        mock_stmt.excluded = MagicMock()
+    repo = PostgresPipelineRepository(db)
+    counts = await repo.upsert_posts(posts)
 
-        repo = PostgresPipelineRepository(db)
-        count = await repo.upsert_posts(posts)
+    assert counts == UpsertCounts(inserted=2, updated=1, unchanged=2)
+    assert counts.written == 3
+    session.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_upsert_posts_only_updates_rows_whose_engagement_changed():
+    from sqlalchemy.dialects import postgresql
+
+    db, session = _make_db()
+    exec_result = MagicMock()
+    exec_result.scalars.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=exec_result)
+
+    repo = PostgresPipelineRepository(db)
+    await repo.upsert_posts([_make_raw_post("a")])
+
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT ON CONSTRAINT uq_post_source_external_id DO UPDATE" in sql
+    assert "WHERE post.score IS DISTINCT FROM excluded.score" in sql
+    assert "OR post.num_comments IS DISTINCT FROM excluded.num_comments" in sql
+    assert "RETURNING xmax = 0 AS inserted" in sql
+
+
+@pytest.mark.asyncio
+async def test_upsert_posts_refresh_content_rewrites_parsed_fields():
+    from sqlalchemy.dialects import postgresql
+
+    db, session = _make_db()
+    exec_result = MagicMock()
+    exec_result.scalars.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=exec_result)
+
+    repo = PostgresPipelineRepository(db)
+    await repo.upsert_posts([_make_raw_post("a")], refresh_content=True)
+
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "title = excluded.title" in sql
+    assert "OR post.body IS DISTINCT FROM excluded.body" in sql
+    # Archived engagement is older than what refreshes have stored since.
+    assert "score = excluded.score" not in sql
+    assert "num_comments" not in sql.split("DO UPDATE")[1]
+
+
+@pytest.mark.asyncio
+async def test_upsert_posts_refresh_content_keeps_time_of_undated_rss_entry():
+    from sqlalchemy.dialects import postgresql
+
+    from outbound.rss.client import parse_archived
+
+    db, session = _make_db()
+    exec_result = MagicMock()
+    exec_result.scalars.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=exec_result)
+    feed = (
+        "<rss><channel><item><title>Undated</title>"
+        "<link>https://a.example/post</link></item></channel></rss>"
+    )
+
+    repo = PostgresPipelineRepository(db)
+    await repo.upsert_posts(parse_archived({}, feed), refresh_content=True)
+
+    # The parser dates an undated entry "now"; the stored time must survive.
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "external_created_at" not in sql.split("DO UPDATE")[1]
+
+
+@pytest.mark.asyncio
+async def test_upsert_posts_stores_dedup_keys():
+    from dataclasses import replace
+
+    db, session = _make_db()
+    exec_result = MagicMock()
+    exec_result.scalars.return_value.all.return_value = [True]
+    session.execute = AsyncMock(return_value=exec_result)
+
+    post = replace(
+        _make_raw_post("a"),
+        title="Show HN: an open-source CRM for small agencies",
+        link_url="https://www.example.com/story?utm_source=x",
+    )
+    await PostgresPipelineRepository(db).upsert_posts([post])
+
+    params = session.execute.call_args.args[0].compile().params
+    assert params["canonical_url_m0"] == "example.com/story"
+    assert params["content_fingerprint_m0"] is not None
+
+
+@pytest.mark.asyncio
+async def test_upsert_posts_leaves_store_reviews_unfingerprinted():
+    """The same review text about two different apps must not be linked."""
+    from dataclasses import replace
 
-    assert count == 3
+    db, session = _make_db()
+    exec_result = MagicMock()
+    exec_result.scalars.return_value.all.return_value = [True, True]
+    session.execute = AsyncMock(return_value=exec_result)
+
+    text = {"title": "", "body": "Great app, I love using it every single day at work"}
+    reviews = [
+        replace(_make_raw_post("appstore-1-r1"), source="app_store", **text),
+        replace(_make_raw_post("playstore-2-r1"), source="play_store", **text),
+    ]
+    await PostgresPipelineRepository(db).upsert_posts(reviews)
+
+    params = session.execute.call_args.args[0].compile().params
+    assert params["content_fingerprint_m0"] is None
+    assert params["content_fingerprint_m1"] is None
+
+
+@pytest.mark.asyncio
+async def test_link_duplicates_links_pending_posts_to_earliest_match():
+    from datetime import timedelta
+
+    from sqlalchemy.dialects import postgresql
+
+    db, session = _make_db()
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=3))
+
+    linked = await PostgresPipelineRepository(db).link_duplicates(timedelta(hours=72))
+
+    assert linked == 3
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE post SET")
+    assert "duplicate_of_id=(SELECT min(post_1.id)" in sql
+    assert "post_1.id < post.id" in sql
+    assert "post_1.canonical_url = post.canonical_url" in sql
+    assert "OR post_1.content_fingerprint = post.content_fingerprint" in sql
+    assert "post.tagging_status = %(tagging_status_1)s" in sql
+    session.commit.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# get_fetch_cursors / save_fetch_cursors
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_get_fetch_cursors_maps_rows_with_utc():
+    from domain.pipeline.models import FetchCursor
+
+    db, session = _make_db()
+
+    row = MagicMock()
+    row.key = "saas"
+    row.external_id = "abc"
+    row.external_created_at = datetime(2026, 2, 1, 12, 0)
+    exec_result = MagicMock()
+    exec_result.scalars.return_value.all.return_value = [row]
+    session.execute = AsyncMock(return_value=exec_result)
+
+    repo = PostgresPipelineRepository(db)
+    cursors = await repo.get_fetch_cursors("reddit")
+
+    assert cursors == {
+        "saas": FetchCursor(
+            external_id="abc", created_at=datetime(2026, 2, 1, 12, 0, tzinfo=UTC)
+        )
+    }
+
+
+@pytest.mark.asyncio
+async def test_save_fetch_cursors_empty_is_noop():
+    db, session = _make_db()
+    repo = PostgresPipelineRepository(db)
+
+    await repo.save_fetch_cursors("reddit", {})
+
+    db.session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_save_fetch_cursors_upserts_without_moving_backwards():
+    from sqlalchemy.dialects import postgresql
+
+    from domain.pipeline.models import FetchCursor
+
+    db, session = _make_db()
+    repo = PostgresPipelineRepository(db)
+
+    await repo.save_fetch_cursors(
+        "reddit",
+        {"saas": FetchCursor(external_id="abc", created_at=datetime(2026, 2, 1, tzinfo=UTC))},
+    )
+
+    stmt = session.execute.call_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "INSERT INTO fetch_cursor" in sql
+    assert "ON CONFLICT (source, key) DO UPDATE" in sql
+    assert "WHERE fetch_cursor.external_created_at <= excluded.external_created_at" in sql
+    session.commit.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# get_feed_validators / save_feed_validators
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_get_feed_validators_empty_urls_skips_query():
+    db, _ = _make_db()
+    repo = PostgresPipelineRepository(db)
+
+    assert await repo.get_feed_validators([]) == {}
+    db.session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_feed_validators_maps_rows():
+    from domain.pipeline.models import FeedValidators
+
+    db, session = _make_db()
+    row = MagicMock()
+    row.url = "https://a.example/rss"
+    row.etag = '"v1"'
+    row.last_modified = None
+    row.content_hash = "h"
+    exec_result = MagicMock()
+    exec_result.scalars.return_value.all.return_value = [row]
+    session.execute = AsyncMock(return_value=exec_result)
+
+    repo = PostgresPipelineRepository(db)
+    validators = await repo.get_feed_validators(["https://a.example/rss"])
+
+    assert validators == {
+        "https://a.example/rss": FeedValidators(
+            url="https://a.example/rss", etag='"v1"', last_modified=None, content_hash="h",
+        )
+    }
+
+
+@pytest.mark.asyncio
+async def test_save_feed_validators_upserts_by_url():
+    from sqlalchemy.dialects import postgresql
+
+    from domain.pipeline.models import FeedValidators
+
+    db, session = _make_db()
+    repo = PostgresPipelineRepository(db)
+
+    await repo.save_feed_validators([
+        FeedValidators(
+            url="https://a.example/rss", etag=None, last_modified=None, content_hash="h"
+        ),
+    ])
+
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "INSERT INTO feed_validator" in sql
+    assert "ON CONFLICT (url) DO UPDATE" in sql
+    session.commit.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# get_app_release_dates / save_app_release_dates
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_get_app_release_dates_empty_ids_skips_query():
+    from datetime import timedelta
+
+    db, _ = _make_db()
+    repo = PostgresPipelineRepository(db)
+
+    assert await repo.get_app_release_dates("play_store", [], timedelta(days=30)) == {}
+    db.session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_app_release_dates_returns_fresh_rows_with_utc():
+    from datetime import timedelta
+
+    from sqlalchemy.dialects import postgresql
+
+    db, session = _make_db()
+    dated = MagicMock(app_id="com.a", released_at=datetime(2026, 1, 15))
+    undated = MagicMock(app_id="com.b", released_at=None)
+    exec_result = MagicMock()
+    exec_result.scalars.return_value.all.return_value = [dated, undated]
+    session.execute = AsyncMock(return_value=exec_result)
+
+    repo = PostgresPipelineRepository(db)
+    released = await repo.get_app_release_dates(
+        "play_store", ["com.a", "com.b"], timedelta(days=30)
+    )
+
+    assert released == {"com.a": datetime(2026, 1, 15, tzinfo=UTC), "com.b": None}
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "app_detail.fetched_at >=" in sql
+
+
+@pytest.mark.asyncio
+async def test_save_app_release_dates_upserts_by_source_and_app_id():
+    from sqlalchemy.dialects import postgresql
+
+    db, session = _make_db()
+    repo = PostgresPipelineRepository(db)
+
+    await repo.save_app_release_dates(
+        "play_store", {"com.a": datetime(2026, 1, 15, tzinfo=UTC), "com.b": None}
+    )
+
+    stmt = session.execute.call_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "INSERT INTO app_detail" in sql
+    assert "ON CONFLICT (source, app_id) DO UPDATE" in sql
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    assert datetime(2026, 1, 15) in params.values()
+    session.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_save_app_release_dates_empty_is_noop():
+    db, _ = _make_db()
+    repo = PostgresPipelineRepository(db)
+
+    await repo.save_app_release_dates("play_store", {})
+
+    db.session.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# get_recent_external_ids / update_engagement
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_get_recent_external_ids_filters_by_source_and_age():
+    from datetime import timedelta
+
+    from sqlalchemy.dialects import postgresql
+
+    db, session = _make_db()
+    exec_result = MagicMock()
+    exec_result.scalars.return_value.all.return_value = ["b", "a"]
+    session.execute = AsyncMock(return_value=exec_result)
+
+    repo = PostgresPipelineRepository(db)
+    ids = await repo.get_recent_external_ids("reddit", timedelta(days=7))
+
+    assert ids == ["b", "a"]
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "post.external_created_at >=" in sql
+    assert "post.deleted_at IS NULL" in sql
+
+
+@pytest.mark.asyncio
+async def test_update_engagement_is_one_set_based_update_of_changed_rows():
+    from sqlalchemy.dialects import postgresql
+
+    from domain.pipeline.models import PostEngagement
+
+    db, session = _make_db()
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+    repo = PostgresPipelineRepository(db)
+
+    updated = await repo.update_engagement(
+        "reddit", [PostEngagement("a", 10, 2), PostEngagement("b", 3, 0)]
+    )
+
+    assert updated == 1
+    session.execute.assert_awaited_once()
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE post SET")
+    assert "FROM (VALUES" in sql
+    assert "post.score IS DISTINCT FROM fresh.score" in sql
+    session.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_update_engagement_empty_is_noop():
+    db, _ = _make_db()
+    repo = PostgresPipelineRepository(db)
+
+    assert await repo.update_engagement("reddit", []) == 0
+    db.session.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# get_trends / save_trends
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_get_trends_returns_fresh_payload():
+    from datetime import timedelta
+
+    from sqlalchemy.dialects import postgresql
+
+    db, session = _make_db()
+    exec_result = MagicMock()
+    exec_result.scalar_one_or_none.return_value = {"avg_interest": {"saas": 40.0}}
+    session.execute = AsyncMock(return_value=exec_result)
+
+    repo = PostgresPipelineRepository(db)
+    payload = await repo.get_trends("crm|saas", timedelta(hours=72))
+
+    assert payload == {"avg_interest": {"saas": 40.0}}
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "trends_cache.fetched_at >=" in sql
+
+
+@pytest.mark.asyncio
+async def test_save_trends_upserts_by_keywords():
+    from sqlalchemy.dialects import postgresql
+
+    db, session = _make_db()
+    repo = PostgresPipelineRepository(db)
+
+    await repo.save_trends("crm|saas", {"avg_interest": {}})
+
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "INSERT INTO trends_cache" in sql
+    assert "ON CONFLICT (keywords) DO UPDATE" in sql
+    session.commit.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Post embeddings
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_save_post_embeddings_packs_float32_and_upserts():
+    import struct
+
+    from sqlalchemy.dialects import postgresql
+
+    from domain.pipeline.models import PostEmbedding
+
+    db, session = _make_db()
+    repo = PostgresPipelineRepository(db)
+
+    await repo.save_post_embeddings("emb", [PostEmbedding(7, "h7", [0.5, -1.0, 2.0])])
+
+    stmt = session.execute.call_args.args[0]
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT (post_id, model) DO UPDATE" in str(compiled)
+    assert compiled.params["vector_m0"] == struct.pack("<3f", 0.5, -1.0, 2.0)
+    assert compiled.params["dims_m0"] == 3
+    session.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_post_embeddings_returns_only_matching_text_hashes():
+    import struct
+
+    db, session = _make_db()
+    exec_result = MagicMock()
+    exec_result.all.return_value = [
+        (1, "h1", struct.pack("<2f", 1.0, 2.0)),
+        (2, "stale", struct.pack("<2f", 3.0, 4.0)),
+    ]
+    session.execute = AsyncMock(return_value=exec_result)
+    repo = PostgresPipelineRepository(db)
+
+    vectors = await repo.get_post_embeddings("emb", {1: "h1", 2: "h2"})
+
+    assert vectors == {1: [1.0, 2.0]}
+
+
+# ---------------------------------------------------------------------------
+# LLM response cache
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_get_llm_response_marks_fresh_hit_used():
+    from datetime import timedelta
+
+    from sqlalchemy.dialects import postgresql
+
+    db, session = _make_db()
+    exec_result = MagicMock()
+    exec_result.scalar_one_or_none.return_value = '{"label": "x"}'
+    session.execute = AsyncMock(return_value=exec_result)
+
+    repo = PostgresPipelineRepository(db)
+    response = await repo.get_llm_response("k1", timedelta(hours=1))
+
+    assert response == '{"label": "x"}'
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "UPDATE llm_response_cache SET used_at=" in sql
+    assert "llm_response_cache.created_at >=" in sql
+    assert "RETURNING llm_response_cache.response" in sql
+    session.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_evict_llm_responses_drops_expired_and_least_recently_used_overflow():
+    from datetime import timedelta
+
+    from sqlalchemy.dialects import postgresql
+
+    db, session = _make_db()
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=3))
+
+    repo = PostgresPipelineRepository(db)
+    removed = await repo.evict_llm_responses(timedelta(hours=1), 1000)
+
+    assert removed == 3
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("DELETE FROM llm_response_cache")
+    assert "sum(octet_length(llm_response_cache.response)) OVER (ORDER BY" in sql
+    assert "llm_response_cache.used_at DESC" in sql
+
+
+# ---------------------------------------------------------------------------
+# get_backfill_checkpoints / save_backfill_checkpoint
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_get_backfill_checkpoints_maps_rows_by_partition():
+    from domain.pipeline.models import BackfillCheckpoint
+
+    db, session = _make_db()
+    row = MagicMock(partition="reddit:saas", cursor="t3_x", fetched=120, done=False)
+    exec_result = MagicMock()
+    exec_result.scalars.return_value.all.return_value = [row]
+    session.execute = AsyncMock(return_value=exec_result)
+
+    repo = PostgresPipelineRepository(db)
+    checkpoints = await repo.get_backfill_checkpoints("2026-09-01..2026-10-01")
+
+    assert checkpoints == {
+        "reddit:saas": BackfillCheckpoint("reddit:saas", cursor="t3_x", fetched=120)
+    }
+
+
+@pytest.mark.asyncio
+async def test_save_backfill_checkpoint_upserts_by_job_and_partition():
+    from sqlalchemy.dialects import postgresql
+
+    from domain.pipeline.models import BackfillCheckpoint
+
+    db, session = _make_db()
+    repo = PostgresPipelineRepository(db)
+
+    await repo.save_backfill_checkpoint(
+        "2026-09-01..2026-10-01", BackfillCheckpoint("rss:https://a/rss", done=True)
+    )
+
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "INSERT INTO backfill_checkpoint" in sql
+    assert "ON CONFLICT (job, partition) DO UPDATE" in sql
     session.commit.assert_called_once()
 
 
@@ -368,26 +903,33 @@ async def test_save_tagging_results_no_tag_link_when_tag_not_found():
 
 
 # ---------------------------------------------------------------------------
-# get_existing_tag_slugs
+# get_tag_post_counts
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_get_existing_tag_slugs_returns_slugs():
+async def test_get_tag_post_counts_returns_counts_by_slug():
+    from sqlalchemy.dialects import postgresql
+
     db, session = _make_db()
     db.session.return_value = session
 
     exec_result = MagicMock()
-    exec_result.__iter__ = MagicMock(return_value=iter([("ai-ml",), ("complaint",), ("saas",)]))
+    exec_result.__iter__ = MagicMock(
+        return_value=iter([("ai-ml", 12), ("complaint", 3), ("saas", 0)])
+    )
     session.execute = AsyncMock(return_value=exec_result)
 
     repo = PostgresPipelineRepository(db)
-    slugs = await repo.get_existing_tag_slugs()
+    counts = await repo.get_tag_post_counts()
 
-    assert slugs == ["ai-ml", "complaint", "saas"]
+    assert counts == {"ai-ml": 12, "complaint": 3, "saas": 0}
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "LEFT OUTER JOIN post_tag" in sql
+    assert "GROUP BY tag.slug" in sql
 
 
 @pytest.mark.asyncio
-async def test_get_existing_tag_slugs_empty():
+async def test_get_tag_post_counts_empty():
     db, session = _make_db()
     db.session.return_value = session
 
@@ -396,9 +938,9 @@ async def test_get_existing_tag_slugs_empty():
     session.execute = AsyncMock(return_value=exec_result)
 
     repo = PostgresPipelineRepository(db)
-    slugs = await repo.get_existing_tag_slugs()
+    counts = await repo.get_tag_post_counts()
 
-    assert slugs == []
+    assert counts == {}
 
 
 # ---------------------------------------------------------------------------
@@ -585,3 +585,240 @@ async def test_fetch_reviews_exception_is_caught_and_returns_empty(caplog):
         result = await client.fetch_reviews("com.example.app")
 
     assert result == []
+
+
+# ---------------------------------------------------------------------------
+# PlayStoreClient.search_apps — app-detail cache
+# ---------------------------------------------------------------------------
+
+
+def _make_cache(cached=None):
+    cache = AsyncMock()
+    cache.get_app_release_dates = AsyncMock(return_value=cached or {})
+    cache.save_app_release_dates = AsyncMock(return_value=None)
+    return cache
+
+
+def _fake_gps(items, released_by_id, calls):
+    async def to_thread_side_effect(fn, *args, **kwargs):
+        calls.append((fn.__name__, args))
+        if fn.__name__ == "search":
+            return items
+        app_id = args[0]
+        if isinstance(released_by_id.get(app_id), Exception):
+            raise released_by_id[app_id]
+        return _gps_detail(app_id=app_id, released=released_by_id.get(app_id))
+
+    return to_thread_side_effect
+
+
+@pytest.mark.asyncio
+async def test_search_apps_uses_cached_release_dates_without_detail_calls():
+    items = [_gps_item(app_id="com.a"), _gps_item(app_id="com.b")]
+    cache = _make_cache({"com.a": datetime(2026, 1, 1, tzinfo=UTC), "com.b": None})
+    calls = []
+    client = PlayStoreClient(detail_cache=cache, detail_ttl_days=7)
+
+    with (
+        patch(
+            "outbound.playstore.client.asyncio.to_thread",
+            side_effect=_fake_gps(items, {}, calls),
+        ),
+        patch("outbound.playstore.client.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        result = await client.search_apps(["kw"], max_age_days=365)
+
+    assert [name for name, _ in calls] == ["search"]
+    assert [p.launched_at for p in result] == [datetime(2026, 1, 1, tzinfo=UTC), None]
+    cache.get_app_release_dates.assert_awaited_once_with(
+        "play_store", ["com.a", "com.b"], timedelta(days=7)
+    )
+    cache.save_app_release_dates.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_apps_fetches_and_caches_only_misses():
+    items = [_gps_item(app_id="com.a"), _gps_item(app_id="com.b"), _gps_item(app_id="com.c")]
+    cache = _make_cache({"com.a": datetime(2026, 1, 1, tzinfo=UTC)})
+    calls = []
+    gps = _fake_gps(items, {"com.b": "Feb 2, 2026", "com.c": RuntimeError("blocked")}, calls)
+    client = PlayStoreClient(detail_cache=cache)
+
+    with (
+        patch("outbound.playstore.client.asyncio.to_thread", side_effect=gps),
+        patch("outbound.playstore.client.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        result = await client.search_apps(["kw"], max_age_days=365)
+
+    assert sorted(args[0] for name, args in calls if name == "app") == ["com.b", "com.c"]
+    # Failed lookups are not cached, so they are retried next run.
+    cache.save_app_release_dates.assert_awaited_once_with(
+        "play_store", {"com.b": datetime(2026, 2, 2, tzinfo=UTC)}
+    )
+    assert len(result) == 3
+
+
+@pytest.mark.asyncio
+async def test_search_apps_stops_detail_lookups_once_limit_apps_qualify():
+    items = [_gps_item(app_id=f"com.app{i}") for i in range(6)]
+    calls = []
+    gps = _fake_gps(items, {"com.app0": "Jan 1, 2020", "com.app1": "Feb 2, 2026"}, calls)
+    client = PlayStoreClient(detail_concurrency=4)
+
+    with (
+        patch("outbound.playstore.client.asyncio.to_thread", side_effect=gps),
+        patch("outbound.playstore.client.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        result = await client.search_apps(["kw"], limit=2, max_age_days=365)
+
+    # app0 is too old, so one more hit is looked up to fill the second slot.
+    looked_up = [args[0] for name, args in calls if name == "app"]
+    assert sorted(looked_up) == ["com.app0", "com.app1", "com.app2"]
+    assert [p.external_id for p in result] == ["com.app1", "com.app2"]
+
+
+@pytest.mark.asyncio
+async def test_search_apps_runs_detail_lookups_concurrently_up_to_limit():
+    import asyncio
+    import contextlib
+
+    items = [_gps_item(app_id=f"com.app{i}") for i in range(6)]
+    in_flight = 0
+    peak = 0
+    never = asyncio.Event()
+
+    async def to_thread_side_effect(fn, *args, **kwargs):
+        nonlocal in_flight, peak
+        if fn.__name__ == "search":
+            return items
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # asyncio.sleep is patched out below, so park on a timeout instead.
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(never.wait(), timeout=0.01)
+        in_flight -= 1
+        return _gps_detail(app_id=args[0])
+
+    client = PlayStoreClient(detail_concurrency=3)
+
+    with (
+        patch("outbound.playstore.client.asyncio.to_thread", side_effect=to_thread_side_effect),
+        patch("outbound.playstore.client.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        await client.search_apps(["kw"], limit=10, max_age_days=365)
+
+    assert peak == 3
+
+
+# ---------------------------------------------------------------------------
+# PlayStoreClient.fetch_reviews — incremental from a high-water mark
+# ---------------------------------------------------------------------------
+
+
+def _mark(review_id, at):
+    from domain.pipeline.models import FetchCursor
+
+    return FetchCursor(
+        external_id=f"playstore-com.example.app-{review_id}",
+        created_at=at.replace(tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_reviews_follows_continuation_until_mark():
+    batches = [
+        (
+            [
+                _gps_review("r5", at=datetime(2026, 2, 5)),
+                _gps_review("r4", at=datetime(2026, 2, 4)),
+            ],
+            "t1",
+        ),
+        (
+            [
+                _gps_review("r3", at=datetime(2026, 2, 3)),
+                _gps_review("r2", at=datetime(2026, 2, 2)),
+            ],
+            "t2",
+        ),
+        ([_gps_review("r1", at=datetime(2026, 2, 1))], None),
+    ]
+    to_thread = AsyncMock(side_effect=batches)
+    client = PlayStoreClient()
+
+    with patch("outbound.playstore.client.asyncio.to_thread", new=to_thread):
+        result = await client.fetch_reviews(
+            "com.example.app", count=2, since=_mark("r2", datetime(2026, 2, 2))
+        )
+
+    assert [p.external_id.rsplit("-", 1)[1] for p in result] == ["r5", "r4", "r3"]
+    assert to_thread.await_count == 2
+    assert to_thread.await_args_list[1].kwargs == {"continuation_token": "t1"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_reviews_with_mark_raises_when_a_later_batch_fails():
+    first = ([_gps_review("r5", at=datetime(2026, 2, 5))], "t1")
+    to_thread = AsyncMock(side_effect=[first, RuntimeError("HTTP 503")])
+    client = PlayStoreClient()
+
+    with (
+        patch("outbound.playstore.client.asyncio.to_thread", new=to_thread),
+        pytest.raises(RuntimeError),
+    ):
+        await client.fetch_reviews(
+            "com.example.app", count=1, since=_mark("r1", datetime(2026, 2, 1))
+        )
+
+    assert to_thread.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_reviews_without_mark_reads_single_batch():
+    to_thread = AsyncMock(return_value=([_gps_review("r1")], "more"))
+    client = PlayStoreClient()
+
+    with patch("outbound.playstore.client.asyncio.to_thread", new=to_thread):
+        result = await client.fetch_reviews("com.example.app", count=1)
+
+    assert len(result) == 1
+    to_thread.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_reviews_returns_nothing_when_newest_is_the_mark():
+    to_thread = AsyncMock(return_value=([_gps_review("r9", at=datetime(2026, 2, 9))], "more"))
+    client = PlayStoreClient()
+
+    with patch("outbound.playstore.client.asyncio.to_thread", new=to_thread):
+        result = await client.fetch_reviews(
+            "com.example.app", since=_mark("r9", datetime(2026, 2, 9))
+        )
+
+    assert result == []
+    to_thread.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_scraper_calls_hold_a_scheduler_slot():
+    from outbound.http.scheduler import FetchScheduler
+
+    scheduler = FetchScheduler(max_in_flight=1)
+    slots = []
+    real_slot = scheduler.slot
+
+    def slot(host, *, source):
+        slots.append((host, source))
+        return real_slot(host, source=source)
+
+    to_thread = AsyncMock(return_value=([_gps_review("r1")], None))
+    client = PlayStoreClient(scheduler=scheduler)
+
+    with (
+        patch.object(scheduler, "slot", side_effect=slot),
+        patch("outbound.playstore.client.asyncio.to_thread", new=to_thread),
+    ):
+        result = await client.fetch_reviews("com.example.app", count=1)
+
+    assert len(result) == 1
+    assert slots == [("play.google.com", "play_store")]
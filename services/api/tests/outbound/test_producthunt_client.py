@@ -67,7 +67,7 @@ async def test_fetch_recent_products_returns_empty_when_no_token():
     """When api_token is empty, no HTTP call should be made and [] returned."""
     client = _make_client(token="")
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
         mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
@@ -89,7 +89,7 @@ async def test_fetch_recent_products_returns_products():
     edge = _make_edge(id="123", name="AppX", topics=["Developer Tools"])
     data = _ph_data([edge])
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=_make_resp(data))
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -111,7 +111,7 @@ async def test_fetch_recent_products_no_topics_sets_category_none():
     edge = _make_edge(topics=[])  # no topics
     data = _ph_data([edge])
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=_make_resp(data))
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -128,7 +128,7 @@ async def test_fetch_recent_products_parses_created_at():
     edge = _make_edge(created_at="2026-02-18T10:00:00Z")
     data = _ph_data([edge])
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=_make_resp(data))
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -146,7 +146,7 @@ async def test_fetch_recent_products_null_created_at_gives_none_launched_at():
     edge = _make_edge(created_at=None)
     data = _ph_data([edge])
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=_make_resp(data))
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -163,7 +163,7 @@ async def test_fetch_recent_products_invalid_created_at_gives_none():
     edge = _make_edge(created_at="not-a-date")
     data = _ph_data([edge])
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=_make_resp(data))
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -179,7 +179,7 @@ async def test_fetch_recent_products_empty_edges():
     client = _make_client()
     data = _ph_data([])
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=_make_resp(data))
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -196,7 +196,7 @@ async def test_fetch_recent_products_missing_data_key():
     client = _make_client()
     data = {}  # completely empty
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=_make_resp(data))
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -212,7 +212,7 @@ async def test_fetch_recent_products_sends_authorization_header():
     client = _make_client(token="my-secret-token")
     data = _ph_data([])
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=_make_resp(data))
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -229,7 +229,7 @@ async def test_fetch_recent_products_uses_limit_variable():
     client = _make_client()
     data = _ph_data([])
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=_make_resp(data))
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -251,7 +251,7 @@ async def test_fetch_recent_products_multiple_products():
     ]
     data = _ph_data(edges)
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=_make_resp(data))
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -271,7 +271,7 @@ async def test_fetch_recent_products_optional_fields_can_be_none():
     edge = _make_edge(tagline=None, description=None, url=None)
     data = _ph_data([edge])
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=_make_resp(data))
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -295,7 +295,7 @@ async def test_fetch_recent_products_http_error_raises_after_retries():
     bad_resp = MagicMock()
     bad_resp.raise_for_status = MagicMock(side_effect=Exception("HTTP 401"))
 
-    with patch("outbound.producthunt.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=bad_resp)
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -303,3 +303,92 @@ async def test_fetch_recent_products_http_error_raises_after_retries():
 
         with pytest.raises(Exception):  # tenacity wraps in RetryError
             await client.fetch_recent_products()
+
+
+# ---------------------------------------------------------------------------
+# stream_products — cursor pagination back to the high-water mark
+# ---------------------------------------------------------------------------
+
+
+def _ph_page(edges: list, end_cursor: str | None) -> dict:
+    return {
+        "data": {
+            "posts": {
+                "edges": edges,
+                "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+            }
+        }
+    }
+
+
+def _shared_http(*pages: dict) -> AsyncMock:
+    http = AsyncMock()
+    http.post = AsyncMock(side_effect=[_make_resp(page) for page in pages])
+    return http
+
+
+def _mark(id: str, created_at: str):
+    from domain.pipeline.models import FetchCursor
+
+    return FetchCursor(
+        external_id=id, created_at=datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_products_without_mark_fetches_one_page():
+    http = _shared_http(_ph_page([_make_edge(id="1")], end_cursor="c1"))
+    client = ProductHuntApiClient(api_token="t", http=http)
+
+    pages = [page async for page in client.stream_products()]
+
+    assert [[p.external_id for p in page] for page in pages] == [["1"]]
+    http.post.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stream_products_follows_after_cursor_until_mark():
+    http = _shared_http(
+        _ph_page([
+            _make_edge(id="5", created_at="2026-02-18T05:00:00Z"),
+            _make_edge(id="4", created_at="2026-02-18T04:00:00Z"),
+        ], end_cursor="c1"),
+        _ph_page([
+            _make_edge(id="3", created_at="2026-02-18T03:00:00Z"),
+            _make_edge(id="2", created_at="2026-02-18T02:00:00Z"),
+        ], end_cursor="c2"),
+    )
+    client = ProductHuntApiClient(api_token="t", http=http)
+
+    pages = [
+        page async for page in client.stream_products(
+            since=_mark("2", "2026-02-18T02:00:00Z"), page_size=2
+        )
+    ]
+
+    assert [[p.external_id for p in page] for page in pages] == [["5", "4"], ["3"]]
+    variables = [c.kwargs["json"]["variables"] for c in http.post.await_args_list]
+    assert variables == [{"first": 2, "after": None}, {"first": 2, "after": "c1"}]
+
+
+@pytest.mark.asyncio
+async def test_stream_products_stops_at_last_page_and_page_cap():
+    edge = _make_edge(id="9", created_at="2026-02-18T09:00:00Z")
+    http = _shared_http(*[_ph_page([edge], end_cursor=f"c{i}") for i in range(3)])
+    client = ProductHuntApiClient(api_token="t", http=http, max_pages=2)
+
+    pages = [
+        page async for page in client.stream_products(since=_mark("0", "2026-01-01T00:00:00Z"))
+    ]
+
+    assert len(pages) == 2
+    assert http.post.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_products_yields_nothing_without_token():
+    http = AsyncMock()
+    client = ProductHuntApiClient(api_token="", http=http)
+
+    assert [page async for page in client.stream_products()] == []
+    http.post.assert_not_called()
@@ -0,0 +1,112 @@
+"""Tests for outbound/archive/store.py — raw payload archive and replay."""
+import gzip
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from domain.pipeline.models import RawPost
+from outbound.archive.store import JsonlArchive
+
+
+def _post(external_id: str, score: int) -> RawPost:
+    return RawPost(
+        source="reddit",
+        external_id=external_id,
+        title=f"t-{external_id}",
+        body=None,
+        external_url=f"https://example.com/{external_id}",
+        external_created_at=datetime(2026, 10, 1, tzinfo=UTC),
+        score=score,
+        num_comments=0,
+    )
+
+
+def _parse(context, payload):
+    return [_post(item["id"], item["score"]) for item in payload]
+
+
+def _today() -> date:
+    return datetime.now(UTC).date()
+
+
+async def _replay(archive, parsers=None):
+    since = _today()
+    chunks = archive.replay(parsers or {"reddit": _parse}, since, since + timedelta(days=1))
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_gzipped_segment_per_source_and_day(tmp_path):
+    archive = JsonlArchive(tmp_path)
+
+    await archive.append("reddit", {"subreddit": "saas"}, [{"id": "a", "score": 1}])
+    await archive.append("rss", {"url": "https://a/rss"}, "<rss/>")
+    assert not any(tmp_path.iterdir())
+
+    await archive.flush()
+
+    reddit_segment = tmp_path / "reddit" / f"{_today():%Y-%m-%d}.jsonl.gz"
+    assert b'"subreddit":"saas"' in gzip.decompress(reddit_segment.read_bytes())
+    assert (tmp_path / "rss" / reddit_segment.name).exists()
+
+
+@pytest.mark.asyncio
+async def test_append_flushes_segment_once_buffer_is_full(tmp_path):
+    archive = JsonlArchive(tmp_path, flush_records=2)
+
+    await archive.append("reddit", {}, [{"id": "a", "score": 1}])
+    await archive.append("reddit", {}, [{"id": "b", "score": 1}])
+
+    assert [p for chunk in await _replay(archive) for p in chunk]
+
+
+@pytest.mark.asyncio
+async def test_replay_keeps_last_sighting_across_flushes(tmp_path):
+    archive = JsonlArchive(tmp_path)
+    await archive.append("reddit", {}, [{"id": "a", "score": 1}, {"id": "b", "score": 5}])
+    await archive.flush()
+    await archive.append("reddit", {}, [{"id": "a", "score": 9}])
+    await archive.flush()
+
+    chunks = await _replay(archive)
+
+    assert len(chunks) == 1
+    assert {p.external_id: p.score for p in chunks[0]} == {"a": 9, "b": 5}
+
+
+@pytest.mark.asyncio
+async def test_replay_only_reads_requested_sources(tmp_path):
+    archive = JsonlArchive(tmp_path)
+    await archive.append("reddit", {}, [{"id": "a", "score": 1}])
+    await archive.append("rss", {}, "<rss/>")
+    await archive.flush()
+
+    chunks = await _replay(archive, {"reddit": _parse})
+
+    assert [p.external_id for chunk in chunks for p in chunk] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_replay_stops_at_truncated_member(tmp_path):
+    archive = JsonlArchive(tmp_path)
+    await archive.append("reddit", {}, [{"id": "a", "score": 1}])
+    await archive.flush()
+    segment = next((tmp_path / "reddit").iterdir())
+    with segment.open("ab") as f:
+        f.write(gzip.compress(b'{"context":{},"payload":[]}\n')[:10])
+
+    chunks = await _replay(archive)
+
+    assert [p.external_id for chunk in chunks for p in chunk] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_replay_skips_records_the_parser_rejects(tmp_path):
+    archive = JsonlArchive(tmp_path)
+    await archive.append("reddit", {}, [{"id": "a", "score": 1}])
+    await archive.append("reddit", {}, [{"missing": "id"}])
+    await archive.flush()
+
+    chunks = await _replay(archive)
+
+    assert [p.external_id for chunk in chunks for p in chunk] == ["a"]
@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from domain.pipeline.models import RawPost
+from domain.pipeline.models import FetchCursor, RawPost
 from outbound.reddit.client import (
     REDDIT_PUBLIC_BASE,
     RedditApiClient,
@@ -53,7 +53,7 @@ def _make_http_client(listing_response=None):
     http.__aenter__ = AsyncMock(return_value=http)
     http.__aexit__ = AsyncMock(return_value=False)
 
-    listing_resp = MagicMock()
+    listing_resp = MagicMock(status_code=200, headers={})
     listing_resp.raise_for_status = MagicMock()
     listing_resp.json = MagicMock(return_value=listing_response or {"data": {"children": []}})
 
@@ -94,7 +94,7 @@ async def test_fetch_posts_returns_raw_posts():
 
     reddit = RedditApiClient("ua/0.1")
 
-    with patch("outbound.reddit.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         posts = await reddit.fetch_posts(["SaaS"], limit=5)
 
     assert len(posts) == 1
@@ -118,7 +118,7 @@ async def test_fetch_posts_empty_selftext_becomes_none():
 
     reddit = RedditApiClient("ua/0.1")
 
-    with patch("outbound.reddit.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         posts = await reddit.fetch_posts(["SaaS"])
 
     assert posts[0].body is None
@@ -132,7 +132,7 @@ async def test_fetch_posts_multiple_subreddits():
 
     reddit = RedditApiClient("ua/0.1")
 
-    with patch("outbound.reddit.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         posts = await reddit.fetch_posts(["SaaS", "startups"])
 
     # One post per subreddit
@@ -145,7 +145,7 @@ async def test_fetch_posts_empty_subreddit_list():
 
     reddit = RedditApiClient("ua/0.1")
 
-    with patch("outbound.reddit.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         posts = await reddit.fetch_posts([])
 
     assert posts == []
@@ -159,7 +159,7 @@ async def test_fetch_posts_uses_public_json_endpoint():
 
     reddit = RedditApiClient("ua/0.1")
 
-    with patch("outbound.reddit.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         await reddit.fetch_posts(["SaaS"])
 
     http.get.assert_called_once()
@@ -175,7 +175,7 @@ async def test_fetch_posts_sends_user_agent_header():
 
     reddit = RedditApiClient("ua/0.1")
 
-    with patch("outbound.reddit.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         await reddit.fetch_posts(["SaaS"])
 
     http.get.assert_called_once()
@@ -192,7 +192,7 @@ async def test_fetch_posts_limit_capped_at_100():
 
     reddit = RedditApiClient("ua/0.1")
 
-    with patch("outbound.reddit.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         await reddit.fetch_posts(["SaaS"], limit=500)
 
     get_kwargs = http.get.call_args.kwargs
@@ -206,7 +206,7 @@ async def test_fetch_posts_rejects_invalid_subreddit_name():
 
     reddit = RedditApiClient("ua/0.1")
 
-    with patch("outbound.reddit.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         with pytest.raises(ValueError, match="Invalid subreddit name"):
             await reddit.fetch_posts(["../../etc"])
 
@@ -220,7 +220,7 @@ async def test_fetch_posts_uses_missing_data_defaults():
 
     reddit = RedditApiClient("ua/0.1")
 
-    with patch("outbound.reddit.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         posts = await reddit.fetch_posts(["SaaS"])
 
     assert len(posts) == 1
@@ -239,7 +239,7 @@ async def test_fetch_posts_external_url_from_valid_permalink():
 
     reddit = RedditApiClient("ua/0.1")
 
-    with patch("outbound.reddit.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         posts = await reddit.fetch_posts(["SaaS"])
 
     assert posts[0].external_url.startswith("https://www.reddit.com/r/SaaS/comments/abc/")
@@ -253,8 +253,402 @@ async def test_fetch_posts_external_created_at_from_utc_timestamp():
 
     reddit = RedditApiClient("ua/0.1")
 
-    with patch("outbound.reddit.client.httpx.AsyncClient", return_value=http):
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
         posts = await reddit.fetch_posts(["SaaS"])
 
     expected = datetime.fromtimestamp(1700000000, tz=UTC)
     assert posts[0].external_created_at == expected
+
+
+# ---------------------------------------------------------------------------
+# RedditApiClient — concurrent mode and shared token bucket
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_fetch_posts_draws_one_token_per_request():
+    listing = {"data": {"children": []}}
+    http = _make_http_client(listing_response=listing)
+
+    reddit = RedditApiClient("ua/0.1", concurrency=4)
+    reddit._limiter.acquire = AsyncMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        await reddit.fetch_posts(["SaaS", "startups", "webdev"])
+
+    assert reddit._limiter.acquire.await_count == 3
+    assert http.get.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_posts_runs_subreddits_concurrently_up_to_limit():
+    """No more than `concurrency` subreddit requests are in flight at once."""
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def _slow_get(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        resp = MagicMock(status_code=200, headers={})
+        resp.raise_for_status = MagicMock()
+        resp.json = MagicMock(return_value={"data": {"children": []}})
+        return resp
+
+    http = _make_http_client()
+    http.get = AsyncMock(side_effect=_slow_get)
+
+    reddit = RedditApiClient("ua/0.1", concurrency=2)
+    reddit._limiter.acquire = AsyncMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        await reddit.fetch_posts(["a", "b", "c", "d", "e"])
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_posts_preserves_subreddit_order():
+    def _listing_for(url, **kwargs):
+        sub = url.split("/r/")[1].split("/")[0]
+        resp = MagicMock(status_code=200, headers={})
+        resp.raise_for_status = MagicMock()
+        resp.json = MagicMock(
+            return_value={"data": {"children": [_reddit_child(rid=sub, subreddit=sub)]}}
+        )
+        return resp
+
+    http = _make_http_client()
+    http.get = AsyncMock(side_effect=_listing_for)
+
+    reddit = RedditApiClient("ua/0.1", concurrency=3)
+    reddit._limiter.acquire = AsyncMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        posts = await reddit.fetch_posts(["SaaS", "startups", "webdev"])
+
+    assert [p.external_id for p in posts] == ["SaaS", "startups", "webdev"]
+
+
+# ---------------------------------------------------------------------------
+# RedditApiClient — incremental fetch via high-water marks
+# ---------------------------------------------------------------------------
+
+def _listing_pages(*pages):
+    """Return an http.get side effect serving successive (children, after) pages."""
+    responses = []
+    for children, after in pages:
+        resp = MagicMock(status_code=200, headers={})
+        resp.raise_for_status = MagicMock()
+        resp.json = MagicMock(return_value={"data": {"children": children, "after": after}})
+        responses.append(resp)
+    return AsyncMock(side_effect=responses)
+
+
+def _mark(rid="old", created_utc=1700000000):
+    return FetchCursor(
+        external_id=rid, created_at=datetime.fromtimestamp(created_utc, tz=UTC)
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_posts_without_mark_fetches_single_page():
+    http = _make_http_client()
+    http.get = _listing_pages(([_reddit_child(rid="a")], "t3_a"))
+
+    reddit = RedditApiClient("ua/0.1")
+    reddit._limiter.acquire = AsyncMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        posts = await reddit.fetch_posts(["SaaS"])
+
+    assert [p.external_id for p in posts] == ["a"]
+    http.get.assert_awaited_once()
+    assert "after" not in http.get.call_args.kwargs["params"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_posts_stops_at_high_water_mark():
+    http = _make_http_client()
+    http.get = _listing_pages(
+        (
+            [
+                _reddit_child(rid="new2", created_utc=1700000200),
+                _reddit_child(rid="new1", created_utc=1700000100),
+                _reddit_child(rid="old", created_utc=1700000000),
+                _reddit_child(rid="older", created_utc=1699999000),
+            ],
+            "t3_older",
+        ),
+    )
+
+    reddit = RedditApiClient("ua/0.1")
+    reddit._limiter.acquire = AsyncMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        posts = await reddit.fetch_posts(["SaaS"], since={"saas": _mark()})
+
+    assert [p.external_id for p in posts] == ["new2", "new1"]
+    http.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_posts_follows_after_cursor_until_mark():
+    http = _make_http_client()
+    http.get = _listing_pages(
+        ([_reddit_child(rid="p1a", created_utc=1700000400),
+          _reddit_child(rid="p1b", created_utc=1700000300)], "t3_p1b"),
+        ([_reddit_child(rid="p2a", created_utc=1700000200),
+          _reddit_child(rid="old", created_utc=1700000000)], "t3_old"),
+    )
+
+    reddit = RedditApiClient("ua/0.1")
+    reddit._limiter.acquire = AsyncMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        posts = await reddit.fetch_posts(["SaaS"], limit=2, since={"saas": _mark()})
+
+    assert [p.external_id for p in posts] == ["p1a", "p1b", "p2a"]
+    assert http.get.await_count == 2
+    assert http.get.call_args_list[1].kwargs["params"]["after"] == "t3_p1b"
+
+
+@pytest.mark.asyncio
+async def test_fetch_posts_stops_when_listing_has_no_after():
+    http = _make_http_client()
+    http.get = _listing_pages(
+        ([_reddit_child(rid="p1", created_utc=1700000400)], None),
+    )
+
+    reddit = RedditApiClient("ua/0.1")
+    reddit._limiter.acquire = AsyncMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        posts = await reddit.fetch_posts(["SaaS"], since={"saas": _mark()})
+
+    assert [p.external_id for p in posts] == ["p1"]
+    http.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_posts_caps_catch_up_at_max_pages():
+    http = _make_http_client()
+    http.get = _listing_pages(
+        ([_reddit_child(rid="p1", created_utc=1700000400)], "t3_p1"),
+        ([_reddit_child(rid="p2", created_utc=1700000300)], "t3_p2"),
+        ([_reddit_child(rid="p3", created_utc=1700000200)], "t3_p3"),
+    )
+
+    reddit = RedditApiClient("ua/0.1", max_pages=2)
+    reddit._limiter.acquire = AsyncMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        posts = await reddit.fetch_posts(["SaaS"], since={"saas": _mark()})
+
+    assert [p.external_id for p in posts] == ["p1", "p2"]
+    assert http.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_returns_posts_and_next_cursor():
+    http = _make_http_client()
+    http.get = _listing_pages(([_reddit_child(rid="p2")], "t3_p2"))
+
+    reddit = RedditApiClient("ua/0.1", http=http)
+    reddit._limiter.acquire = AsyncMock()
+
+    posts, after = await reddit.fetch_page("SaaS", after="t3_p1")
+
+    assert [p.external_id for p in posts] == ["p2"]
+    assert after == "t3_p2"
+    params = http.get.call_args.kwargs["params"]
+    assert params["after"] == "t3_p1"
+    assert params["t"] == "all"
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_archives_raw_listing_for_reprocessing():
+    from outbound.reddit.client import parse_archived
+
+    http = _make_http_client()
+    http.get = _listing_pages(([_reddit_child(rid="p2")], "t3_p2"))
+    archive = AsyncMock()
+
+    reddit = RedditApiClient("ua/0.1", http=http, archive=archive)
+    reddit._limiter.acquire = AsyncMock()
+
+    posts, _ = await reddit.fetch_page("SaaS")
+
+    source, context, payload = archive.append.await_args.args
+    assert (source, context) == ("reddit", {"subreddit": "SaaS"})
+    assert parse_archived(context, payload) == posts
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_keeps_link_url_of_link_posts_only():
+    link = _reddit_child(rid="l1")
+    link["data"].update(is_self=False, url="https://example.com/story")
+    own = _reddit_child(rid="s1")
+    own["data"].update(is_self=True, url="https://www.reddit.com/r/SaaS/comments/s1/")
+    http = _make_http_client()
+    http.get = _listing_pages(([link, own], None))
+
+    reddit = RedditApiClient("ua/0.1", http=http)
+    reddit._limiter.acquire = AsyncMock()
+
+    posts, _ = await reddit.fetch_page("SaaS")
+
+    assert [p.link_url for p in posts] == ["https://example.com/story", None]
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_rejects_invalid_subreddit_name():
+    reddit = RedditApiClient("ua/0.1")
+
+    with pytest.raises(ValueError):
+        await reddit.fetch_page("../admin")
+
+
+@pytest.mark.asyncio
+async def test_fetch_posts_uses_injected_shared_client():
+    http = _make_http_client(listing_response={"data": {"children": [_reddit_child()]}})
+
+    reddit = RedditApiClient("ua/0.1", http=http)
+    reddit._limiter.acquire = AsyncMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_async_client:
+        posts = await reddit.fetch_posts(["SaaS"])
+
+    mock_async_client.assert_not_called()
+    http.__aexit__.assert_not_called()
+    assert len(posts) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_posts_yields_each_subreddit_as_it_completes():
+    import asyncio
+
+    delays = {"slow": 0.03, "fast": 0.0}
+
+    async def _listing_for(url, **kwargs):
+        sub = url.split("/r/")[1].split("/")[0]
+        await asyncio.sleep(delays[sub])
+        resp = MagicMock(status_code=200, headers={})
+        resp.raise_for_status = MagicMock()
+        resp.json = MagicMock(
+            return_value={"data": {"children": [_reddit_child(rid=sub, subreddit=sub)]}}
+        )
+        return resp
+
+    http = _make_http_client()
+    http.get = AsyncMock(side_effect=_listing_for)
+
+    reddit = RedditApiClient("ua/0.1", concurrency=2)
+    reddit._limiter.acquire = AsyncMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        chunks = [chunk async for chunk in reddit.stream_posts(["slow", "fast"])]
+
+    assert [[p.external_id for p in chunk] for chunk in chunks] == [["fast"], ["slow"]]
+
+
+# ---------------------------------------------------------------------------
+# RedditApiClient — header-driven rate limiting
+# ---------------------------------------------------------------------------
+
+
+def _listing_resp(status_code=200, headers=None):
+    resp = MagicMock(status_code=status_code, headers=headers or {})
+    resp.raise_for_status = MagicMock()
+    resp.json = MagicMock(return_value={"data": {"children": [_reddit_child()]}})
+    return resp
+
+
+@pytest.mark.asyncio
+async def test_fetch_posts_feeds_ratelimit_headers_to_limiter():
+    http = _make_http_client()
+    http.get = AsyncMock(
+        return_value=_listing_resp(
+            headers={
+                "x-ratelimit-remaining": "0.0",
+                "x-ratelimit-used": "100",
+                "x-ratelimit-reset": "42",
+            }
+        )
+    )
+    reddit = RedditApiClient("ua/0.1")
+    reddit._limiter.update = MagicMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        await reddit.fetch_posts(["SaaS"])
+
+    reddit._limiter.update.assert_called_once_with(0.0, 42.0)
+
+
+@pytest.mark.asyncio
+async def test_fetch_posts_waits_out_429_without_spending_retries():
+    http = _make_http_client()
+    http.get = AsyncMock(
+        side_effect=[
+            _listing_resp(status_code=429, headers={"retry-after": "7"}),
+            _listing_resp(status_code=429, headers={"x-ratelimit-reset": "3"}),
+            _listing_resp(),
+        ]
+    )
+    reddit = RedditApiClient("ua/0.1")
+    reddit._limiter.acquire = AsyncMock()
+    reddit._limiter.pause = MagicMock()
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        posts = await reddit.fetch_posts(["SaaS"])
+
+    assert len(posts) == 1
+    assert [c.args[0] for c in reddit._limiter.pause.call_args_list] == [7.0, 3.0]
+    # Two 429s and the success: one limiter slot each, no tenacity retry.
+    assert reddit._limiter.acquire.await_count == 3
+    assert reddit._fetch_subreddit.statistics["attempt_number"] == 1
+
+
+# ---------------------------------------------------------------------------
+# RedditApiClient — fetch_engagement
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_fetch_engagement_batches_100_fullnames_per_info_call():
+    seen: list[list[str]] = []
+
+    async def _info(url, params=None, headers=None):
+        ids = params["id"].split(",")
+        seen.append(ids)
+        children = [
+            _reddit_child(rid=i.removeprefix("t3_"), score=5, num_comments=1)
+            for i in ids
+            if i != "t3_gone"
+        ]
+        return _listing_resp_with(children)
+
+    http = _make_http_client()
+    http.get = AsyncMock(side_effect=_info)
+    reddit = RedditApiClient("ua/0.1", concurrency=2)
+    reddit._limiter.acquire = AsyncMock()
+    ids = [f"p{i}" for i in range(249)] + ["gone"]
+
+    with patch("outbound.http.client.httpx.AsyncClient", return_value=http):
+        engagement = await reddit.fetch_engagement(ids)
+
+    assert http.get.call_args.args[0] == f"{REDDIT_PUBLIC_BASE}/api/info.json"
+    assert sorted(len(batch) for batch in seen) == [50, 100, 100]
+    assert all(i.startswith("t3_") for batch in seen for i in batch)
+    assert len(engagement) == 249
+    assert engagement[0].score == 5 and engagement[0].num_comments == 1
+
+
+def _listing_resp_with(children):
+    resp = MagicMock(status_code=200, headers={})
+    resp.raise_for_status = MagicMock()
+    resp.json = MagicMock(return_value={"data": {"children": children}})
+    return resp
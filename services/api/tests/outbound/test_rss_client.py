@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from domain.pipeline.models import FeedValidators
 from outbound.rss.client import RssFeedClient, _is_safe_url, _parse_published
 
 
@@ -188,7 +189,7 @@ async def test_fetch_posts_skips_unsafe_urls():
     """Unsafe URLs should be skipped entirely — no HTTP request made."""
     client = RssFeedClient()
 
-    with patch("outbound.rss.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
         mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
@@ -218,7 +219,7 @@ async def test_fetch_posts_single_entry():
     mock_resp.text = "<rss/>"
 
     with (
-        patch("outbound.rss.client.httpx.AsyncClient") as mock_cls,
+        patch("outbound.http.client.httpx.AsyncClient") as mock_cls,
         patch("outbound.rss.client.feedparser.parse", return_value=feed),
     ):
         mock_http = AsyncMock()
@@ -252,7 +253,7 @@ async def test_fetch_posts_external_id_is_sha256_of_link():
     mock_resp.text = ""
 
     with (
-        patch("outbound.rss.client.httpx.AsyncClient") as mock_cls,
+        patch("outbound.http.client.httpx.AsyncClient") as mock_cls,
         patch("outbound.rss.client.feedparser.parse", return_value=feed),
     ):
         mock_http = AsyncMock()
@@ -276,7 +277,7 @@ async def test_fetch_posts_caps_at_20_entries():
     mock_resp.text = ""
 
     with (
-        patch("outbound.rss.client.httpx.AsyncClient") as mock_cls,
+        patch("outbound.http.client.httpx.AsyncClient") as mock_cls,
         patch("outbound.rss.client.feedparser.parse", return_value=feed),
     ):
         mock_http = AsyncMock()
@@ -298,7 +299,7 @@ async def test_fetch_posts_http_error_is_swallowed():
     mock_resp.raise_for_status = MagicMock(side_effect=Exception("HTTP 500"))
     mock_resp.text = ""
 
-    with patch("outbound.rss.client.httpx.AsyncClient") as mock_cls:
+    with patch("outbound.http.client.httpx.AsyncClient") as mock_cls:
         mock_http = AsyncMock()
         mock_http.get = AsyncMock(return_value=mock_resp)
         mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_http)
@@ -324,7 +325,7 @@ async def test_fetch_posts_multiple_feeds_combined():
     feed_responses = iter([feed1, feed2])
 
     with (
-        patch("outbound.rss.client.httpx.AsyncClient") as mock_cls,
+        patch("outbound.http.client.httpx.AsyncClient") as mock_cls,
         patch("outbound.rss.client.feedparser.parse", side_effect=lambda _: next(feed_responses)),
     ):
         mock_http = AsyncMock()
@@ -365,7 +366,7 @@ async def test_fetch_posts_second_feed_fails_first_succeeds():
             raise Exception("Connection refused")
 
     with (
-        patch("outbound.rss.client.httpx.AsyncClient") as mock_cls,
+        patch("outbound.http.client.httpx.AsyncClient") as mock_cls,
         patch("outbound.rss.client.feedparser.parse", return_value=feed_ok),
     ):
         mock_http = AsyncMock()
@@ -394,7 +395,7 @@ async def test_fetch_posts_mixed_safe_and_unsafe_urls():
     mock_resp.text = ""
 
     with (
-        patch("outbound.rss.client.httpx.AsyncClient") as mock_cls,
+        patch("outbound.http.client.httpx.AsyncClient") as mock_cls,
         patch("outbound.rss.client.feedparser.parse", return_value=feed),
     ):
         mock_http = AsyncMock()
@@ -410,3 +411,218 @@ async def test_fetch_posts_mixed_safe_and_unsafe_urls():
     # Only one GET should have been made (for the safe URL)
     mock_http.get.assert_called_once()
     assert len(result) == 1
+
+
+# ---------------------------------------------------------------------------
+# RssFeedClient.fetch_feeds — conditional GET
+# ---------------------------------------------------------------------------
+
+_FEED_URL = "https://hnrss.org/newest"
+
+
+def _response(status=200, text="<rss/>", headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.text = text
+    resp.headers = headers or {}
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+def _shared_http(resp):
+    http = AsyncMock()
+    http.get = AsyncMock(return_value=resp)
+    return http
+
+
+def _validators(etag='"abc"', last_modified="Tue, 18 Feb 2026 10:00:00 GMT", body="<rss/>"):
+    return FeedValidators(
+        url=_FEED_URL,
+        etag=etag,
+        last_modified=last_modified,
+        content_hash=hashlib.sha256(body.encode()).hexdigest(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_feeds_sends_conditional_headers():
+    http = _shared_http(_response(status=304))
+    client = RssFeedClient(http=http)
+
+    await client.fetch_feeds([_FEED_URL], validators={_FEED_URL: _validators()})
+
+    headers = http.get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Tue, 18 Feb 2026 10:00:00 GMT"
+
+
+@pytest.mark.asyncio
+async def test_fetch_feeds_first_fetch_sends_no_conditional_headers():
+    http = _shared_http(_response())
+    client = RssFeedClient(http=http)
+
+    with patch("outbound.rss.client.feedparser.parse", return_value=_make_feed([])):
+        await client.fetch_feeds([_FEED_URL])
+
+    assert http.get.call_args.kwargs["headers"] == {}
+
+
+@pytest.mark.asyncio
+async def test_fetch_feeds_304_skips_parsing():
+    previous = _validators()
+    http = _shared_http(_response(status=304))
+    client = RssFeedClient(http=http)
+
+    with patch("outbound.rss.client.feedparser.parse") as mock_parse:
+        feeds = await client.fetch_feeds([_FEED_URL], validators={_FEED_URL: previous})
+
+    mock_parse.assert_not_called()
+    assert len(feeds) == 1
+    assert feeds[0].not_modified is True
+    assert feeds[0].posts == []
+    assert feeds[0].validators == previous
+
+
+@pytest.mark.asyncio
+async def test_fetch_feeds_identical_body_skips_parsing():
+    http = _shared_http(_response(text="<rss>same</rss>", headers={"etag": '"new"'}))
+    client = RssFeedClient(http=http)
+
+    with patch("outbound.rss.client.feedparser.parse") as mock_parse:
+        feeds = await client.fetch_feeds(
+            [_FEED_URL], validators={_FEED_URL: _validators(body="<rss>same</rss>")}
+        )
+
+    mock_parse.assert_not_called()
+    assert feeds[0].not_modified is True
+    assert feeds[0].validators.etag == '"new"'
+
+
+@pytest.mark.asyncio
+async def test_fetch_feeds_changed_body_returns_posts_and_new_validators():
+    body = "<rss>changed</rss>"
+    http = _shared_http(_response(
+        text=body,
+        headers={"etag": '"v2"', "last-modified": "Wed, 19 Feb 2026 10:00:00 GMT"},
+    ))
+    client = RssFeedClient(http=http)
+
+    with patch(
+        "outbound.rss.client.feedparser.parse", return_value=_make_feed([_make_entry()])
+    ):
+        feeds = await client.fetch_feeds([_FEED_URL], validators={_FEED_URL: _validators()})
+
+    assert feeds[0].not_modified is False
+    assert len(feeds[0].posts) == 1
+    assert feeds[0].validators == FeedValidators(
+        url=_FEED_URL,
+        etag='"v2"',
+        last_modified="Wed, 19 Feb 2026 10:00:00 GMT",
+        content_hash=hashlib.sha256(body.encode()).hexdigest(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_feeds_archives_changed_body_but_not_unchanged_one():
+    archive = AsyncMock()
+    client = RssFeedClient(http=_shared_http(_response(text="<rss/>")), archive=archive)
+
+    with patch("outbound.rss.client.feedparser.parse", return_value=_make_feed([])):
+        await client.fetch_feeds([_FEED_URL])
+        await client.fetch_feeds([_FEED_URL], validators={_FEED_URL: _validators()})
+
+    archive.append.assert_awaited_once_with("rss", {"url": _FEED_URL}, "<rss/>")
+
+
+@pytest.mark.asyncio
+async def test_fetch_feeds_omits_failed_feeds():
+    http = AsyncMock()
+    http.get = AsyncMock(side_effect=RuntimeError("boom"))
+    client = RssFeedClient(http=http)
+
+    feeds = await client.fetch_feeds([_FEED_URL])
+
+    assert feeds == []
+
+
+# ---------------------------------------------------------------------------
+# RssFeedClient.fetch_feeds — concurrency, time budget, off-loop parsing
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_fetch_feeds_runs_feeds_concurrently_up_to_limit():
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def _slow_get(url, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _response(status=304)
+
+    http = AsyncMock()
+    http.get = AsyncMock(side_effect=_slow_get)
+    client = RssFeedClient(http=http, concurrency=2)
+
+    urls = [f"https://feed{i}.example/rss" for i in range(5)]
+    feeds = await client.fetch_feeds(urls)
+
+    assert peak == 2
+    assert [f.url for f in feeds] == urls
+
+
+@pytest.mark.asyncio
+async def test_fetch_feeds_skips_feed_exceeding_time_budget():
+    import asyncio
+
+    async def _get(url, **kwargs):
+        if "slow" in url:
+            await asyncio.sleep(10)
+        return _response(status=304)
+
+    http = AsyncMock()
+    http.get = AsyncMock(side_effect=_get)
+    client = RssFeedClient(http=http, feed_timeout=0.05)
+
+    feeds = await client.fetch_feeds(["https://slow.example/rss", "https://fast.example/rss"])
+
+    assert [f.url for f in feeds] == ["https://fast.example/rss"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_feeds_parses_in_worker_thread():
+    http = _shared_http(_response(text="<rss>x</rss>"))
+    client = RssFeedClient(http=http)
+
+    with patch(
+        "outbound.rss.client.asyncio.to_thread", new_callable=AsyncMock, return_value=([], 0)
+    ) as mock_to_thread:
+        await client.fetch_feeds([_FEED_URL])
+
+    parse_fn, text = mock_to_thread.call_args.args
+    assert parse_fn.__name__ == "_parse_entries"
+    assert text == "<rss>x</rss>"
+
+
+@pytest.mark.asyncio
+async def test_stream_feeds_yields_feeds_in_completion_order():
+    import asyncio
+
+    async def _get(url, **kwargs):
+        if "slow" in url:
+            await asyncio.sleep(0.03)
+        return _response(status=304)
+
+    http = AsyncMock()
+    http.get = AsyncMock(side_effect=_get)
+    client = RssFeedClient(http=http, concurrency=2)
+
+    urls = ["https://slow.example/rss", "https://fast.example/rss"]
+    feeds = [feed async for feed in client.stream_feeds(urls)]
+
+    assert [f.url for f in feeds] == list(reversed(urls))
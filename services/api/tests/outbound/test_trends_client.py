@@ -271,3 +271,92 @@ def test_fetch_related_queries_capped_at_five_records():
         result = client._fetch(["python"])
 
     assert len(result["related_queries"]["python"]) == 5
+
+
+# ---------------------------------------------------------------------------
+# Cache, shared in-flight fetches, session reuse
+# ---------------------------------------------------------------------------
+
+
+def _make_cache(cached=None):
+    cache = AsyncMock()
+    cache.get_trends = AsyncMock(return_value=cached)
+    cache.save_trends = AsyncMock(return_value=None)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_get_interest_serves_fresh_cache_without_fetching():
+    from datetime import timedelta
+
+    cached = {"avg_interest": {"saas": 40.0}, "related_queries": {}, "trend_direction": {}}
+    cache = _make_cache(cached)
+    client = GoogleTrendsClient(cache=cache, cache_ttl_hours=12)
+
+    with patch.object(client, "_fetch") as fetch:
+        result = await client.get_interest(["SaaS", "CRM"])
+
+    fetch.assert_not_called()
+    cache.get_trends.assert_awaited_once_with("crm|saas", timedelta(hours=12))
+    # Keys come back spelled the way this caller asked for them.
+    assert result["avg_interest"] == {"SaaS": 40.0}
+
+
+@pytest.mark.asyncio
+async def test_get_interest_caches_fetched_result_but_not_failures():
+    cache = _make_cache()
+    client = GoogleTrendsClient(cache=cache)
+    fetched = {"avg_interest": {"saas": 1.0}, "related_queries": {}, "trend_direction": {}}
+
+    with (
+        patch.object(client, "_fetch", return_value=fetched),
+        patch("outbound.trends.client.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        await client.get_interest(["saas"])
+    cache.save_trends.assert_awaited_once_with("saas", fetched)
+
+    cache.save_trends.reset_mock()
+    with (
+        patch.object(client, "_fetch", side_effect=Exception("429")),
+        patch("outbound.trends.client.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        assert await client.get_interest(["fintech"]) == {}
+    cache.save_trends.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_for_same_keywords_share_one_fetch():
+    client = GoogleTrendsClient()
+    calls = []
+
+    def slow_fetch(keywords):
+        import time
+
+        calls.append(keywords)
+        time.sleep(0.02)
+        return {"avg_interest": {k: 1.0 for k in keywords}}
+
+    with patch.object(client, "_fetch", side_effect=slow_fetch):
+        results = await asyncio.gather(
+            client.get_interest(["saas", "crm"]),
+            client.get_interest(["CRM", "saas"]),
+        )
+
+    assert len(calls) == 1
+    assert results[1]["avg_interest"] == {"CRM": 1.0, "saas": 1.0}
+    assert client._inflight == {}
+
+
+def test_fetch_reuses_one_trendreq_session():
+    import pandas as pd
+
+    client = GoogleTrendsClient()
+    pytrends = MagicMock()
+    pytrends.interest_over_time.return_value = pd.DataFrame({"saas": [1, 2]})
+    pytrends.related_queries.return_value = {}
+
+    with patch(_TRENDREQ_PATH, return_value=pytrends) as trendreq:
+        client._fetch(["saas"])
+        client._fetch(["saas"])
+
+    trendreq.assert_called_once()
@@ -0,0 +1,154 @@
+"""Tests for src/shared/concurrency.py — imap_unordered() and AdaptiveLimit."""
+import asyncio
+import gc
+from contextlib import aclosing
+
+import pytest
+
+from shared.concurrency import AdaptiveLimit, imap_unordered
+
+
+@pytest.mark.asyncio
+async def test_imap_unordered_yields_results_in_completion_order():
+    async def _work(delay):
+        await asyncio.sleep(delay)
+        return delay
+
+    results = [r async for r in imap_unordered(_work, [0.03, 0.0, 0.01], concurrency=3)]
+
+    assert results == [0.0, 0.01, 0.03]
+
+
+@pytest.mark.asyncio
+async def test_imap_unordered_caps_in_flight_calls():
+    in_flight = 0
+    peak = 0
+
+    async def _work(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        return item
+
+    results = [r async for r in imap_unordered(_work, range(7), concurrency=2)]
+
+    assert peak == 2
+    assert sorted(results) == list(range(7))
+
+
+@pytest.mark.asyncio
+async def test_imap_unordered_waits_for_consumer_before_starting_more():
+    started: list[int] = []
+
+    async def _work(item):
+        started.append(item)
+        return item
+
+    async with aclosing(imap_unordered(_work, range(5), concurrency=1)) as results:
+        first = await anext(results)
+        await asyncio.sleep(0.01)
+
+        assert first == 0
+        assert started == [0, 1]  # one call in flight, no more
+
+
+@pytest.mark.asyncio
+async def test_imap_unordered_propagates_failure_and_cancels_pending():
+    cancelled = asyncio.Event()
+
+    async def _work(item):
+        if item == "boom":
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _ in imap_unordered(_work, ["slow", "boom"], concurrency=2):
+            pass
+    await asyncio.sleep(0)
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_imap_unordered_retrieves_every_failure_in_a_finished_batch():
+    async def _work(item):
+        raise ValueError(item)
+
+    loop = asyncio.get_running_loop()
+    reports: list[dict] = []
+    loop.set_exception_handler(lambda _loop, context: reports.append(context))
+    try:
+        with pytest.raises(ValueError):
+            async for _ in imap_unordered(_work, ["a", "b", "c"], concurrency=3):
+                pass
+        gc.collect()
+        await asyncio.sleep(0)
+    finally:
+        loop.set_exception_handler(None)
+
+    assert reports == []  # no "Task exception was never retrieved"
+
+
+@pytest.mark.asyncio
+async def test_imap_unordered_cancels_pending_before_the_failure_propagates():
+    cancelled = asyncio.Event()
+
+    async def _work(item):
+        if item == "boom":
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _ in imap_unordered(_work, ["slow", "boom"], concurrency=2):
+            pass
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_caps_holders_at_current_limit():
+    limit = AdaptiveLimit(4)
+    limit.decrease()
+    in_flight = 0
+    peak = 0
+
+    async def _hold():
+        nonlocal in_flight, peak
+        async with limit:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.005)
+            in_flight -= 1
+
+    await asyncio.gather(*[_hold() for _ in range(6)])
+
+    assert limit.limit == 2
+    assert peak == 2
+
+
+def test_adaptive_limit_halves_on_decrease_and_recovers_additively():
+    limit = AdaptiveLimit(4)
+    limit.decrease()
+    limit.decrease()
+    limit.decrease()
+    assert limit.limit == 1
+
+    limit.increase()
+    assert limit.limit == 2
+    limit.increase()
+    assert limit.limit == 2
+    limit.increase()
+    assert limit.limit == 3
+    for _ in range(10):
+        limit.increase()
+    assert limit.limit == 4
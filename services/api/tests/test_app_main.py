@@ -62,18 +62,45 @@ def _make_mock_settings(**overrides) -> MagicMock:
         "API_INTERNAL_SECRET": "",
         "SENTRY_DSN": "",
         "SENTRY_ENVIRONMENT": "test",
+        "HTTP_TIMEOUT_SECS": 30.0,
+        "HTTP_MAX_CONNECTIONS": 100,
+        "HTTP_MAX_KEEPALIVE_CONNECTIONS": 20,
+        "HTTP_MAX_CONNECTIONS_PER_HOST": 10,
+        "HTTP_MAX_IN_FLIGHT": 32,
+        "HTTP_HOST_LIMITS": "play.google.com=4/120",
+        "HTTP_HTTP2": False,
         "REDDIT_USER_AGENT": "test/0.1",
+        "REDDIT_REQUESTS_PER_MINUTE": 30,
+        "REDDIT_FETCH_CONCURRENCY": 4,
         "GOOGLE_API_KEY": "",
         "LLM_MODEL": "gemini-2.5-flash",
         "LLM_LITE_MODEL": "gemini-2.5-flash-lite",
+        "LLM_CACHE_BACKEND": "postgres",
+        "LLM_CACHE_DIR": ".cache/llm",
+        "LLM_CACHE_TTL_HOURS": 168.0,
+        "LLM_CACHE_MAX_MB": 256,
         "LLM_BRIEF_TEMPERATURE": 0.9,
         "PIPELINE_SUBREDDITS": "test",
         "PIPELINE_FETCH_LIMIT": 5,
+        "PIPELINE_FETCH_MAX_PAGES": 10,
         "PIPELINE_RSS_FEEDS": "",
+        "PIPELINE_RSS_CONCURRENCY": 4,
+        "PIPELINE_RSS_FEED_TIMEOUT_SECS": 30.0,
         "PIPELINE_APPSTORE_KEYWORDS": "",
         "PIPELINE_APPSTORE_REVIEW_PAGES": 1,
         "PIPELINE_PLAYSTORE_REVIEW_COUNT": 30,
         "PIPELINE_APPSTORE_MAX_AGE_DAYS": 365,
+        "PIPELINE_ENGAGEMENT_MAX_AGE_DAYS": 7,
+        "PIPELINE_ARCHIVE_DIR": "",
+        "PIPELINE_DEDUP_WINDOW_HOURS": 72,
+        "PIPELINE_TAG_CONCURRENCY": 4,
+        "PIPELINE_TAG_TOKEN_BUDGET": 4000,
+        "PIPELINE_TAG_VOCABULARY_SIZE": 150,
+        "PIPELINE_APPSTORE_REQUESTS_PER_MINUTE": 60,
+        "PIPELINE_APPSTORE_CONCURRENCY": 4,
+        "PIPELINE_PLAYSTORE_DETAIL_TTL_DAYS": 30,
+        "PIPELINE_PLAYSTORE_DETAIL_CONCURRENCY": 4,
+        "PIPELINE_TRENDS_CACHE_TTL_HOURS": 72.0,
         "PRODUCTHUNT_API_TOKEN": "",
     }
     defaults.update(overrides)
@@ -87,10 +114,16 @@ import contextlib
 
 @contextlib.contextmanager
 def _patch_create_app(mock_db, **settings_overrides):
-    """Patch all external dependencies of create_app() in one place."""
+    """Patch all external dependencies of create_app() in one place.
+
+    Yields the mock shared HttpClient so tests can assert on its shutdown.
+    """
+    mock_http = AsyncMock()
+    mock_http.for_source = MagicMock(return_value=mock_http)
     with (
         patch("app.main.get_settings") as mock_get_settings,
         patch("app.main.Database", return_value=mock_db),
+        patch("app.main.HttpClient", return_value=mock_http),
         patch("app.main.PostgresTagRepository"),
         patch("app.main.PostgresPostRepository"),
         patch("app.main.PostgresBriefRepository"),
@@ -104,7 +137,7 @@ def _patch_create_app(mock_db, **settings_overrides):
         patch("app.main.ProductHuntApiClient"),
     ):
         mock_get_settings.return_value = _make_mock_settings(**settings_overrides)
-        yield
+        yield mock_http
 
 
 @pytest.mark.asyncio
@@ -183,6 +216,20 @@ async def test_create_app_lifespan_disposes_db():
     mock_db.dispose.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_create_app_lifespan_closes_shared_http_client():
+    mock_db = _make_mock_db()
+
+    with _patch_create_app(mock_db) as mock_http:
+        from app.main import create_app
+
+        app = create_app()
+        async with app.router.lifespan_context(app):
+            mock_http.aclose.assert_not_awaited()
+
+    mock_http.aclose.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_rate_limit_handler_returns_429():
     """Test that the rate limit exception handler returns the correct 429 response."""
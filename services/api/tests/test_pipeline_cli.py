@@ -14,6 +14,10 @@ def _settings(**overrides):
     """Return a MagicMock settings object with all credentials set by default."""
     s = MagicMock()
     s.GOOGLE_API_KEY = overrides.get("GOOGLE_API_KEY", "test-google-key")
+    s.HTTP_FIXTURES_MODE = overrides.get("HTTP_FIXTURES_MODE", "off")
+    s.HTTP_FIXTURES_LATENCY_MS = 0
+    s.HTTP_FIXTURES_ERROR_RATE = 0.0
+    s.PIPELINE_ARCHIVE_DIR = overrides.get("PIPELINE_ARCHIVE_DIR", "")
     return s
 
 
@@ -35,6 +39,9 @@ def _make_pipeline_result(errors=None):
     result = MagicMock()
     result.posts_fetched = 10
     result.posts_upserted = 8
+    result.posts_inserted = 5
+    result.posts_updated = 3
+    result.posts_unchanged = 2
     result.posts_tagged = 6
     result.clusters_created = 2
     result.briefs_generated = 2
@@ -51,6 +58,8 @@ async def test_main_returns_0_on_success():
 
     mock_db = MagicMock()
     mock_db.dispose = AsyncMock()
+    mock_http = AsyncMock()
+    mock_http.for_source = MagicMock(return_value=mock_http)
 
     settings = _settings()
     settings.API_DATABASE_URL = "postgresql+asyncpg://localhost/test"
@@ -64,6 +73,7 @@ async def test_main_returns_0_on_success():
     with (
         patch("app.pipeline_cli.get_settings", return_value=settings),
         patch("app.pipeline_cli.Database", return_value=mock_db),
+        patch("app.pipeline_cli.HttpClient", return_value=mock_http),
         patch("app.pipeline_cli.PostgresPipelineRepository"),
         patch("app.pipeline_cli.RedditApiClient"),
         patch("app.pipeline_cli.GeminiLlmClient"),
@@ -76,6 +86,7 @@ async def test_main_returns_0_on_success():
 
     assert exit_code == 0
     mock_db.dispose.assert_called_once()
+    mock_http.aclose.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -87,6 +98,8 @@ async def test_main_returns_1_when_errors_present():
 
     mock_db = MagicMock()
     mock_db.dispose = AsyncMock()
+    mock_http = AsyncMock()
+    mock_http.for_source = MagicMock(return_value=mock_http)
 
     settings = _settings()
     settings.API_DATABASE_URL = "postgresql+asyncpg://localhost/test"
@@ -100,6 +113,7 @@ async def test_main_returns_1_when_errors_present():
     with (
         patch("app.pipeline_cli.get_settings", return_value=settings),
         patch("app.pipeline_cli.Database", return_value=mock_db),
+        patch("app.pipeline_cli.HttpClient", return_value=mock_http),
         patch("app.pipeline_cli.PostgresPipelineRepository"),
         patch("app.pipeline_cli.RedditApiClient"),
         patch("app.pipeline_cli.GeminiLlmClient"),
@@ -122,6 +136,8 @@ async def test_main_disposes_db_even_on_exception():
 
     mock_db = MagicMock()
     mock_db.dispose = AsyncMock()
+    mock_http = AsyncMock()
+    mock_http.for_source = MagicMock(return_value=mock_http)
 
     settings = _settings()
     settings.API_DATABASE_URL = "postgresql+asyncpg://localhost/test"
@@ -135,6 +151,7 @@ async def test_main_disposes_db_even_on_exception():
     with (
         patch("app.pipeline_cli.get_settings", return_value=settings),
         patch("app.pipeline_cli.Database", return_value=mock_db),
+        patch("app.pipeline_cli.HttpClient", return_value=mock_http),
         patch("app.pipeline_cli.PostgresPipelineRepository"),
         patch("app.pipeline_cli.RedditApiClient"),
         patch("app.pipeline_cli.GeminiLlmClient"),
@@ -147,6 +164,192 @@ async def test_main_disposes_db_even_on_exception():
             await main()
 
     mock_db.dispose.assert_called_once()
+    mock_http.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_main_fetch_only_runs_fetch_stage_through_replay_fixtures(tmp_path):
+    """main("fetch") runs only the fetch stage, with HTTP served from fixtures."""
+    result = _make_pipeline_result()
+    result.products_upserted = 1
+    mock_service = AsyncMock()
+    mock_service.run = AsyncMock(return_value=result)
+
+    mock_db = MagicMock()
+    mock_db.dispose = AsyncMock()
+    mock_http = AsyncMock()
+    mock_http.for_source = MagicMock(return_value=mock_http)
+
+    settings = _settings(HTTP_FIXTURES_MODE="replay")
+    settings.HTTP_FIXTURES_DIR = str(tmp_path)
+    settings.PIPELINE_SUBREDDITS = "SaaS"
+    settings.PIPELINE_RSS_FEEDS = ""
+    settings.PIPELINE_APPSTORE_KEYWORDS = ""
+
+    with (
+        patch("app.pipeline_cli.get_settings", return_value=settings),
+        patch("app.pipeline_cli.Database", return_value=mock_db),
+        patch("app.pipeline_cli.HttpClient", return_value=mock_http) as mock_http_cls,
+        patch("app.pipeline_cli.PostgresPipelineRepository"),
+        patch("app.pipeline_cli.RedditApiClient"),
+        patch("app.pipeline_cli.GeminiLlmClient"),
+        patch("app.pipeline_cli.RssFeedClient"),
+        patch("app.pipeline_cli.GoogleTrendsClient"),
+        patch("app.pipeline_cli.ProductHuntApiClient"),
+        patch("app.pipeline_cli.PipelineService", return_value=mock_service),
+    ):
+        exit_code = await main("fetch")
+
+    assert exit_code == 0
+    mock_service.run.assert_awaited_once_with(fetch_only=True)
+    assert mock_http_cls.call_args.kwargs["wrap_transport"] is not None
+
+
+@pytest.mark.asyncio
+async def test_main_refresh_runs_engagement_refresh_only():
+    from domain.pipeline.models import EngagementRefreshResult
+
+    mock_service = AsyncMock()
+    mock_service.refresh_engagement = AsyncMock(
+        return_value=EngagementRefreshResult(posts_checked=5, posts_updated=2)
+    )
+    mock_db = MagicMock()
+    mock_db.dispose = AsyncMock()
+    mock_http = AsyncMock()
+    mock_http.for_source = MagicMock(return_value=mock_http)
+
+    settings = _settings()
+    settings.PIPELINE_SUBREDDITS = "SaaS"
+    settings.PIPELINE_RSS_FEEDS = ""
+    settings.PIPELINE_APPSTORE_KEYWORDS = ""
+
+    with (
+        patch("app.pipeline_cli.get_settings", return_value=settings),
+        patch("app.pipeline_cli.Database", return_value=mock_db),
+        patch("app.pipeline_cli.HttpClient", return_value=mock_http),
+        patch("app.pipeline_cli.PostgresPipelineRepository"),
+        patch("app.pipeline_cli.RedditApiClient"),
+        patch("app.pipeline_cli.GeminiLlmClient"),
+        patch("app.pipeline_cli.RssFeedClient"),
+        patch("app.pipeline_cli.GoogleTrendsClient"),
+        patch("app.pipeline_cli.ProductHuntApiClient"),
+        patch("app.pipeline_cli.PipelineService", return_value=mock_service),
+    ):
+        exit_code = await main("refresh")
+
+    assert exit_code == 0
+    mock_service.refresh_engagement.assert_awaited_once()
+    mock_service.run.assert_not_called()
+    mock_db.dispose.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_main_backfill_passes_range_and_partitions():
+    from datetime import UTC, datetime
+
+    from domain.pipeline.models import PipelineRunResult
+
+    mock_service = AsyncMock()
+    mock_service.backfill = AsyncMock(return_value=PipelineRunResult(posts_fetched=3))
+    mock_db = MagicMock()
+    mock_db.dispose = AsyncMock()
+
+    settings = _settings()
+    settings.PIPELINE_SUBREDDITS = "SaaS"
+    settings.PIPELINE_RSS_FEEDS = ""
+    settings.PIPELINE_APPSTORE_KEYWORDS = ""
+    settings.PIPELINE_BACKFILL_CONCURRENCY = 2
+    settings.PIPELINE_BACKFILL_BATCH_SIZE = 250
+    settings.PIPELINE_BACKFILL_MAX_PAGES = 5
+
+    with (
+        patch("app.pipeline_cli.get_settings", return_value=settings),
+        patch("app.pipeline_cli.Database", return_value=mock_db),
+        patch("app.pipeline_cli.HttpClient", return_value=MagicMock(aclose=AsyncMock())),
+        patch("app.pipeline_cli.PostgresPipelineRepository"),
+        patch("app.pipeline_cli.RedditApiClient"),
+        patch("app.pipeline_cli.GeminiLlmClient"),
+        patch("app.pipeline_cli.RssFeedClient"),
+        patch("app.pipeline_cli.GoogleTrendsClient"),
+        patch("app.pipeline_cli.ProductHuntApiClient"),
+        patch("app.pipeline_cli.PipelineService", return_value=mock_service),
+    ):
+        exit_code = await main(
+            "backfill",
+            ["--since", "2026-09-01", "--until", "2026-10-01", "--subreddits", "saas, startups"],
+        )
+
+    assert exit_code == 0
+    mock_service.backfill.assert_awaited_once_with(
+        datetime(2026, 9, 1, tzinfo=UTC),
+        datetime(2026, 10, 1, tzinfo=UTC),
+        days=None,
+        subreddits=["saas", "startups"],
+        feeds=None,
+        concurrency=2,
+        batch_size=250,
+        max_pages=5,
+    )
+    mock_service.run.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_main_backfill_requires_a_start():
+    with pytest.raises(SystemExit):
+        await main("backfill", ["--until", "2026-10-01"])
+
+
+@pytest.mark.asyncio
+async def test_main_reprocess_replays_archive_through_selected_parsers(tmp_path):
+    from domain.pipeline.models import PipelineRunResult
+    from outbound.reddit.client import parse_archived
+
+    mock_service = AsyncMock()
+    mock_service.reprocess = AsyncMock(return_value=PipelineRunResult(posts_fetched=2))
+    mock_db = MagicMock()
+    mock_db.dispose = AsyncMock()
+    mock_archive = MagicMock()
+
+    settings = _settings(PIPELINE_ARCHIVE_DIR=str(tmp_path))
+    settings.PIPELINE_SUBREDDITS = "SaaS"
+    settings.PIPELINE_RSS_FEEDS = ""
+    settings.PIPELINE_APPSTORE_KEYWORDS = ""
+    settings.PIPELINE_BACKFILL_BATCH_SIZE = 250
+
+    with (
+        patch("app.pipeline_cli.get_settings", return_value=settings),
+        patch("app.pipeline_cli.Database", return_value=mock_db),
+        patch("app.pipeline_cli.HttpClient", return_value=MagicMock(aclose=AsyncMock())),
+        patch("app.pipeline_cli.JsonlArchive", return_value=mock_archive),
+        patch("app.pipeline_cli.PostgresPipelineRepository"),
+        patch("app.pipeline_cli.RedditApiClient"),
+        patch("app.pipeline_cli.GeminiLlmClient"),
+        patch("app.pipeline_cli.RssFeedClient"),
+        patch("app.pipeline_cli.GoogleTrendsClient"),
+        patch("app.pipeline_cli.ProductHuntApiClient"),
+        patch("app.pipeline_cli.PipelineService", return_value=mock_service),
+    ):
+        exit_code = await main(
+            "reprocess", ["--since", "2026-09-01", "--until", "2026-10-01", "--sources", "reddit"]
+        )
+
+    assert exit_code == 0
+    parsers, since, until = mock_archive.replay.call_args.args
+    assert parsers == {"reddit": parse_archived}
+    assert (str(since), str(until)) == ("2026-09-01", "2026-10-01")
+    assert mock_service.reprocess.await_args.kwargs == {"batch_size": 250}
+
+
+@pytest.mark.asyncio
+async def test_main_reprocess_requires_archive_dir():
+    with (
+        patch("app.pipeline_cli.get_settings", return_value=_settings()),
+        patch("app.pipeline_cli.Database") as mock_db_cls,
+    ):
+        exit_code = await main("reprocess", ["--days", "7"])
+
+    assert exit_code == 1
+    mock_db_cls.assert_not_called()
 
 
 @pytest.mark.asyncio